@@ -0,0 +1,79 @@
+"""Render time and output size of a line chart versus point count, with and without downsampling.
+
+Usage::
+
+    python benchmarks/downsample.py --points 10000 100000 500000 --method lttb
+
+Each row reports the best wall time over ``--repeat`` runs and the markup size
+for the full series and for the series downsampled to the canvas width.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from typing import Any
+
+from infogroove import Infogroove
+
+
+def build_template(method: str | None) -> dict[str, Any]:
+    points: dict[str, Any] = {
+        "items": "items",
+        "as": "p",
+        "x": "p.t / span * canvas.width",
+        "y": "canvas.height / 2 - p.value * 150",
+        "precision": 1,
+    }
+    if method is not None:
+        points["downsample"] = method
+    return {
+        "properties": {"canvas": {"width": 1280, "height": 400}},
+        "template": [
+            {
+                "type": "polyline",
+                "let": {"span": "items.length"},
+                "attributes": {"fill": "none", "stroke": "#0ea5e9", "points": points},
+            }
+        ],
+    }
+
+
+def measure(renderer: Any, data: Any, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(renderer.render(data))
+        best = min(best, time.perf_counter() - started)
+    return best, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--method", choices=["lttb", "minmax"], default="lttb")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    full = Infogroove(build_template(None))
+    reduced = Infogroove(build_template(args.method))
+    print(f"{'points':>10}{'full s':>10}{'full KiB':>11}{'reduced s':>12}{'reduced KiB':>13}")
+    for count in args.points:
+        data = {
+            "items": [
+                {"t": index, "value": math.sin(index / 500) + 0.1 * math.sin(index * 1.7)}
+                for index in range(count)
+            ]
+        }
+        full_time, full_size = measure(full, data, args.repeat)
+        reduced_time, reduced_size = measure(reduced, data, args.repeat)
+        print(
+            f"{count:>10}{full_time:>10.3f}{full_size / 1024:>11.1f}"
+            f"{reduced_time:>12.3f}{reduced_size / 1024:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
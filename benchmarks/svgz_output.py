@@ -0,0 +1,81 @@
+"""Compare streaming .svgz output against render() followed by a separate gzip step.
+
+Usage::
+
+    python benchmarks/svgz_output.py --items 20000 --level 6
+
+For each strategy the script reports the best wall time over ``--repeat`` runs,
+the compressed bytes written, and the peak traced Python allocation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from infogroove import Infogroove
+
+TEMPLATE = {
+    "properties": {"canvas": {"width": 1280, "height": 720}, "palette": ["#0ea5e9", "#f97316", "#22c55e"]},
+    "template": [
+        {
+            "type": "circle",
+            "repeat": {"items": "items", "as": "row"},
+            "attributes": {
+                "cx": "{640 + 460 * Math.cos(__index__ / 7)}",
+                "cy": "{360 + 300 * Math.sin(__index__ / 11)}",
+                "r": "{2 + row.value / 25}",
+                "fill": "{palette[__index__ % 3]}",
+            },
+        }
+    ],
+}
+
+
+def render_then_gzip(renderer: Any, data: Any, level: int) -> int:
+    markup = renderer.render(data)
+    return len(gzip.compress(markup.encode("utf-8"), compresslevel=level, mtime=0))
+
+
+def render_to_gzip(renderer: Any, data: Any, level: int) -> int:
+    sink = io.BytesIO()
+    renderer.render_to(data, sink, compress=True, compresslevel=level)
+    return sink.tell()
+
+
+def measure(strategy: Callable[..., int], *args: Any, repeat: int) -> tuple[float, int, int]:
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = strategy(*args)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    strategy(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, size, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--level", type=int, default=9)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    renderer = Infogroove(TEMPLATE)
+    data = {"items": [{"value": (index * 37) % 100} for index in range(args.items)]}
+
+    print(f"{'strategy':<20}{'best s':>10}{'bytes':>12}{'peak MiB':>12}")
+    for name, strategy in (("render + gzip", render_then_gzip), ("render_to(gzip)", render_to_gzip)):
+        elapsed, size, peak = measure(strategy, renderer, data, args.level, repeat=args.repeat)
+        print(f"{name:<20}{elapsed:>10.3f}{size:>12}{peak / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,23 @@ from __future__ import annotations
 from importlib import metadata
 from typing import Mapping, Sequence
 
+from .columns import Columns
 from .core import Infogroove
+from .hooks import HistogramRecorder, RenderHooks
 from .loader import load, load_path, loads
+from .profiling import RenderProfiler
 from .renderer import ElementRenderer, InfogrooveRenderer
+from .utils import NumberFormat
 
 __all__ = [
     "Infogroove",
     "InfogrooveRenderer",
     "ElementRenderer",
+    "Columns",
+    "NumberFormat",
+    "RenderProfiler",
+    "RenderHooks",
+    "HistogramRecorder",
     "load",
     "loads",
     "get_version",
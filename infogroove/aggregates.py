@@ -0,0 +1,207 @@
+"""Single-pass computation of template-level aggregate statistics."""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any, Callable
+
+from .exceptions import RenderError
+from .models import AggregateSpec
+from .utils import compile_path
+
+AGGREGATE_OPS = frozenset({"min", "max", "sum", "mean", "count", "percentile"})
+
+_MISSING = object()
+
+
+class _Accumulator(ABC):
+    """Running state for one aggregate (or one group of a grouped aggregate)."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def add(self, value: Any) -> None:
+        """Fold one value into the running state."""
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Return the aggregate of every value added so far."""
+
+
+class _Count(_Accumulator):
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        self.count += 1
+
+    def result(self) -> Any:
+        return self.count
+
+
+class _Sum(_Accumulator):
+    __slots__ = ("total", "count")
+
+    def __init__(self) -> None:
+        self.total: float = 0
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        self.total += value
+        self.count += 1
+
+    def result(self) -> Any:
+        return self.total
+
+
+class _Mean(_Sum):
+    __slots__ = ()
+
+    def result(self) -> Any:
+        return self.total / self.count if self.count else None
+
+
+class _Min(_Accumulator):
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: Any = None
+
+    def add(self, value: Any) -> None:
+        if self.value is None or value < self.value:
+            self.value = value
+
+    def result(self) -> Any:
+        return self.value
+
+
+class _Max(_Min):
+    __slots__ = ()
+
+    def add(self, value: Any) -> None:
+        if self.value is None or value > self.value:
+            self.value = value
+
+
+class _Percentile(_Accumulator):
+    __slots__ = ("values", "q")
+
+    def __init__(self, q: float | tuple[float, ...]) -> None:
+        self.values: list[float] = []
+        self.q = q
+
+    def add(self, value: Any) -> None:
+        self.values.append(value)
+
+    def result(self) -> Any:
+        ordered = sorted(self.values)
+        if isinstance(self.q, tuple):
+            return [percentile(ordered, q) for q in self.q]
+        return percentile(ordered, self.q)
+
+
+def percentile(ordered: Sequence[float], q: float) -> float | None:
+    """Return the ``q``-th percentile of sorted values using linear interpolation."""
+
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _new_accumulator(spec: AggregateSpec) -> _Accumulator:
+    if spec.op == "count":
+        return _Count()
+    if spec.op == "sum":
+        return _Sum()
+    if spec.op == "mean":
+        return _Mean()
+    if spec.op == "min":
+        return _Min()
+    if spec.op == "max":
+        return _Max()
+    if spec.op == "percentile":
+        return _Percentile(spec.q if spec.q is not None else 50)
+    raise ValueError(f"Unsupported aggregate operation '{spec.op}'")
+
+
+def _safe_getter(path: str | None) -> Callable[[Any], Any] | None:
+    if path is None:
+        return None
+    resolver = compile_path(path)
+
+    def getter(item: Any) -> Any:
+        try:
+            return resolver(item)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return _MISSING
+
+    return getter
+
+
+class _AggregatePlan:
+    __slots__ = ("name", "spec", "field", "group", "accumulator", "groups")
+
+    def __init__(self, name: str, spec: AggregateSpec) -> None:
+        self.name = name
+        self.spec = spec
+        self.field = _safe_getter(spec.field)
+        self.group = _safe_getter(spec.group_by)
+        self.accumulator = None if self.group else _new_accumulator(spec)
+        self.groups: dict[Any, _Accumulator] = {}
+
+    def add(self, item: Any) -> None:
+        if self.field is None:
+            value = item
+        else:
+            value = self.field(item)
+            if value is _MISSING or value is None:
+                return
+            if self.spec.op != "count" and (
+                isinstance(value, bool) or not isinstance(value, (int, float))
+            ):
+                return
+        if self.group is None:
+            self.accumulator.add(value)  # type: ignore[union-attr]
+            return
+        key = self.group(item)
+        if key is _MISSING:
+            return
+        try:
+            accumulator = self.groups.get(key)
+        except TypeError as exc:
+            raise RenderError(
+                f"Aggregate '{self.name}': groupBy '{self.spec.group_by}' resolved to an unhashable "
+                f"{type(key).__name__} value"
+            ) from exc
+        if accumulator is None:
+            accumulator = self.groups[key] = _new_accumulator(self.spec)
+        accumulator.add(value)
+
+    def result(self) -> Any:
+        if self.group is None:
+            return self.accumulator.result()  # type: ignore[union-attr]
+        return {key: accumulator.result() for key, accumulator in self.groups.items()}
+
+
+def compute_aggregates(specs: Mapping[str, AggregateSpec], items: Iterable[Any]) -> dict[str, Any]:
+    """Compute every aggregate in ``specs`` over ``items`` in a single pass.
+
+    Numeric operations skip items whose field is missing or not a number;
+    ``count`` with a ``field`` counts items where the field is present. Grouped
+    aggregates return a mapping of group key to result, in first-seen order.
+    """
+
+    plans = [_AggregatePlan(name, spec) for name, spec in specs.items()]
+    for item in items:
+        for plan in plans:
+            plan.add(item)
+    return {plan.name: plan.result() for plan in plans}
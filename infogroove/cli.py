@@ -3,36 +3,159 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import gzip
+import io
 import json
+import os
+import shutil
+import stat
 import sys
+import tempfile
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, BinaryIO, Iterator, Sequence
 
+from .datagen import write_data
 from .exceptions import DataValidationError, FormulaEvaluationError, RenderError, TemplateError
 from .loader import load_path
+from .optimize import DefsInterner, Instancer, Minifier, PathSimplifier
+from .profiling import RenderProfiler
+from .renderer import InfogrooveRenderer
+from .streaming import JSONArrayStream, iter_ndjson
+from .utils import NumberFormat
+
+_WRITE_BUFFER = 1 << 20
+_WRITE_CHUNK = 1 << 18
+_SPOOL_LIMIT = 1 << 23
+_DEFAULT_COMPRESSION_LEVEL = 9
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     """Entry point for the ``infogroove`` CLI."""
 
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    if arguments[:1] == ["gen-data"]:
+        return _gen_data_main(arguments[1:])
+
     parser = _build_parser()
-    args = parser.parse_args(argv)
+    args = parser.parse_args(arguments)
+    if args.ndjson and args.out_dir is None:
+        parser.error("--ndjson requires --out-dir")
+    if args.ndjson and args.stream:
+        parser.error("--stream cannot be combined with --ndjson")
 
     try:
         renderer = load_path(args.template)
-        data = _load_data(args.input)
-        if args.raw:
-            nodes = renderer.translate(data)
-            payload = json.dumps(nodes, ensure_ascii=False, indent=2)
-            _write_output(payload + "\n", args.output)
-        else:
-            svg_markup = renderer.render(data)
-            _write_output(svg_markup, args.output)
+        if args.profile or args.profile_output:
+            renderer.profiler = RenderProfiler()
+        if args.precision is not None:
+            renderer.number_format = NumberFormat(decimals=args.precision)
+        if args.cull is not None:
+            renderer.cull_margin = args.cull
+        minifier = Minifier() if args.minify else None
+        if minifier is not None:
+            renderer.passes = (*renderer.passes, minifier)
+        if args.symbols:
+            renderer.passes = (*renderer.passes, Instancer())
+        if args.dedupe_defs:
+            renderer.passes = (*renderer.passes, DefsInterner())
+        if args.simplify is not None:
+            renderer.passes = (*renderer.passes, PathSimplifier(tolerance=args.simplify))
+        if args.ndjson:
+            status = _render_ndjson(renderer, args)
+            _write_reports(renderer, args, minifier)
+            return status
+        data = _load_data(args.input, stream=args.stream)
+        compress = args.gzip or _is_compressed_path(args.output)
+        try:
+            if args.raw:
+                nodes = renderer.translate(data)
+                payload = json.dumps(nodes, ensure_ascii=False, indent=2)
+                _write_output(
+                    payload + "\n",
+                    args.output,
+                    compress=compress,
+                    level=args.compression_level,
+                )
+            else:
+                with _open_output(args.output, compress=compress, level=args.compression_level) as handle:
+                    renderer.render_to(data, handle)
+        finally:
+            if isinstance(data, JSONArrayStream):
+                data.close()
     except (TemplateError, DataValidationError, FormulaEvaluationError, RenderError) as exc:
         parser.exit(status=1, message=f"error: {exc}\n")
+    _write_reports(renderer, args, minifier)
     return 0
 
 
+def _write_reports(
+    renderer: InfogrooveRenderer,
+    args: argparse.Namespace,
+    minifier: Minifier | None = None,
+) -> None:
+    """Emit the optional profiling, fallback, and minification reports requested on the command line."""
+
+    if minifier is not None:
+        stats = minifier.stats
+        sys.stderr.write(
+            f"minify: saved ~{stats.bytes_saved} bytes "
+            f"({stats.attributes_removed} attributes removed, {stats.attributes_hoisted} hoisted, "
+            f"{stats.colours_shortened} colours shortened, {stats.groups_created} groups added)\n"
+        )
+    if renderer.profiler is not None:
+        _write_profile(renderer.profiler, args.profile_output)
+    if args.fallback_report:
+        sys.stderr.write(renderer.expression_stats.format_fallback_report())
+
+
+def _render_ndjson(renderer: InfogrooveRenderer, args: argparse.Namespace) -> int:
+    """Render one output file per NDJSON line, reporting failures per line.
+
+    Outputs are named after the 1-based input line number (``000001.svg``) so
+    they sort in input order. Returns ``1`` when any line failed.
+    """
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    suffix = ".json" if args.raw else ".svg"
+    if args.gzip:
+        suffix = ".json.gz" if args.raw else ".svgz"
+    failures = 0
+    if args.input == "-":
+        handle = sys.stdin
+    else:
+        try:
+            handle = Path(args.input).open(encoding="utf-8")
+        except OSError as exc:
+            raise DataValidationError(f"Unable to read input data '{args.input}'") from exc
+    try:
+        for line_number, payload in iter_ndjson(handle):
+            try:
+                if isinstance(payload, DataValidationError):
+                    raise payload
+                data = _coerce_payload(payload)
+                if args.raw:
+                    markup = json.dumps(renderer.translate(data), ensure_ascii=False, indent=2) + "\n"
+                else:
+                    markup = renderer.render(data)
+            except (DataValidationError, FormulaEvaluationError, RenderError) as exc:
+                failures += 1
+                sys.stderr.write(f"error: line {line_number}: {exc}\n")
+                continue
+            _write_output(
+                markup,
+                str(out_dir / f"{line_number:06d}{suffix}"),
+                compress=args.gzip,
+                level=args.compression_level,
+            )
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    return 1 if failures else 0
+
+
 def _build_parser() -> argparse.ArgumentParser:
     """Create the argument parser used by the CLI entry point."""
 
@@ -43,7 +166,12 @@ def _build_parser() -> argparse.ArgumentParser:
         required=True,
         help="Path to the template definition JSON file (e.g. def.json)",
     )
-    parser.add_argument("-i", "--input", required=True, help="Path to the JSON data file")
+    parser.add_argument(
+        "-i",
+        "--input",
+        required=True,
+        help="Path to the JSON data file or '-' to read from stdin",
+    )
     parser.add_argument(
         "-o",
         "--output",
@@ -55,21 +183,174 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Write the translated node specification as JSON instead of SVG markup",
     )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        default=None,
+        metavar="DECIMALS",
+        help="Round computed floats to this many decimal places and trim trailing zeros",
+    )
+    parser.add_argument(
+        "--cull",
+        type=float,
+        nargs="?",
+        const=0.0,
+        default=None,
+        metavar="MARGIN",
+        help="Drop rect/circle/ellipse/line elements lying entirely outside the canvas "
+        "(extended by MARGIN pixels, default 0)",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Drop default attributes, hoist shared attributes onto existing groups, and shorten colours; "
+        "report the estimated savings on stderr",
+    )
+    parser.add_argument(
+        "--symbols",
+        action="store_true",
+        help="Emit repeated identical subtrees once as <symbol> definitions referenced by <use>",
+    )
+    parser.add_argument(
+        "--dedupe-defs",
+        action="store_true",
+        help="Keep one copy of each distinct gradient/clip path in a top-level <defs> and rewrite url(#id) references",
+    )
+    parser.add_argument(
+        "--simplify",
+        type=float,
+        default=None,
+        metavar="PIXELS",
+        help="Simplify straight-segment paths, polylines, and polygons to this tolerance and emit "
+        "relative path commands",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip-compress the output while writing it (implied for .svgz/.gz output paths)",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(1, 10),
+        default=_DEFAULT_COMPRESSION_LEVEL,
+        metavar="{1..9}",
+        help="Gzip compression level for compressed output (default: 9)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Memory-map the input and decode items on demand instead of loading the whole file",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Treat the input as newline-delimited JSON and render one file per line into --out-dir",
+    )
+    parser.add_argument(
+        "--out-dir",
+        default=None,
+        help="Directory receiving one output file per input line in --ndjson mode",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-element, per-binding, and per-placeholder timings to stderr",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Write the profiling report as JSON to this path (implies --profile)",
+    )
+    parser.add_argument(
+        "--fallback-report",
+        action="store_true",
+        help="Print expressions that sympy could not evaluate and fell back to the AST evaluator",
+    )
     return parser
 
 
-def _load_data(path: str) -> list[dict[str, Any]]:
-    """Load and validate the JSON payload driving the infographic."""
+def _gen_data_main(argv: Sequence[str]) -> int:
+    """Generate a synthetic dataset that satisfies the template schema."""
+
+    parser = _build_gen_data_parser()
+    args = parser.parse_args(argv)
 
-    data_path = Path(path)
     try:
-        raw = data_path.read_text(encoding="utf-8")
-    except OSError as exc:  # pragma: no cover - filesystem dependent
-        raise DataValidationError(f"Unable to read input data '{data_path}'") from exc
+        renderer = load_path(args.template)
+        schema = renderer.template.schema
+        if schema is None:
+            raise TemplateError(f"Template '{args.template}' does not declare a schema")
+        if args.output == "-":
+            write_data(schema, sys.stdout, items=args.items, seed=args.seed)
+        else:
+            with Path(args.output).open("w", encoding="utf-8") as handle:
+                write_data(schema, handle, items=args.items, seed=args.seed)
+    except (TemplateError, ValueError) as exc:
+        parser.exit(status=1, message=f"error: {exc}\n")
+    return 0
+
+
+def _build_gen_data_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the ``gen-data`` subcommand."""
+
+    parser = argparse.ArgumentParser(
+        prog="infogroove gen-data",
+        description="Generate deterministic synthetic data from a template schema",
+    )
+    parser.add_argument(
+        "-f",
+        "--template",
+        required=True,
+        help="Path to the template definition JSON file (e.g. def.json)",
+    )
+    parser.add_argument(
+        "-n",
+        "--items",
+        type=int,
+        default=None,
+        help="Number of entries to generate for the primary collection",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="Destination JSON file path or '-' for stdout (default: -)",
+    )
+    return parser
+
+
+def _load_data(path: str, *, stream: bool = False) -> Sequence[dict[str, Any]]:
+    """Load and validate the JSON payload driving the infographic.
+
+    With ``stream`` the file is memory-mapped and only indexed up front; items
+    are decoded one at a time as the renderer consumes them.
+    """
+
+    if path == "-":
+        if stream:
+            raise DataValidationError("Standard input cannot be memory-mapped; drop --stream")
+        source = getattr(sys.stdin, "buffer", sys.stdin)
+        raw: str | bytes = source.read()
+    else:
+        data_path = Path(path)
+        if stream:
+            return JSONArrayStream(data_path)
+        try:
+            raw = data_path.read_bytes()
+        except OSError as exc:  # pragma: no cover - filesystem dependent
+            raise DataValidationError(f"Unable to read input data '{data_path}'") from exc
     try:
         payload = json.loads(raw)
     except json.JSONDecodeError as exc:
         raise DataValidationError("Input data file is not valid JSON") from exc
+    return _coerce_payload(payload)
+
+
+def _coerce_payload(payload: Any) -> list[dict[str, Any]]:
+    """Check a decoded payload and return its list of item objects."""
+
     if isinstance(payload, list):
         if not all(isinstance(item, dict) for item in payload):
             raise DataValidationError("Each element in the data array must be an object")
@@ -81,14 +362,131 @@ def _load_data(path: str) -> list[dict[str, Any]]:
     raise DataValidationError("Input data must be a JSON array of objects or contain an 'items' array")
 
 
-def _write_output(markup: str, destination: str) -> None:
-    """Persist the generated SVG either to disk or stdout."""
+def _write_profile(profiler: RenderProfiler, destination: str | None) -> None:
+    """Emit the profiling report as a table on stderr or as JSON on disk."""
+
+    if destination is None:
+        sys.stderr.write(profiler.format_report())
+        return
+    with Path(destination).open("w", encoding="utf-8") as handle:
+        profiler.write_json(handle)
+
+
+def _write_output(
+    markup: str,
+    destination: str,
+    *,
+    compress: bool = False,
+    level: int = _DEFAULT_COMPRESSION_LEVEL,
+) -> None:
+    """Persist the generated SVG either to disk or stdout.
+
+    The markup is encoded in bounded chunks into a buffered binary writer, so
+    no full-size UTF-8 copy of the document is created. With ``compress`` the
+    bytes are gzip-compressed on the way out.
+    """
+
+    with _open_output(destination, compress=compress, level=level) as handle:
+        for start in range(0, len(markup), _WRITE_CHUNK):
+            handle.write(markup[start : start + _WRITE_CHUNK].encode("utf-8"))
+
+
+def _is_compressed_path(destination: str) -> bool:
+    return destination != "-" and Path(destination).suffix.lower() in {".svgz", ".gz"}
+
+
+@contextmanager
+def _open_output(
+    destination: str,
+    *,
+    compress: bool = False,
+    level: int = _DEFAULT_COMPRESSION_LEVEL,
+) -> Iterator[BinaryIO]:
+    """Open ``destination`` (or stdout for ``-``) as a buffered binary stream.
+
+    Output is published only when the block completes. Files are written to a
+    temporary sibling that replaces ``destination`` on success; stdout output
+    is spooled (in memory, then on disk past 8 MiB) and copied out afterwards.
+    A render that fails midway therefore leaves an existing file untouched and
+    prints no partial markup.
+    """
 
     if destination == "-":
-        sys.stdout.write(markup)
+        sys.stdout.flush()
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None and compress:
+            raise RenderError("Compressed output needs a binary stdout; write it to a file with -o instead")
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_LIMIT) as staged:
+            with _encode_output(staged, compress=compress, level=level) as handle:  # type: ignore[arg-type]
+                yield handle
+            staged.seek(0)
+            # Closing the sink only flushes its decoder; stdout itself stays open.
+            target: BinaryIO = buffer or _TextSink(sys.stdout)
+            shutil.copyfileobj(staged, target, _WRITE_CHUNK)
+            target.flush()
+            if buffer is None:
+                target.close()
         return
-    output_path = Path(destination)
-    output_path.write_text(markup, encoding="utf-8")
+
+    path = Path(destination)
+    descriptor, staged_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(descriptor, "wb", buffering=_WRITE_BUFFER) as raw:
+            with _encode_output(raw, compress=compress, level=level) as handle:
+                yield handle
+        os.chmod(staged_name, _output_mode(path))
+        os.replace(staged_name, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(staged_name)
+        raise
+
+
+@contextmanager
+def _encode_output(raw: BinaryIO, *, compress: bool, level: int) -> Iterator[BinaryIO]:
+    """Yield ``raw``, or a gzip writer over it when ``compress`` is set."""
+
+    if compress:
+        with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=level, mtime=0) as compressed:
+            yield compressed  # type: ignore[misc]
+    else:
+        yield raw
+
+
+def _output_mode(path: Path) -> int:
+    """Return the permissions a replaced output file should carry.
+
+    Existing files keep their mode; new files get the usual ``0o666`` minus
+    the process umask instead of the private mode of the temporary file.
+    """
+
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class _TextSink(io.RawIOBase):
+    """Binary adapter for text-only stdout replacements (used when ``sys.stdout`` has no buffer)."""
+
+    def __init__(self, target: Any) -> None:
+        self._target = target
+        # Chunks may end inside a multi-byte character, so decode incrementally.
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._target.write(self._decoder.decode(bytes(data)))
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._target.write(self._decoder.decode(b"", final=True))
+        super().close()
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI entry
@@ -0,0 +1,95 @@
+"""Columnar data input exposed to templates as a sequence of lightweight row views."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+_PLAIN_SCALARS = (str, int, float, bool, type(None))
+
+
+class Columns(Sequence[Mapping[str, Any]]):
+    """Sequence of rows backed by parallel, equal-length columns.
+
+    Columns may be lists, tuples, ``array.array`` instances, NumPy arrays, or
+    any other sized sequence. Rows are produced on demand as :class:`RowView`
+    objects, so no per-row dictionaries are allocated; ``row.field`` resolves
+    to ``columns[field][index]``. NumPy scalars are converted to their Python
+    equivalents on access.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        lengths = {name: len(column) for name, column in columns.items()}
+        if len(set(lengths.values())) > 1:
+            detail = ", ".join(f"{name}={length}" for name, length in lengths.items())
+            raise ValueError(f"Columns must all have the same length ({detail})")
+        self._columns = dict(columns)
+        self._length = next(iter(lengths.values()), 0)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Column names in declaration order."""
+
+        return tuple(self._columns)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Return the raw column stored under ``name``."""
+
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> RowView:  # type: ignore[override]
+        if isinstance(index, slice):
+            raise TypeError("Columns do not support slicing; select rows with repeat clauses")
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return RowView(self._columns, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        columns = self._columns
+        for index in range(self._length):
+            yield RowView(columns, index)
+
+    def __repr__(self) -> str:
+        return f"Columns(names={self.names!r}, rows={self._length})"
+
+
+class RowView(Mapping[str, Any]):
+    """Read-only mapping over one row of a :class:`Columns` collection."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]], index: int) -> None:
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        return to_python(self._columns[key][self._index])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(self)!r})"
+
+
+def to_python(value: Any) -> Any:
+    """Convert NumPy-style scalars (anything with ``dtype`` and ``item()``) to Python values."""
+
+    if isinstance(value, _PLAIN_SCALARS):
+        return value
+    if hasattr(value, "dtype") and callable(getattr(value, "item", None)):
+        return value.item()
+    return value
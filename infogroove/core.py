@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
-from .loader import _parse_template
+from .hooks import RenderHooks
+from .loader import _create_renderer, _parse_template
 from .models import TemplateSpec
 from .renderer import ElementRenderer, InfogrooveRenderer
 
@@ -18,10 +19,14 @@ class Infogroove:
         template: TemplateSpec | Mapping[str, Any],
         *,
         renderers: Mapping[str, ElementRenderer] | None = None,
+        hooks: Sequence[RenderHooks] | None = None,
     ) -> InfogrooveRenderer:
         if isinstance(template, TemplateSpec):
-            return InfogrooveRenderer(template, renderers=renderers)
+            return InfogrooveRenderer(template, renderers=renderers, hooks=hooks)
         if isinstance(template, Mapping):
-            spec = _parse_template(Path("<inline>"), template)
-            return InfogrooveRenderer(spec, renderers=renderers)
+            return _create_renderer(
+                lambda: _parse_template(Path("<inline>"), template),
+                renderers,
+                hooks,
+            )
         raise TypeError("Infogroove expects a TemplateSpec or mapping definition")
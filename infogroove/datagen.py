@@ -0,0 +1,360 @@
+"""Generate deterministic synthetic payloads from template JSON Schemas."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import math
+import random
+import uuid
+from collections.abc import Callable, Mapping, Sequence
+from typing import IO, Any, Iterator
+
+from .exceptions import TemplateError
+from .utils import derive_schema_item_bounds
+
+_DEFAULT_ITEM_COUNT = 10
+_DEFAULT_NESTED_ITEMS = 3
+_DEFAULT_NUMBER_RANGE = (0.0, 100.0)
+_COLLECTION_KEYS = ("items", "data", "values")
+_ATTEMPTS = 100
+_EPOCH = datetime.date(2024, 1, 1)
+_WORDS = (
+    "alpha",
+    "bravo",
+    "charlie",
+    "delta",
+    "echo",
+    "foxtrot",
+    "golf",
+    "hotel",
+    "india",
+    "juliet",
+    "kilo",
+    "lima",
+)
+
+
+def generate_data(
+    schema: Mapping[str, Any],
+    *,
+    items: int | None = None,
+    seed: int = 0,
+) -> Any:
+    """Return a complete in-memory payload that satisfies ``schema``."""
+
+    collection_key = find_collection_key(schema)
+    if collection_key is None and not _is_array_schema(schema):
+        return _SchemaGenerator(schema, seed).value(schema, "root")
+    entries = list(iter_items(schema, items=items, seed=seed))
+    if collection_key is None:
+        return entries
+    payload = _SchemaGenerator(schema, seed).object_fields(schema, skip=collection_key)
+    payload[collection_key] = entries
+    return payload
+
+
+def iter_items(
+    schema: Mapping[str, Any],
+    *,
+    items: int | None = None,
+    seed: int = 0,
+) -> Iterator[Any]:
+    """Yield generated entries for the template's primary collection one at a time."""
+
+    generator = _SchemaGenerator(schema, seed)
+    collection = _collection_schema(schema)
+    item_schema = collection.get("items", {})
+    if not isinstance(item_schema, Mapping):
+        item_schema = {}
+    count = resolve_item_count(schema, items)
+    seen: set[str] | None = set() if collection.get("uniqueItems") else None
+    for _ in range(count):
+        yield generator.item(item_schema, "item", seen)
+
+
+def write_data(
+    schema: Mapping[str, Any],
+    handle: IO[str],
+    *,
+    items: int | None = None,
+    seed: int = 0,
+) -> int:
+    """Stream a generated payload to ``handle`` as JSON and return the item count."""
+
+    count = resolve_item_count(schema, items)
+    collection_key = find_collection_key(schema)
+    if collection_key is None and not _is_array_schema(schema):
+        json.dump(generate_data(schema, seed=seed), handle, ensure_ascii=False)
+        handle.write("\n")
+        return 0
+
+    if collection_key is not None:
+        generator = _SchemaGenerator(schema, seed)
+        handle.write("{")
+        for key, value in generator.object_fields(schema, skip=collection_key).items():
+            handle.write(f"{json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}, ")
+        handle.write(f"{json.dumps(collection_key)}: ")
+
+    handle.write("[")
+    for index, entry in enumerate(iter_items(schema, items=count, seed=seed)):
+        handle.write(",\n" if index else "\n")
+        handle.write(json.dumps(entry, ensure_ascii=False))
+    handle.write("\n]" if count else "]")
+    if collection_key is not None:
+        handle.write("}")
+    handle.write("\n")
+    return count
+
+
+def find_collection_key(schema: Mapping[str, Any]) -> str | None:
+    """Return the object property holding the primary collection, if any."""
+
+    if schema.get("type") != "object":
+        return None
+    properties = schema.get("properties")
+    if not isinstance(properties, Mapping):
+        return None
+    for key in (*_COLLECTION_KEYS, *properties):
+        candidate = properties.get(key)
+        if isinstance(candidate, Mapping) and _is_array_schema(candidate):
+            return key
+    return None
+
+
+def resolve_item_count(schema: Mapping[str, Any], requested: int | None) -> int:
+    """Validate ``requested`` against the schema bounds or derive a default count."""
+
+    minimum, maximum = derive_schema_item_bounds(schema)
+    if requested is None:
+        if maximum is not None:
+            return min(maximum, max(minimum or 0, _DEFAULT_ITEM_COUNT))
+        return max(minimum or 0, _DEFAULT_ITEM_COUNT)
+    if requested < 0:
+        raise ValueError("Item count must not be negative")
+    if minimum is not None and requested < minimum:
+        raise TemplateError(f"Template requires at least {minimum} items (requested {requested})")
+    if maximum is not None and requested > maximum:
+        raise TemplateError(f"Template accepts at most {maximum} items (requested {requested})")
+    return requested
+
+
+def _collection_schema(schema: Mapping[str, Any]) -> Mapping[str, Any]:
+    collection_key = find_collection_key(schema)
+    if collection_key is not None:
+        return schema["properties"][collection_key]
+    if _is_array_schema(schema):
+        return schema
+    raise TemplateError("Template schema does not describe an array collection")
+
+
+def _is_array_schema(schema: Mapping[str, Any]) -> bool:
+    type_decl = schema.get("type")
+    if isinstance(type_decl, str):
+        return type_decl == "array"
+    if isinstance(type_decl, Sequence):
+        return "array" in type_decl
+    return "items" in schema or "minItems" in schema or "maxItems" in schema
+
+
+class _SchemaGenerator:
+    """Produce values for individual schema nodes from a seeded RNG."""
+
+    def __init__(self, root: Mapping[str, Any], seed: int) -> None:
+        self._root = root
+        self._rng = random.Random(seed)
+        self._serial = 0
+
+    def value(self, schema: Mapping[str, Any], name: str) -> Any:
+        schema = self._resolve(schema)
+        if "const" in schema:
+            return schema["const"]
+        enum = schema.get("enum")
+        if isinstance(enum, Sequence) and not isinstance(enum, str) and enum:
+            return self._rng.choice(list(enum))
+        for combinator in ("oneOf", "anyOf"):
+            options = schema.get(combinator)
+            if isinstance(options, Sequence) and options:
+                return self.value(options[0], name)
+
+        type_name = self._type_name(schema)
+        if type_name == "object":
+            return self.object_fields(schema)
+        if type_name == "array":
+            return self._array(schema, name)
+        if type_name == "integer":
+            low, high = self._numeric_bounds(schema, integer=True)
+            if "multipleOf" in schema:
+                return int(self._multiple(schema["multipleOf"], low, high, name))
+            return self._rng.randint(math.ceil(low), max(math.ceil(low), math.floor(high)))
+        if type_name == "number":
+            low, high = self._numeric_bounds(schema, integer=False)
+            if "multipleOf" in schema:
+                return self._multiple(schema["multipleOf"], low, high, name)
+            value = self._rng.uniform(low, high)
+            rounded = round(value, 2)
+            return rounded if low <= rounded <= high else value
+        if type_name == "boolean":
+            return self._rng.random() < 0.5
+        if type_name == "null":
+            return None
+        return self._string(schema, name)
+
+    def object_fields(self, schema: Mapping[str, Any], *, skip: str | None = None) -> dict[str, Any]:
+        schema = self._resolve(schema)
+        properties = schema.get("properties")
+        if not isinstance(properties, Mapping):
+            return {}
+        return {
+            key: self.value(sub_schema, key)
+            for key, sub_schema in properties.items()
+            if key != skip and isinstance(sub_schema, Mapping)
+        }
+
+    def item(self, schema: Mapping[str, Any], name: str, seen: set[str] | None) -> Any:
+        """Return a value for ``schema``, distinct from ``seen`` when a set is given."""
+
+        if seen is None:
+            return self.value(schema, name)
+        for _ in range(_ATTEMPTS):
+            value = self.value(schema, name)
+            key = json.dumps(value, sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                return value
+        raise TemplateError(f"Unable to generate distinct items for '{name}' (uniqueItems)")
+
+    def _array(self, schema: Mapping[str, Any], name: str) -> list[Any]:
+        minimum = schema.get("minItems", 0)
+        maximum = schema.get("maxItems")
+        count = max(minimum, _DEFAULT_NESTED_ITEMS)
+        if maximum is not None:
+            count = min(count, maximum)
+        item_schema = schema.get("items", {})
+        if not isinstance(item_schema, Mapping):
+            item_schema = {}
+        seen: set[str] | None = set() if schema.get("uniqueItems") else None
+        return [self.item(item_schema, name, seen) for _ in range(count)]
+
+    def _string(self, schema: Mapping[str, Any], name: str) -> str:
+        if "pattern" in schema:
+            raise TemplateError(
+                f"gen-data does not support the 'pattern' keyword (at '{name}'); declare 'enum' or 'const' instead"
+            )
+        self._serial += 1
+        word = _WORDS[self._rng.randrange(len(_WORDS))]
+        min_length = schema.get("minLength", 0)
+        max_length = schema.get("maxLength")
+        string_format = schema.get("format")
+        if string_format is not None:
+            produce = self._FORMATS.get(string_format)
+            if produce is None:
+                raise TemplateError(
+                    f"gen-data does not support the 'format' keyword value '{string_format}' (at '{name}')"
+                )
+            text = produce(self, word)
+            if len(text) < min_length or (max_length is not None and len(text) > max_length):
+                raise TemplateError(f"Generated '{string_format}' values for '{name}' do not fit the length limits")
+            return text
+        text = f"{name} {word} {self._serial}"
+        if len(text) < min_length:
+            text = text.ljust(min_length, "x")
+        if max_length is not None:
+            text = text[:max_length]
+        return text
+
+    def _date(self, _: str) -> str:
+        return (_EPOCH + datetime.timedelta(days=self._rng.randrange(3650))).isoformat()
+
+    def _time(self, _: str) -> str:
+        seconds = self._rng.randrange(86_400)
+        return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}Z"
+
+    _FORMATS: dict[str, Callable[[_SchemaGenerator, str], str]] = {
+        "date": _date,
+        "time": _time,
+        "date-time": lambda self, word: f"{self._date(word)}T{self._time(word)}",
+        "email": lambda self, word: f"{word}{self._serial}@example.com",
+        "hostname": lambda self, word: f"{word}{self._serial}.example.com",
+        "uri": lambda self, word: f"https://example.com/{word}/{self._serial}",
+        "uuid": lambda self, _: str(uuid.UUID(int=self._rng.getrandbits(128), version=4)),
+        "ipv4": lambda self, _: "10." + ".".join(str(self._rng.randrange(256)) for _ in range(3)),
+    }
+
+    def _multiple(self, step: Any, low: float, high: float, name: str) -> int | float:
+        """Return a multiple of ``step`` within ``[low, high]``."""
+
+        if isinstance(step, bool) or not isinstance(step, (int, float)) or step <= 0:
+            raise TemplateError(f"Schema 'multipleOf' for '{name}' must be a positive number")
+        first, last = math.ceil(low / step), math.floor(high / step)
+        if first > last:
+            raise TemplateError(f"No multiple of {step} lies within the bounds of '{name}'")
+        if isinstance(step, int):
+            return self._rng.randint(first, last) * step
+        # Float products such as 3 * 0.1 may not divide back evenly; retry until one does.
+        for _ in range(_ATTEMPTS):
+            factor = self._rng.randint(first, last)
+            for candidate in (factor * step, round(factor * step, 10)):
+                if low <= candidate <= high and (candidate / step).is_integer():
+                    return candidate
+        raise TemplateError(f"Unable to generate a multiple of {step} for '{name}'")
+
+    def _numeric_bounds(self, schema: Mapping[str, Any], *, integer: bool) -> tuple[float, float]:
+        low, high = _DEFAULT_NUMBER_RANGE
+        if "minimum" in schema:
+            low = float(schema["minimum"])
+        if "exclusiveMinimum" in schema:
+            bound = float(schema["exclusiveMinimum"])
+            low = math.floor(bound) + 1 if integer else math.nextafter(bound, math.inf)
+        if "maximum" in schema:
+            high = float(schema["maximum"])
+        if "exclusiveMaximum" in schema:
+            bound = float(schema["exclusiveMaximum"])
+            high = math.ceil(bound) - 1 if integer else math.nextafter(bound, -math.inf)
+        if "maximum" not in schema and "exclusiveMaximum" not in schema and high < low:
+            high = low + _DEFAULT_NUMBER_RANGE[1]
+        if "minimum" not in schema and "exclusiveMinimum" not in schema and low > high:
+            low = high - _DEFAULT_NUMBER_RANGE[1]
+        return low, max(low, high)
+
+    @staticmethod
+    def _type_name(schema: Mapping[str, Any]) -> str:
+        type_decl = schema.get("type")
+        if isinstance(type_decl, Sequence) and not isinstance(type_decl, str):
+            candidates = [item for item in type_decl if item != "null"]
+            type_decl = candidates[0] if candidates else "null"
+        if isinstance(type_decl, str):
+            return type_decl
+        if "properties" in schema:
+            return "object"
+        if "items" in schema:
+            return "array"
+        return "string"
+
+    def _resolve(self, schema: Mapping[str, Any]) -> Mapping[str, Any]:
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            if not ref.startswith("#/"):
+                raise TemplateError(f"Unsupported schema reference '{ref}'")
+            target: Any = self._root
+            try:
+                for part in ref[2:].split("/"):
+                    target = target[part.replace("~1", "/").replace("~0", "~")]
+            except (KeyError, TypeError) as exc:
+                raise TemplateError(f"Unresolved schema reference '{ref}'") from exc
+            if not isinstance(target, Mapping):
+                raise TemplateError(f"Schema reference '{ref}' does not point to a schema")
+            return self._resolve(target)
+        merged = schema.get("allOf")
+        if isinstance(merged, Sequence) and merged:
+            combined: dict[str, Any] = {key: value for key, value in schema.items() if key != "allOf"}
+            for part in merged:
+                for key, value in self._resolve(part).items():
+                    if key == "properties" and isinstance(combined.get(key), Mapping):
+                        combined[key] = {**combined[key], **value}
+                    elif key == "required":
+                        combined[key] = [*combined.get(key, []), *value]
+                    else:
+                        combined.setdefault(key, value)
+            return combined
+        return schema
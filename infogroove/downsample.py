@@ -0,0 +1,123 @@
+"""Series downsampling that keeps the visual shape of long point sequences."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from .exceptions import RenderError
+from .models import DownsampleSpec
+from .utils import compile_path
+
+DownsampleMethod = Callable[[Sequence[float], Sequence[float], int], list[int]]
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], target: int) -> list[int]:
+    """Select ``target`` indices with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are
+    split into ``target - 2`` equal-count buckets, and each bucket contributes
+    the point forming the largest triangle with the previously selected point
+    and the average of the next bucket. Sequences no longer than ``target``
+    are returned unchanged.
+    """
+
+    length = len(xs)
+    if target >= length or length <= 2:
+        return list(range(length))
+    if target < 3:
+        return [0, length - 1][:target]
+
+    selected = [0]
+    bucket_size = (length - 2) / (target - 2)
+    previous = 0
+    for bucket in range(target - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        if next_start >= next_end:
+            next_start, next_end = length - 1, length
+        count = next_end - next_start
+        average_x = sum(xs[next_start:next_end]) / count
+        average_y = sum(ys[next_start:next_end]) / count
+
+        anchor_x = xs[previous]
+        anchor_y = ys[previous]
+        delta_x = anchor_x - average_x
+        delta_y = average_y - anchor_y
+        best = start
+        best_area = -1.0
+        for index in range(start, end):
+            # Twice the triangle area; the constant factor does not change the winner.
+            area = abs(delta_x * (ys[index] - anchor_y) + (xs[index] - anchor_x) * delta_y)
+            if area > best_area:
+                best_area = area
+                best = index
+        selected.append(best)
+        previous = best
+    selected.append(length - 1)
+    return selected
+
+
+def minmax_indices(xs: Sequence[float], ys: Sequence[float], target: int) -> list[int]:
+    """Select the minimum and maximum of each of ``target // 2`` equal-count buckets.
+
+    Every bucket keeps its extremes in their original order, so the vertical
+    envelope of the series is preserved exactly at bucket resolution. The
+    first and last points are always kept.
+    """
+
+    length = len(ys)
+    if target >= length or length <= 2:
+        return list(range(length))
+    buckets = max(target // 2, 1)
+    bucket_size = length / buckets
+    selected: list[int] = []
+    for bucket in range(buckets):
+        start = int(bucket * bucket_size)
+        end = min(int((bucket + 1) * bucket_size), length)
+        if start >= end:
+            continue
+        window = range(start, end)
+        low = min(window, key=ys.__getitem__)
+        high = max(window, key=ys.__getitem__)
+        selected.extend(sorted({low, high}))
+    if selected[0] != 0:
+        selected.insert(0, 0)
+    if selected[-1] != length - 1:
+        selected.append(length - 1)
+    return selected
+
+
+DOWNSAMPLE_METHODS: dict[str, DownsampleMethod] = {
+    "lttb": lttb_indices,
+    "minmax": minmax_indices,
+}
+
+
+def downsample_items(items: Sequence[Any], spec: DownsampleSpec, target: int) -> list[Any]:
+    """Return the items selected by ``spec`` in their original order.
+
+    ``spec.y`` (and ``spec.x`` when given, otherwise the item position) are
+    paths resolved on every item; both must be numeric. Without ``spec.y`` the
+    items themselves must be numbers.
+    """
+
+    if len(items) <= target:
+        return list(items)
+    ys = _numeric_column(items, spec.y)
+    xs: Sequence[float] = _numeric_column(items, spec.x) if spec.x else range(len(items))
+    return [items[index] for index in DOWNSAMPLE_METHODS[spec.method](xs, ys, target)]
+
+
+def _numeric_column(items: Sequence[Any], path: str | None) -> list[float]:
+    resolver = compile_path(path or "")
+    try:
+        return [float(resolver(item)) for item in items]
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        if path is None:
+            raise RenderError(
+                "Downsampling without 'y' needs numeric items; set 'y' to the item path holding the value"
+            ) from exc
+        raise RenderError(f"Downsampling needs a numeric value at '{path}' for every item") from exc
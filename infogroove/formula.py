@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import ast
+import math
 import re
 from collections import ChainMap
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
+from time import perf_counter
 from typing import Any
 
 import sympy
@@ -24,6 +26,12 @@ from .utils import (
 )
 
 _EXPRESSION_CACHE_SIZE = 1024
+_EXPRESSION_STATS_SIZE = 4096
+
+_MATH_ROOTS = frozenset({"math", "Math"})
+
+SYMPY_BACKEND = "sympy"
+AST_BACKEND = "ast"
 
 
 @dataclass(frozen=True)
@@ -40,6 +48,124 @@ class _AstPlan:
     identifier_tokens: tuple[str, ...]
 
 
+@dataclass(slots=True)
+class ExpressionStats:
+    """Backend usage counters for a single expression.
+
+    Once sympy fails for an expression and the AST fallback succeeds, the
+    expression is routed straight to the AST evaluator on later calls, so
+    ``sympy_misses`` stops growing while ``routed`` counts the skipped
+    sympify attempts.
+    """
+
+    expression: str
+    sympy_hits: int = 0
+    sympy_misses: int = 0
+    ast_hits: int = 0
+    routed: int = 0
+    sympy_miss_seconds: float = 0.0
+    preferred: str | None = None
+
+    @property
+    def fallbacks(self) -> int:
+        """Number of evaluations answered by the AST evaluator."""
+
+        return self.ast_hits
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the counters."""
+
+        return {
+            "expression": self.expression,
+            "sympy_hits": self.sympy_hits,
+            "sympy_misses": self.sympy_misses,
+            "ast_hits": self.ast_hits,
+            "routed": self.routed,
+            "sympy_miss_seconds": self.sympy_miss_seconds,
+            "preferred": self.preferred,
+        }
+
+
+class ExpressionStatsTable:
+    """Backend counters and routing preferences for the expressions one owner evaluates.
+
+    Every :class:`~infogroove.renderer.InfogrooveRenderer` owns a table, so the
+    backend an expression is routed to depends only on what that renderer has
+    evaluated, never on unrelated renders in the same process. Module-level
+    helpers such as :func:`evaluate_expression` share a default table.
+    """
+
+    __slots__ = ("_entries", "_size")
+
+    def __init__(self, size: int = _EXPRESSION_STATS_SIZE) -> None:
+        self._entries: dict[str, ExpressionStats] = {}
+        self._size = size
+
+    def entry(self, expression: str) -> ExpressionStats:
+        """Return the counters for ``expression``, creating them on first use."""
+
+        stats = self._entries.get(expression)
+        if stats is None:
+            if len(self._entries) >= self._size:
+                del self._entries[next(iter(self._entries))]
+            stats = self._entries[expression] = ExpressionStats(expression)
+        return stats
+
+    def evaluate(
+        self,
+        expression: str,
+        context: Mapping[str, Any],
+        *,
+        label: str | None = None,
+    ) -> Any:
+        """Evaluate ``expression`` like :func:`evaluate_expression`, routing with this table."""
+
+        return _evaluate_with_backend(expression, context, label=label, stats=self)[0]
+
+    def fallback_report(self, min_fallbacks: int = 1) -> list[ExpressionStats]:
+        """Return expressions answered by the AST fallback, most frequent first."""
+
+        selected = [stats for stats in self._entries.values() if stats.fallbacks >= min_fallbacks]
+        return sorted(selected, key=lambda stats: (-stats.fallbacks, -stats.sympy_miss_seconds, stats.expression))
+
+    def format_fallback_report(self, min_fallbacks: int = 1) -> str:
+        """Render :meth:`fallback_report` as a plain-text table."""
+
+        lines = [f"{'ast':>8}{'routed':>8}{'misses':>8}{'miss ms':>10}  expression"]
+        for stats in self.fallback_report(min_fallbacks):
+            lines.append(
+                f"{stats.ast_hits:>8}{stats.routed:>8}{stats.sympy_misses:>8}"
+                f"{stats.sympy_miss_seconds * 1e3:>10.3f}  {stats.expression}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Forget backend preferences and counters for every expression."""
+
+        self._entries.clear()
+
+
+_DEFAULT_STATS = ExpressionStatsTable()
+
+
+def expression_fallback_report(min_fallbacks: int = 1) -> list[ExpressionStats]:
+    """Return the default table's expressions answered by the AST fallback."""
+
+    return _DEFAULT_STATS.fallback_report(min_fallbacks)
+
+
+def format_fallback_report(min_fallbacks: int = 1) -> str:
+    """Render :func:`expression_fallback_report` as a plain-text table."""
+
+    return _DEFAULT_STATS.format_fallback_report(min_fallbacks)
+
+
+def reset_expression_stats() -> None:
+    """Forget the default table's backend preferences and counters."""
+
+    _DEFAULT_STATS.reset()
+
+
 def _compile_token_pattern(tokens: tuple[str, ...]) -> re.Pattern[str] | None:
     if not tokens:
         return None
@@ -116,6 +242,8 @@ def _clear_expression_caches() -> None:
     _dotted_tokens.cache_clear()
     _compile_sympy_plan.cache_clear()
     _compile_ast_plan.cache_clear()
+    _lambdify_point_expression.cache_clear()
+    reset_expression_stats()
 
 
 class FormulaEngine:
@@ -147,34 +275,188 @@ def evaluate_expression(
 ) -> Any:
     """Evaluate a template expression with sympy first, then a safe AST fallback."""
 
+    return _evaluate_with_backend(expression, context, label=label)[0]
+
+
+def _evaluate_with_backend(
+    expression: str,
+    context: Mapping[str, Any],
+    *,
+    label: str | None = None,
+    stats: ExpressionStatsTable | None = None,
+) -> tuple[Any, str]:
+    """Evaluate ``expression`` and report which backend (``sympy``/``ast``) produced it.
+
+    Routing uses ``stats`` when given and the module's default table otherwise.
+    """
+
+    counters = (_DEFAULT_STATS if stats is None else stats).entry(expression)
+    if counters.preferred == AST_BACKEND:
+        try:
+            result = _evaluate_ast(expression, context)
+        except Exception as ast_exc:
+            # The context may have changed shape; give sympy another chance.
+            result = _evaluate_sympy(expression, context)
+            if result is None:
+                raise _evaluation_error(expression, label) from ast_exc
+            counters.sympy_hits += 1
+            return result, SYMPY_BACKEND
+        counters.ast_hits += 1
+        counters.routed += 1
+        return result, AST_BACKEND
+
+    started = perf_counter()
+    result = _evaluate_sympy(expression, context)
+    if result is not None:
+        counters.sympy_hits += 1
+        return result, SYMPY_BACKEND
+    counters.sympy_misses += 1
+    counters.sympy_miss_seconds += perf_counter() - started
+
+    try:
+        result = _evaluate_ast(expression, context)
+    except Exception as ast_exc:
+        raise _evaluation_error(expression, label) from ast_exc
+    counters.ast_hits += 1
+    counters.preferred = AST_BACKEND
+    return result, AST_BACKEND
+
+
+def compile_point_expression(
+    expression: str,
+    context: Mapping[str, Any],
+    *,
+    alias: str,
+    index_name: str = "__index__",
+) -> tuple[Callable[..., Any], tuple[str | None, ...]] | None:
+    """Reduce ``expression`` to a plain numeric function of the fields of one point.
+
+    Paths rooted at ``alias`` and the ``index_name`` counter become the
+    positional parameters; every other name is resolved from ``context`` once.
+    Returns the function together with the alias-relative path of each
+    parameter (``""`` for the point itself, ``None`` for the index), or
+    ``None`` when sympy cannot express the result as arithmetic over them.
+    """
+
+    plan = _compile_sympy_plan(expression)
+    replacements: dict[str, str] = {}
+    constants: dict[str, Any] = {}
+    parameters: list[str] = []
+    paths: list[str | None] = []
+    aliases: dict[str, str] = {}
+
+    def parameter(path: str | None) -> str:
+        name = f"_point{len(parameters)}"
+        parameters.append(name)
+        paths.append(path)
+        return name
+
+    for token in plan.dotted_tokens:
+        root, _, rest = token.partition(".")
+        if root == alias:
+            replacements[token] = parameter(rest)
+            continue
+        if root in context:
+            try:
+                value = resolve_path(context, token)
+            except KeyError:
+                continue
+        elif root in _MATH_ROOTS and hasattr(math, rest):
+            value = getattr(math, rest)
+        else:
+            continue
+        if callable(value):
+            # ``Math.cos`` and friends become their symbolic counterparts.
+            value = getattr(sympy, token.rsplit(".", 1)[-1], None)
+            if value is None:
+                return None
+        placeholder = f"__v{len(replacements)}"
+        replacements[token] = placeholder
+        constants[placeholder] = value
+    sanitized = (
+        expression
+        if plan.token_pattern is None
+        else plan.token_pattern.sub(lambda match: replacements.get(match.group(0), match.group(0)), expression)
+    )
+    for name in _identifier_tokens(sanitized):
+        if name == alias:
+            aliases[name] = parameter("")
+        elif name == index_name:
+            aliases[name] = parameter(None)
+        elif name.isidentifier() and name not in constants and name not in parameters and name in context:
+            constants[name] = context[name]
+
+    # Keyed on the resolved constants (with their types, so 1 and 1.0 stay
+    # apart); renders that reuse the same values skip sympify and lambdify.
+    key = (
+        sanitized,
+        tuple(parameters),
+        tuple(aliases.items()),
+        tuple((name, type(value), value) for name, value in constants.items()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        function = _lambdify_point_expression.__wrapped__(*key)
+    else:
+        function = _lambdify_point_expression(*key)
+    if function is None:
+        return None
+    return function, tuple(paths)
+
+
+@lru_cache(maxsize=_EXPRESSION_CACHE_SIZE)
+def _lambdify_point_expression(
+    sanitized: str,
+    parameters: tuple[str, ...],
+    aliases: tuple[tuple[str, str], ...],
+    constants: tuple[tuple[str, type, Any], ...],
+) -> Callable[..., Any] | None:
+    symbols = [sympy.Symbol(name, real=True) for name in parameters]
+    sympy_locals: dict[str, Any] = dict(zip(parameters, symbols))
+    sympy_locals.update((name, sympy_locals[target]) for name, target in aliases)
+    sympy_locals.update((name, value) for name, _, value in constants)
+    try:
+        value = sympy.sympify(sanitized, locals=sympy_locals)
+        if not isinstance(value, sympy.Basic) or not value.free_symbols <= set(symbols):
+            return None
+        return sympy.lambdify(symbols, value, modules="math")
+    except Exception:  # pragma: no cover - depends on sympy runtime
+        return None
+
+
+def _evaluate_sympy(expression: str, context: Mapping[str, Any]) -> Any | None:
+    """Return the sympy result for ``expression`` or ``None`` when sympy cannot answer."""
+
     sympy_plan = _compile_sympy_plan(expression)
     sanitized, sympy_locals = _prepare_sympy_expression(expression, context, sympy_plan)
     try:
         value = sympy.sympify(sanitized, locals=sympy_locals)
         if isinstance(value, sympy.Basic) and value.free_symbols:
             raise SympifyError("Unresolved symbols")
-        result = _coerce_sympy_result(value)
-        if result is not None:
-            return result
+        return _coerce_sympy_result(value)
     except Exception:  # pragma: no cover - depends on sympy runtime
-        pass
+        return None
 
-    try:
-        ast_plan = _compile_ast_plan(expression)
-        if ast_plan.syntax_error is not None:
-            raise UnsafeExpressionError("Invalid expression syntax") from ast_plan.syntax_error
-        raw_result = safe_ast_eval(
-            expression,
-            context,
-            compiled=ast_plan.tree,
-            identifiers=ast_plan.identifier_tokens,
-        )
-        return _normalise_value(raw_result)
-    except Exception as ast_exc:
-        message = f"Failed to evaluate expression '{expression}'"
-        if label:
-            message = f"{label}: {message}"
-        raise FormulaEvaluationError(message) from ast_exc
+
+def _evaluate_ast(expression: str, context: Mapping[str, Any]) -> Any:
+    ast_plan = _compile_ast_plan(expression)
+    if ast_plan.syntax_error is not None:
+        raise UnsafeExpressionError("Invalid expression syntax") from ast_plan.syntax_error
+    raw_result = safe_ast_eval(
+        expression,
+        context,
+        compiled=ast_plan.tree,
+        identifiers=ast_plan.identifier_tokens,
+    )
+    return _normalise_value(raw_result)
+
+
+def _evaluation_error(expression: str, label: str | None) -> FormulaEvaluationError:
+    message = f"Failed to evaluate expression '{expression}'"
+    if label:
+        message = f"{label}: {message}"
+    return FormulaEvaluationError(message)
 
 
 def _coerce_integral(value: Any) -> Any:
@@ -0,0 +1,301 @@
+"""Polyline simplification, grid quantisation, and compact path data for large geometries."""
+
+from __future__ import annotations
+
+import heapq
+import re
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+SIMPLIFY_METHODS = frozenset({"rdp", "visvalingam"})
+
+_PATH_TOKEN = re.compile(r"[MmLlHhVvZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_UNSUPPORTED_COMMAND = re.compile(r"[CcSsQqTtAa]")
+
+
+@dataclass(slots=True)
+class Subpath:
+    """One ``M``-started run of straight segments, in absolute coordinates."""
+
+    xs: list[float]
+    ys: list[float]
+    closed: bool = False
+
+
+def rdp_indices(xs: Sequence[float], ys: Sequence[float], tolerance: float) -> list[int]:
+    """Select vertices with Ramer-Douglas-Peucker.
+
+    Vertices closer than ``tolerance`` to the chord of their span are
+    dropped. The first and last vertices are always kept. The recursion is
+    unrolled onto an explicit stack, so long outlines do not hit the
+    recursion limit.
+    """
+
+    length = len(xs)
+    if length <= 2 or tolerance <= 0:
+        return list(range(length))
+    keep = [False] * length
+    keep[0] = keep[-1] = True
+    limit = tolerance * tolerance
+    stack = [(0, length - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        x0, y0 = xs[first], ys[first]
+        dx, dy = xs[last] - x0, ys[last] - y0
+        chord = dx * dx + dy * dy
+        worst = -1.0
+        worst_index = first
+        for index in range(first + 1, last):
+            px, py = xs[index] - x0, ys[index] - y0
+            if chord == 0:
+                distance = px * px + py * py
+            else:
+                cross = px * dy - py * dx
+                distance = cross * cross / chord
+            if distance > worst:
+                worst = distance
+                worst_index = index
+        if worst > limit:
+            keep[worst_index] = True
+            stack.append((first, worst_index))
+            stack.append((worst_index, last))
+    return [index for index, kept in enumerate(keep) if kept]
+
+
+def visvalingam_indices(xs: Sequence[float], ys: Sequence[float], tolerance: float) -> list[int]:
+    """Select vertices with Visvalingam-Whyatt.
+
+    The vertex forming the smallest triangle with its neighbours is removed
+    repeatedly until every remaining triangle has an area of at least
+    ``tolerance ** 2 / 2``, comparable to an offset of ``tolerance`` pixels.
+    The first and last vertices are always kept.
+    """
+
+    length = len(xs)
+    if length <= 2 or tolerance <= 0:
+        return list(range(length))
+    threshold = tolerance * tolerance
+    previous = list(range(-1, length - 1))
+    following = list(range(1, length + 1))
+    removed = [False] * length
+
+    def area(index: int) -> float:
+        left, right = previous[index], following[index]
+        return abs(
+            (xs[left] - xs[index]) * (ys[right] - ys[index]) - (xs[right] - xs[index]) * (ys[left] - ys[index])
+        )
+
+    heap = [(area(index), index) for index in range(1, length - 1)]
+    heapq.heapify(heap)
+    current = {index: value for value, index in heap}
+    while heap:
+        value, index = heapq.heappop(heap)
+        if removed[index] or current.get(index) != value:
+            continue
+        if value >= threshold:
+            break
+        removed[index] = True
+        left, right = previous[index], following[index]
+        following[left] = right
+        previous[right] = left
+        for neighbour in (left, right):
+            if 0 < neighbour < length - 1:
+                # Never let a neighbour drop below the area just removed (Visvalingam's rule).
+                updated = max(area(neighbour), value)
+                current[neighbour] = updated
+                heapq.heappush(heap, (updated, neighbour))
+    return [index for index in range(length) if not removed[index]]
+
+
+SIMPLIFIERS: dict[str, Callable[[Sequence[float], Sequence[float], float], list[int]]] = {
+    "rdp": rdp_indices,
+    "visvalingam": visvalingam_indices,
+}
+
+
+def quantize(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    grid: float,
+) -> tuple[list[float], list[float]]:
+    """Snap coordinates to multiples of ``grid`` and drop consecutive duplicates."""
+
+    out_x: list[float] = []
+    out_y: list[float] = []
+    last: tuple[float, float] | None = None
+    for x, y in zip(xs, ys):
+        point = (round(x / grid) * grid, round(y / grid) * grid)
+        if point != last:
+            out_x.append(point[0])
+            out_y.append(point[1])
+            last = point
+    return out_x, out_y
+
+
+def simplify(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    *,
+    method: str = "rdp",
+    tolerance: float = 0.5,
+    grid: float | None = None,
+) -> tuple[list[float], list[float]]:
+    """Simplify one polyline and optionally quantise the surviving vertices."""
+
+    indices = SIMPLIFIERS[method](xs, ys, tolerance)
+    out_x = [xs[index] for index in indices]
+    out_y = [ys[index] for index in indices]
+    if grid:
+        out_x, out_y = quantize(out_x, out_y, grid)
+    return out_x, out_y
+
+
+# Attributes that fix the extent of shapes whose bounds can be computed without layout.
+BOUNDED_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "rect": ("x", "y", "width", "height"),
+    "circle": ("cx", "cy", "r"),
+    "ellipse": ("cx", "cy", "rx", "ry"),
+    "line": ("x1", "y1", "x2", "y2"),
+}
+
+
+def shape_bounds(element_type: str, attributes: Mapping[str, Any]) -> tuple[float, float, float, float] | None:
+    """Return ``(left, top, right, bottom)`` for a shape in its own user space.
+
+    Only the attributes listed in :data:`BOUNDED_ATTRIBUTES` are consulted;
+    missing ones default to ``0`` as in SVG. Returns ``None`` for other
+    element types (including ``text``, whose extent depends on font metrics
+    and ``text-anchor``) and for values that are not plain numbers (units,
+    percentages, coordinate lists), so callers can treat the shape as
+    unbounded.
+    """
+
+    names = BOUNDED_ATTRIBUTES.get(element_type)
+    if names is None:
+        return None
+    values: dict[str, float] = {}
+    for name in names:
+        value = attributes.get(name)
+        if value is None or value == "":
+            continue
+        try:
+            values[name] = float(value)
+        except (TypeError, ValueError):
+            return None
+    get = values.get
+    if element_type == "rect":
+        x, y = get("x", 0.0), get("y", 0.0)
+        return x, y, x + get("width", 0.0), y + get("height", 0.0)
+    if element_type == "circle":
+        cx, cy, r = get("cx", 0.0), get("cy", 0.0), get("r", 0.0)
+        return cx - r, cy - r, cx + r, cy + r
+    if element_type == "ellipse":
+        rx = get("rx", get("ry", 0.0))
+        ry = get("ry", rx)
+        cx, cy = get("cx", 0.0), get("cy", 0.0)
+        return cx - rx, cy - ry, cx + rx, cy + ry
+    x1, y1, x2, y2 = get("x1", 0.0), get("y1", 0.0), get("x2", 0.0), get("y2", 0.0)
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+def parse_path(data: str) -> list[Subpath] | None:
+    """Parse path data made only of ``M``/``L``/``H``/``V``/``Z`` commands.
+
+    Returns ``None`` when the path uses curves or arcs, or cannot be parsed,
+    so callers can leave such paths untouched.
+    """
+
+    if _UNSUPPORTED_COMMAND.search(data):
+        return None
+    subpaths: list[Subpath] = []
+    command = ""
+    x = y = start_x = start_y = 0.0
+    numbers: list[float] = []
+    current: Subpath | None = None
+
+    def flush() -> bool:
+        nonlocal x, y, start_x, start_y, current, command
+        upper = command.upper()
+        relative = command.islower()
+        arity = 1 if upper in "HV" else 2
+        if upper == "Z" or len(numbers) % arity:
+            return not numbers
+        for offset in range(0, len(numbers), arity):
+            if upper == "H":
+                x = numbers[offset] + (x if relative else 0.0)
+            elif upper == "V":
+                y = numbers[offset] + (y if relative else 0.0)
+            else:
+                x = numbers[offset] + (x if relative else 0.0)
+                y = numbers[offset + 1] + (y if relative else 0.0)
+            if upper == "M" and offset == 0:
+                current = Subpath([x], [y])
+                subpaths.append(current)
+                start_x, start_y = x, y
+                continue
+            if current is None:
+                return False
+            current.xs.append(x)
+            current.ys.append(y)
+        numbers.clear()
+        return True
+
+    for token in _PATH_TOKEN.findall(data):
+        if token.isalpha():
+            if command and not flush():
+                return None
+            command = token
+            if token in "Zz":
+                if current is None:
+                    return None
+                current.closed = True
+                x, y = start_x, start_y
+                current = None
+            continue
+        if not command:
+            return None
+        numbers.append(float(token))
+    if command and not flush():
+        return None
+    return subpaths
+
+
+def format_path(
+    subpaths: Sequence[Subpath],
+    format_value: Callable[[float], str],
+    *,
+    relative: bool = False,
+) -> str:
+    """Serialise subpaths as ``M``/``L``/``Z`` commands (``m``/``l``/``z`` when ``relative``)."""
+
+    parts: list[str] = []
+    cursor_x = cursor_y = 0.0
+    for subpath in subpaths:
+        xs, ys = subpath.xs, subpath.ys
+        if not xs:
+            continue
+        if relative:
+            # Differences of already-rounded coordinates keep rounding error from accumulating.
+            xs = [float(format_value(x)) for x in xs]
+            ys = [float(format_value(y)) for y in ys]
+            # The first subpath's ``m`` is absolute; later ones are relative to the pen position.
+            move_x, move_y = (xs[0] - cursor_x, ys[0] - cursor_y) if parts else (xs[0], ys[0])
+            parts.append(f"m{format_value(move_x)},{format_value(move_y)}")
+            steps = [
+                f"{format_value(xs[i] - xs[i - 1])},{format_value(ys[i] - ys[i - 1])}" for i in range(1, len(xs))
+            ]
+            if steps:
+                parts.append("l" + " ".join(steps))
+        else:
+            parts.append(f"M{format_value(xs[0])},{format_value(ys[0])}")
+            if len(xs) > 1:
+                parts.append("L" + " ".join(f"{format_value(x)},{format_value(y)}" for x, y in zip(xs[1:], ys[1:])))
+        if subpath.closed:
+            parts.append("z" if relative else "Z")
+            cursor_x, cursor_y = xs[0], ys[0]
+        else:
+            cursor_x, cursor_y = xs[-1], ys[-1]
+    return "".join(parts)
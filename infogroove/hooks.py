@@ -0,0 +1,193 @@
+"""Observer interface for render lifecycle events and an in-memory recorder."""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models import ElementSpec, TemplateSpec
+
+# Upper bucket bounds in seconds: 1µs, 2µs, 5µs, ... 50s.
+DEFAULT_BUCKETS: tuple[float, ...] = tuple(
+    base * 10.0**exponent for exponent in range(-6, 2) for base in (1.0, 2.0, 5.0)
+)
+# Powers of two from 1 to 2**30 for item and byte counts.
+_SIZE_BUCKETS: tuple[float, ...] = tuple(float(2**exponent) for exponent in range(31))
+
+
+class RenderHooks:
+    """Base class for render observers.
+
+    Every method is a no-op, so subclasses only override the events they care
+    about. Durations are reported in seconds. Renderers without hooks never
+    read the clock, keeping the disabled path free of overhead.
+    """
+
+    def on_template_load(self, template: TemplateSpec, elapsed: float) -> None:
+        """Called after a template definition has been read and parsed.
+
+        Only fires when the template is parsed for the renderer: through
+        :func:`~infogroove.loader.load`, :func:`~infogroove.loader.loads`,
+        :func:`~infogroove.loader.load_path`, or ``Infogroove`` given a
+        mapping. Hooks passed to ``InfogrooveRenderer`` or to ``Infogroove``
+        with an already parsed ``TemplateSpec``, and hooks attached later with
+        ``add_hook``, never see this event.
+        """
+
+    def on_validation_start(self, data: Any) -> None:
+        """Called before the input data is validated."""
+
+    def on_validation_end(self, data: Any, elapsed: float) -> None:
+        """Called after the input data passed validation."""
+
+    def on_base_context(self, context: Mapping[str, Any], elapsed: float) -> None:
+        """Called once the base rendering context has been built."""
+
+    def on_element(self, path: str, element: ElementSpec, node_count: int, elapsed: float) -> None:
+        """Called after each top-level template element has been translated."""
+
+    def on_repeat(self, path: str, element: ElementSpec, item_count: int, elapsed: float) -> None:
+        """Called after a repeat block has been expanded over its items."""
+
+    def on_serialize(self, size: int, elapsed: float) -> None:
+        """Called after node specifications have been serialised into SVG markup."""
+
+    def on_render_end(self, elapsed: float) -> None:
+        """Called when a ``render`` or ``translate`` call completes."""
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Fixed-bucket histogram with running count, sum, and extrema."""
+
+    bounds: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        """Add a single observation."""
+
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> float:
+        """Average of all observations (``0.0`` when empty)."""
+
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bucket bound containing the ``q`` quantile."""
+
+        if not self.count:
+            return 0.0
+        threshold = q * self.count
+        running = 0
+        for index, bucket_count in enumerate(self.counts):
+            running += bucket_count
+            if running >= threshold and bucket_count:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.maximum)
+                return self.maximum
+        return self.maximum
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary of the histogram."""
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.minimum if self.count else None,
+            "max": self.maximum if self.count else None,
+            "mean": self.mean,
+            "buckets": [
+                {"le": bound, "count": bucket_count}
+                for bound, bucket_count in zip((*self.bounds, math.inf), self.counts, strict=True)
+                if bucket_count
+            ],
+        }
+
+
+class HistogramRecorder(RenderHooks):
+    """Aggregate render event durations (and repeat sizes) into in-memory histograms.
+
+    Durations are keyed by event name (``template_load``, ``validation``,
+    ``base_context``, ``element``, ``repeat``, ``serialize``, ``render``) and
+    per top-level element path (``element:template[0]``). Repeat item counts
+    and serialised output sizes are recorded under ``repeat_items`` and
+    ``output_bytes``.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self._bounds = bounds
+        self.histograms: dict[str, Histogram] = {}
+        self.sizes: dict[str, Histogram] = {}
+
+    def reset(self) -> None:
+        """Discard every recorded observation."""
+
+        self.histograms.clear()
+        self.sizes.clear()
+
+    def observe(self, name: str, elapsed: float) -> None:
+        """Record a duration under ``name``."""
+
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(self._bounds)
+        histogram.observe(elapsed)
+
+    def observe_size(self, name: str, size: int) -> None:
+        """Record a size (item count or byte count) under ``name``."""
+
+        histogram = self.sizes.get(name)
+        if histogram is None:
+            histogram = self.sizes[name] = Histogram(_SIZE_BUCKETS)
+        histogram.observe(size)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all histograms as JSON-serialisable mappings."""
+
+        return {
+            "durations": {name: histogram.as_dict() for name, histogram in self.histograms.items()},
+            "sizes": {name: histogram.as_dict() for name, histogram in self.sizes.items()},
+        }
+
+    def on_template_load(self, template: TemplateSpec, elapsed: float) -> None:
+        self.observe("template_load", elapsed)
+
+    def on_validation_end(self, data: Any, elapsed: float) -> None:
+        self.observe("validation", elapsed)
+
+    def on_base_context(self, context: Mapping[str, Any], elapsed: float) -> None:
+        self.observe("base_context", elapsed)
+
+    def on_element(self, path: str, element: ElementSpec, node_count: int, elapsed: float) -> None:
+        self.observe("element", elapsed)
+        self.observe(f"element:{path}", elapsed)
+
+    def on_repeat(self, path: str, element: ElementSpec, item_count: int, elapsed: float) -> None:
+        self.observe("repeat", elapsed)
+        self.observe_size("repeat_items", item_count)
+
+    def on_serialize(self, size: int, elapsed: float) -> None:
+        self.observe("serialize", elapsed)
+        self.observe_size("output_bytes", size)
+
+    def on_render_end(self, elapsed: float) -> None:
+        self.observe("render", elapsed)
@@ -3,25 +3,54 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from time import perf_counter
 from typing import IO, Any, Mapping, MutableMapping
 
 from jsonschema import SchemaError
 from jsonschema.validators import validator_for
 
+from .aggregates import AGGREGATE_OPS
+from .downsample import DOWNSAMPLE_METHODS
 from .exceptions import TemplateError
-from .models import CanvasSpec, ElementSpec, RepeatSpec, TemplateSpec
-from .renderer import ElementRenderer, InfogrooveRenderer
-
-
-def load(handle: IO[str], *, renderers: Mapping[str, ElementRenderer] | None = None) -> InfogrooveRenderer:
+from .geometry import SIMPLIFY_METHODS
+from .hooks import RenderHooks
+from .models import (
+    AggregateSpec,
+    CanvasSpec,
+    DownsampleSpec,
+    ElementSpec,
+    PointSeriesSpec,
+    RepeatSpec,
+    SimplifySpec,
+    SortKey,
+    TemplateSpec,
+)
+from .renderer import _RESERVED_CONTEXT_NAMES, ElementRenderer, InfogrooveRenderer
+from .utils import PLACEHOLDER_PATTERN, tokenize_path
+
+_REPEAT_KEYS = frozenset(
+    {"items", "as", "let", "where", "orderBy", "limit", "offset", "groupBy", "total", "downsample"}
+)
+_SERIES_ATTRIBUTES = frozenset({"points", "d"})
+
+
+def load(
+    handle: IO[str],
+    *,
+    renderers: Mapping[str, ElementRenderer] | None = None,
+    hooks: Sequence[RenderHooks] | None = None,
+) -> InfogrooveRenderer:
     """Load an infographic definition from a text stream."""
 
-    raw_text = handle.read()
-    source_name = getattr(handle, "name", None)
-    source_path = Path(source_name) if isinstance(source_name, str) and source_name else None
-    template = _template_from_text(raw_text, source_path)
-    return InfogrooveRenderer(template, renderers=renderers)
+    def parse() -> TemplateSpec:
+        raw_text = handle.read()
+        source_name = getattr(handle, "name", None)
+        source_path = Path(source_name) if isinstance(source_name, str) and source_name else None
+        return _template_from_text(raw_text, source_path)
+
+    return _create_renderer(parse, renderers, hooks)
 
 
 def loads(
@@ -29,28 +58,49 @@ def loads(
     *,
     source: str | Path | None = None,
     renderers: Mapping[str, ElementRenderer] | None = None,
+    hooks: Sequence[RenderHooks] | None = None,
 ) -> InfogrooveRenderer:
     """Load an infographic definition from a JSON string."""
 
     source_path = Path(source) if source is not None else None
-    template = _template_from_text(data, source_path)
-    return InfogrooveRenderer(template, renderers=renderers)
+    return _create_renderer(lambda: _template_from_text(data, source_path), renderers, hooks)
 
 
 def load_path(
     path: str | Path,
     *,
     renderers: Mapping[str, ElementRenderer] | None = None,
+    hooks: Sequence[RenderHooks] | None = None,
 ) -> InfogrooveRenderer:
     """Load and parse a template definition from a filesystem path."""
 
     template_path = Path(path)
-    try:
-        raw_text = template_path.read_text(encoding="utf-8")
-    except OSError as exc:  # pragma: no cover - filesystem dependent
-        raise TemplateError(f"Unable to read template '{template_path}'") from exc
-    template = _template_from_text(raw_text, template_path)
-    return InfogrooveRenderer(template, renderers=renderers)
+
+    def parse() -> TemplateSpec:
+        try:
+            raw_text = template_path.read_text(encoding="utf-8")
+        except OSError as exc:  # pragma: no cover - filesystem dependent
+            raise TemplateError(f"Unable to read template '{template_path}'") from exc
+        return _template_from_text(raw_text, template_path)
+
+    return _create_renderer(parse, renderers, hooks)
+
+
+def _create_renderer(
+    parse: Callable[[], TemplateSpec],
+    renderers: Mapping[str, ElementRenderer] | None,
+    hooks: Sequence[RenderHooks] | None,
+) -> InfogrooveRenderer:
+    """Parse a template and wrap it in a renderer, notifying hooks of the load time."""
+
+    if not hooks:
+        return InfogrooveRenderer(parse(), renderers=renderers)
+    started = perf_counter()
+    template = parse()
+    elapsed = perf_counter() - started
+    for hook in hooks:
+        hook.on_template_load(template, elapsed)
+    return InfogrooveRenderer(template, renderers=renderers, hooks=hooks)
 
 
 def _template_from_text(raw_text: str, source: Path | None) -> TemplateSpec:
@@ -110,6 +160,7 @@ def _parse_template(path: Path, payload: Mapping[str, Any]) -> TemplateSpec:
         raise TemplateError("'numElementsRange' is no longer supported; declare bounds with schema 'minItems' and 'maxItems'")
 
     schema_block = _parse_schema(payload)
+    aggregates = _parse_aggregates(payload, properties)
 
     metadata = {
         key: payload[key]
@@ -124,6 +175,7 @@ def _parse_template(path: Path, payload: Mapping[str, Any]) -> TemplateSpec:
         properties=dict(properties),
         schema=schema_block,
         metadata=metadata,
+        aggregates=aggregates,
     )
 
 
@@ -141,11 +193,27 @@ def _parse_element(entry: Any) -> ElementSpec:
     text = entry.get("text")
     if text is not None and not isinstance(text, str):
         raise TemplateError("Element text must be a string when provided")
-    attributes = {key: str(value) for key, value in attributes_block.items()}
+    attributes = {
+        key: str(value) for key, value in attributes_block.items() if not isinstance(value, Mapping)
+    }
+    series = {
+        key: _parse_point_series(key, value)
+        for key, value in attributes_block.items()
+        if isinstance(value, Mapping)
+    }
 
     if "scope" in entry:
         raise TemplateError("'scope' is no longer supported; use 'repeat' to control iteration")
 
+    when = entry.get("when")
+    if when is not None:
+        if not isinstance(when, str) or not when.strip():
+            raise TemplateError("Element 'when' must be a non-empty expression string")
+        when = when.strip()
+        match = PLACEHOLDER_PATTERN.fullmatch(when)
+        if match:
+            when = match.group(1).strip()
+
     repeat_block = entry.get("repeat")
     repeat: RepeatSpec | None = None
     if repeat_block is not None:
@@ -164,12 +232,34 @@ def _parse_element(entry: Any) -> ElementSpec:
             repeat_let = {}
         if not isinstance(repeat_let, Mapping):
             raise TemplateError("Repeat 'let' bindings must be declared as a mapping when provided")
-        extra_keys = {key for key in repeat_block if key not in {"items", "as", "let"}}
+        extra_keys = {key for key in repeat_block if key not in _REPEAT_KEYS}
         if extra_keys:
             raise TemplateError(
-                "Repeat declarations only accept 'items', 'as', and 'let'; move derived values under the element 'let' block"
+                "Repeat declarations only accept 'items', 'as', 'let', 'where', 'orderBy', 'limit', "
+                "'offset', 'groupBy', 'total', and 'downsample'; move derived values under the element "
+                "'let' block"
             )
-        repeat = RepeatSpec(items=items, alias=alias, let=dict(repeat_let))
+        where = repeat_block.get("where")
+        if where is not None and (not isinstance(where, str) or not where.strip()):
+            raise TemplateError("Repeat 'where' must be a non-empty expression string")
+        total = repeat_block.get("total")
+        if total is not None and (not isinstance(total, str) or not total.strip()):
+            raise TemplateError("Repeat 'total' must be a non-empty expression string")
+        group_by = repeat_block.get("groupBy")
+        if group_by is not None and (not isinstance(group_by, str) or not group_by):
+            raise TemplateError("Repeat 'groupBy' must be a non-empty string path")
+        repeat = RepeatSpec(
+            items=items,
+            alias=alias,
+            let=dict(repeat_let),
+            where=where.strip() if where is not None else None,
+            order_by=_parse_order_by(repeat_block.get("orderBy")),
+            limit=_parse_repeat_count(repeat_block, "limit"),
+            offset=_parse_repeat_count(repeat_block, "offset") or 0,
+            group_by=group_by,
+            total=total.strip() if total is not None else None,
+            downsample=_parse_downsample(repeat_block.get("downsample"), "Repeat", paths=True),
+        )
 
     let_block = entry.get("let", {})
     if let_block is None:
@@ -185,7 +275,234 @@ def _parse_element(entry: Any) -> ElementSpec:
     else:
         raise TemplateError("Element children must be declared as a list when provided")
 
-    return ElementSpec(type=element_type, attributes=attributes, text=text, repeat=repeat, let=dict(let_block), children=children)
+    return ElementSpec(
+        type=element_type,
+        attributes=attributes,
+        text=text,
+        repeat=repeat,
+        let=dict(let_block),
+        children=children,
+        when=when,
+        series=series,
+    )
+
+
+def _parse_point_series(attribute: str, block: Mapping[str, Any]) -> PointSeriesSpec:
+    """Parse a ``points``/``d`` attribute declared as a point collection."""
+
+    if attribute not in _SERIES_ATTRIBUTES:
+        raise TemplateError(
+            f"Attribute '{attribute}' must be a string; only 'points' and 'd' accept a point collection"
+        )
+    extra_keys = set(block) - {"items", "as", "x", "y", "precision", "downsample", "simplify"}
+    if extra_keys:
+        raise TemplateError(
+            f"Attribute '{attribute}' point collections only accept 'items', 'as', 'x', 'y', 'precision', "
+            "'downsample', and 'simplify'"
+        )
+    items = block.get("items")
+    alias = block.get("as")
+    if not isinstance(items, str) or not items:
+        raise TemplateError(f"Attribute '{attribute}' point collections require a string 'items' path")
+    if not isinstance(alias, str) or not alias.isidentifier():
+        raise TemplateError(f"Attribute '{attribute}' point collections require an identifier 'as' alias")
+    coordinates: dict[str, str] = {}
+    for axis in ("x", "y"):
+        expression = block.get(axis)
+        if not isinstance(expression, str) or not expression.strip():
+            raise TemplateError(f"Attribute '{attribute}' point collections require an expression for '{axis}'")
+        expression = expression.strip()
+        match = PLACEHOLDER_PATTERN.fullmatch(expression)
+        coordinates[axis] = match.group(1).strip() if match else expression
+    precision = block.get("precision", 2)
+    if precision is not None and (isinstance(precision, bool) or not isinstance(precision, int) or precision < 0):
+        raise TemplateError(f"Attribute '{attribute}' precision must be a non-negative integer or null")
+    return PointSeriesSpec(
+        items=items,
+        alias=alias,
+        x=coordinates["x"],
+        y=coordinates["y"],
+        precision=precision,
+        downsample=_parse_downsample(block.get("downsample"), f"Attribute '{attribute}'", paths=False),
+        simplify=_parse_simplify(block.get("simplify"), attribute),
+    )
+
+
+def _parse_simplify(value: Any, attribute: str) -> SimplifySpec | None:
+    """Parse a ``simplify`` block given as a pixel tolerance or a mapping."""
+
+    if value is None:
+        return None
+    owner = f"Attribute '{attribute}' 'simplify'"
+    block: Mapping[str, Any] = {"tolerance": value} if _is_number(value) else value
+    if not isinstance(block, Mapping):
+        raise TemplateError(f"{owner} must be a tolerance in pixels or a mapping")
+    extra_keys = set(block) - {"method", "tolerance", "grid", "relative"}
+    if extra_keys:
+        raise TemplateError(f"{owner} only accepts 'method', 'tolerance', 'grid', and 'relative'")
+    method = block.get("method", "rdp")
+    if method not in SIMPLIFY_METHODS:
+        raise TemplateError(f"{owner} method must be one of {sorted(SIMPLIFY_METHODS)}")
+    tolerance = block.get("tolerance", 0.5)
+    if not _is_number(tolerance) or tolerance < 0:
+        raise TemplateError(f"{owner} tolerance must be a non-negative number")
+    grid = block.get("grid")
+    if grid is not None and (not _is_number(grid) or grid <= 0):
+        raise TemplateError(f"{owner} grid must be a positive number")
+    relative = block.get("relative", False)
+    if not isinstance(relative, bool):
+        raise TemplateError(f"{owner} relative must be a boolean")
+    if relative and attribute != "d":
+        raise TemplateError(f"{owner} relative commands only apply to path 'd' attributes")
+    return SimplifySpec(method=method, tolerance=float(tolerance), grid=grid, relative=relative)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_downsample(value: Any, owner: str, *, paths: bool) -> DownsampleSpec | None:
+    """Parse a ``downsample`` block given as a method name or a mapping.
+
+    Repeat blocks read the ``x``/``y`` values from item paths; point
+    collections downsample their computed coordinates and take no paths.
+    """
+
+    if value is None:
+        return None
+    block: Mapping[str, Any] = {"method": value} if isinstance(value, str) else value
+    if not isinstance(block, Mapping):
+        raise TemplateError(f"{owner} 'downsample' must be a method name or a mapping")
+    allowed = {"method", "target", "x", "y"} if paths else {"method", "target"}
+    extra_keys = set(block) - allowed
+    if extra_keys:
+        names = ", ".join(f"'{key}'" for key in sorted(allowed))
+        raise TemplateError(f"{owner} 'downsample' only accepts {names}")
+    method = block.get("method", "lttb")
+    if method not in DOWNSAMPLE_METHODS:
+        raise TemplateError(f"{owner} 'downsample' method must be one of {sorted(DOWNSAMPLE_METHODS)}")
+    target = block.get("target")
+    if target is not None and (isinstance(target, bool) or not isinstance(target, int) or target < 3):
+        raise TemplateError(f"{owner} 'downsample' target must be an integer of at least 3")
+    for key in ("x", "y"):
+        path = block.get(key)
+        if path is not None and (not isinstance(path, str) or not path):
+            raise TemplateError(f"{owner} 'downsample' {key} must be a non-empty string path")
+    return DownsampleSpec(method=method, target=target, x=block.get("x"), y=block.get("y"))
+
+
+def _parse_order_by(value: Any) -> tuple[SortKey, ...]:
+    """Parse ``orderBy`` terms such as ``"value desc"`` or ``["group", "value desc"]``."""
+
+    if value is None:
+        return ()
+    terms = [value] if isinstance(value, str) else value
+    if not isinstance(terms, list) or not terms:
+        raise TemplateError("Repeat 'orderBy' must be a string or a list of strings")
+    keys: list[SortKey] = []
+    for term in terms:
+        parts = term.split() if isinstance(term, str) else []
+        if len(parts) == 2 and parts[1].lower() in {"asc", "desc"}:
+            keys.append(SortKey(path=parts[0], descending=parts[1].lower() == "desc"))
+        elif len(parts) == 1:
+            keys.append(SortKey(path=parts[0]))
+        else:
+            raise TemplateError(
+                f"Repeat 'orderBy' term {term!r} must be a path optionally followed by 'asc' or 'desc'"
+            )
+    return tuple(keys)
+
+
+def _parse_repeat_count(block: Mapping[str, Any], key: str) -> int | None:
+    value = block.get(key)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise TemplateError(f"Repeat '{key}' must be a non-negative integer")
+    return value
+
+
+def _parse_aggregates(
+    payload: Mapping[str, Any],
+    properties: Mapping[str, Any],
+) -> dict[str, AggregateSpec]:
+    """Convert the optional ``aggregates`` block into :class:`AggregateSpec` entries."""
+
+    block = payload.get("aggregates")
+    if block is None:
+        return {}
+    if not isinstance(block, Mapping):
+        raise TemplateError("'aggregates' must be declared as a mapping of names to definitions")
+
+    aggregates: dict[str, AggregateSpec] = {}
+    for name, entry in block.items():
+        if not isinstance(name, str) or not name.isidentifier():
+            raise TemplateError(f"Aggregate name '{name}' must be a valid identifier")
+        if name in _RESERVED_CONTEXT_NAMES:
+            raise TemplateError(f"Aggregate '{name}' would shadow the built-in context name '{name}'")
+        if name in properties:
+            raise TemplateError(f"Aggregate '{name}' conflicts with a property of the same name")
+        if not isinstance(entry, Mapping):
+            raise TemplateError(f"Aggregate '{name}' must be declared as a mapping")
+        extra_keys = set(entry) - {"op", "field", "groupBy", "items", "q"}
+        if extra_keys:
+            raise TemplateError(
+                f"Aggregate '{name}' only accepts 'op', 'field', 'groupBy', 'items', and 'q'"
+            )
+        op = entry.get("op")
+        if op not in AGGREGATE_OPS:
+            raise TemplateError(
+                f"Aggregate '{name}' requires 'op' to be one of {sorted(AGGREGATE_OPS)}"
+            )
+        field_path = entry.get("field")
+        if field_path is None and op != "count":
+            raise TemplateError(f"Aggregate '{name}' requires a string 'field' path")
+        for key in ("field", "groupBy", "items"):
+            value = entry.get(key)
+            if value is not None and (not isinstance(value, str) or not value):
+                raise TemplateError(f"Aggregate '{name}.{key}' must be a non-empty string path")
+        aggregates[name] = AggregateSpec(
+            op=op,
+            field=field_path,
+            group_by=entry.get("groupBy"),
+            items=entry.get("items"),
+            q=_parse_percentile(name, op, entry.get("q")),
+        )
+    _check_aggregate_cycles(aggregates)
+    return aggregates
+
+
+def _check_aggregate_cycles(aggregates: Mapping[str, AggregateSpec]) -> None:
+    """Reject aggregates whose ``items`` paths lead back to an aggregate already visited."""
+
+    for name in aggregates:
+        seen = [name]
+        current = aggregates[name].items
+        while current is not None:
+            root = next(iter(tokenize_path(current)), None)
+            if root not in aggregates:
+                break
+            if root in seen:
+                chain = " -> ".join([*seen, root])
+                raise TemplateError(f"Aggregates form a cycle through 'items' ({chain})")
+            seen.append(root)
+            current = aggregates[root].items
+
+
+def _parse_percentile(name: str, op: str, value: Any) -> float | tuple[float, ...] | None:
+    if op != "percentile":
+        if value is not None:
+            raise TemplateError(f"Aggregate '{name}.q' is only supported for 'percentile'")
+        return None
+    candidates = value if isinstance(value, list) else [value]
+    if not candidates or not all(
+        isinstance(q, (int, float)) and not isinstance(q, bool) and 0 <= q <= 100
+        for q in candidates
+    ):
+        raise TemplateError(f"Aggregate '{name}.q' must be a number (or list of numbers) between 0 and 100")
+    if isinstance(value, list):
+        return tuple(float(q) for q in candidates)
+    return float(value)
 
 
 def _parse_schema(payload: Mapping[str, Any]) -> MutableMapping[str, Any] | None:
@@ -17,6 +17,35 @@ class CanvasSpec:
     height: float
 
 
+@dataclass(slots=True)
+class AggregateSpec:
+    """Template-level statistic computed once per render over a data collection."""
+
+    op: str
+    field: str | None = None
+    group_by: str | None = None
+    items: str | None = None
+    q: float | tuple[float, ...] | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SortKey:
+    """Single ``orderBy`` term: a dotted path and its direction."""
+
+    path: str
+    descending: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class DownsampleSpec:
+    """Reduction of a long series to roughly ``target`` points before rendering."""
+
+    method: str = "lttb"
+    target: int | None = None
+    x: str | None = None
+    y: str | None = None
+
+
 @dataclass(slots=True)
 class RepeatSpec:
     """Configuration for rendering an element repeatedly over a data collection."""
@@ -24,6 +53,44 @@ class RepeatSpec:
     items: str
     alias: str
     let: Mapping[str, Any] = field(default_factory=dict)
+    where: str | None = None
+    order_by: tuple[SortKey, ...] = ()
+    limit: int | None = None
+    offset: int = 0
+    group_by: str | None = None
+    total: str | None = None
+    downsample: DownsampleSpec | None = None
+
+    @property
+    def has_query(self) -> bool:
+        """Return ``True`` when any selection clause reshapes the collection."""
+
+        return bool(
+            self.where or self.order_by or self.group_by or self.offset or self.limit is not None
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class SimplifySpec:
+    """Geometry simplification applied to a computed coordinate list."""
+
+    method: str = "rdp"
+    tolerance: float = 0.5
+    grid: float | None = None
+    relative: bool = False
+
+
+@dataclass(slots=True)
+class PointSeriesSpec:
+    """Coordinate list attribute (``points`` or ``d``) built from a collection of points."""
+
+    items: str
+    alias: str
+    x: str
+    y: str
+    precision: int | None = 2
+    downsample: DownsampleSpec | None = None
+    simplify: SimplifySpec | None = None
 
 
 @dataclass(slots=True)
@@ -36,6 +103,8 @@ class ElementSpec:
     repeat: RepeatSpec | None = None
     let: Mapping[str, Any] = field(default_factory=dict)
     children: list["ElementSpec"] = field(default_factory=list)
+    when: str | None = None
+    series: Mapping[str, PointSeriesSpec] = field(default_factory=dict)
 
 
 @dataclass(slots=True)
@@ -48,6 +117,7 @@ class TemplateSpec:
     properties: Mapping[str, Any] = field(default_factory=dict)
     schema: Mapping[str, Any] | None = None
     metadata: Mapping[str, Any] = field(default_factory=dict)
+    aggregates: Mapping[str, AggregateSpec] = field(default_factory=dict)
 
     def expected_range(self) -> tuple[int | None, int | None]:
         """Return the expected minimum and maximum item counts for consumers."""
@@ -0,0 +1,82 @@
+"""Compact node representation passed from the renderer to the serialiser."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Any
+
+NodeSpec = dict[str, Any]
+
+
+class Node(Mapping[str, Any]):
+    """Resolved element produced while translating a template.
+
+    Nodes are treated as immutable once built. Attributes are stored as two
+    parallel tuples, ``names`` and ``values``, in declaration order, and
+    children as a tuple of nodes, so a translated tree holds no per-element
+    dicts or lists. :meth:`to_dict` returns the public
+    ``{"type", "attributes", "children", "text"}`` form. Nodes also read like
+    that mapping, but ``node["attributes"]`` is a read-only view and
+    ``node["children"]`` a tuple, so attempts to edit a node fail loudly
+    instead of being lost.
+    """
+
+    __slots__ = ("type", "names", "values", "children", "text")
+
+    type: str
+    names: tuple[str, ...]
+    values: tuple[Any, ...]
+    children: tuple[Node, ...]
+    text: str | None
+
+    def __init__(
+        self,
+        type: str,
+        names: tuple[str, ...] = (),
+        values: tuple[Any, ...] = (),
+        children: tuple[Node, ...] = (),
+        text: str | None = None,
+    ) -> None:
+        self.type = type
+        self.names = names
+        self.values = values
+        self.children = children
+        self.text = text
+
+    def to_dict(self) -> NodeSpec:
+        """Return the node and its descendants as plain node specification dicts."""
+
+        node: NodeSpec = {
+            "type": self.type,
+            "attributes": dict(zip(self.names, self.values)),
+            "children": [child.to_dict() for child in self.children],
+        }
+        if self.text is not None:
+            node["text"] = self.text
+        return node
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "type":
+            return self.type
+        if key == "attributes":
+            return MappingProxyType(dict(zip(self.names, self.values)))
+        if key == "children":
+            return self.children
+        if key == "text" and self.text is not None:
+            return self.text
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield "type"
+        yield "attributes"
+        yield "children"
+        if self.text is not None:
+            yield "text"
+
+    def __len__(self) -> int:
+        return 3 if self.text is None else 4
+
+    def __repr__(self) -> str:
+        attributes = dict(zip(self.names, self.values))
+        return f"Node({self.type!r}, {attributes!r}, children={len(self.children)}, text={self.text!r})"
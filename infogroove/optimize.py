@@ -0,0 +1,846 @@
+"""Optional passes that rewrite translated node specifications before serialisation."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .geometry import SIMPLIFIERS, Subpath, format_path, parse_path, simplify
+from .nodes import NodeSpec
+from .utils import NumberFormat, to_snake_case
+
+NodePass = Callable[[list[NodeSpec]], list[NodeSpec]]
+
+# Presentation properties inherited by descendants (SVG 1.1 "Inherited: yes").
+INHERITED_PROPERTIES = frozenset(
+    {
+        "clip-rule",
+        "color",
+        "fill",
+        "fill-opacity",
+        "fill-rule",
+        "font-family",
+        "font-size",
+        "font-style",
+        "font-variant",
+        "font-weight",
+        "letter-spacing",
+        "stroke",
+        "stroke-dasharray",
+        "stroke-dashoffset",
+        "stroke-linecap",
+        "stroke-linejoin",
+        "stroke-miterlimit",
+        "stroke-opacity",
+        "stroke-width",
+        "text-anchor",
+        "visibility",
+        "word-spacing",
+    }
+)
+COLOUR_PROPERTIES = frozenset({"fill", "stroke", "stop-color", "flood-color", "lighting-color", "color"})
+# Geometry and presentation attributes whose whitespace is insignificant. Free
+# text such as ``aria-label``, ``title``, or ``alt`` is never rewritten.
+WHITESPACE_ATTRIBUTES = (INHERITED_PROPERTIES | COLOUR_PROPERTIES) - {"font-family"} | frozenset(
+    {
+        "d",
+        "points",
+        "transform",
+        "gradient-transform",
+        "pattern-transform",
+        "view-box",
+        "viewBox",
+        "preserve-aspect-ratio",
+        "class",
+        "opacity",
+        "stop-opacity",
+    }
+)
+# Element types referenced by id through ``url(#id)`` or ``href``.
+DEFINITION_TYPES = frozenset({"lineargradient", "radialgradient", "clippath"})
+
+# Non-inherited attributes whose initial value makes them redundant, per element type.
+_POSITION_DEFAULTS = {"x": "0", "y": "0"}
+_ELEMENT_DEFAULTS: dict[str, dict[str, str]] = {
+    "rect": _POSITION_DEFAULTS,
+    "text": _POSITION_DEFAULTS,
+    "use": _POSITION_DEFAULTS,
+    "image": _POSITION_DEFAULTS,
+    "circle": {"cx": "0", "cy": "0"},
+    "ellipse": {"cx": "0", "cy": "0"},
+    "line": {"x1": "0", "y1": "0", "x2": "0", "y2": "0"},
+}
+_GLOBAL_DEFAULTS = {"opacity": "1", "transform": ""}
+
+_HEX6 = re.compile(r"#([0-9a-fA-F]{6})")
+_RGB = re.compile(r"rgb\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_SPACES = re.compile(r" {2,}")
+_URL_REFERENCE = re.compile(r"url\(\s*#([^)\s]+)\s*\)")
+_HREF_ATTRIBUTES = frozenset({"href", "xlink:href"})
+# Colour keywords whose name is shorter than their shortest hex form, and vice versa.
+_HEX_TO_NAME = {
+    "#000080": "navy",
+    "#008080": "teal",
+    "#800000": "maroon",
+    "#800080": "purple",
+    "#808000": "olive",
+    "#808080": "gray",
+    "#a0522d": "sienna",
+    "#a52a2a": "brown",
+    "#c0c0c0": "silver",
+    "#cd853f": "peru",
+    "#d2b48c": "tan",
+    "#da70d6": "orchid",
+    "#dda0dd": "plum",
+    "#ee82ee": "violet",
+    "#f0ffff": "azure",
+    "#f5deb3": "wheat",
+    "#f5f5dc": "beige",
+    "#fa8072": "salmon",
+    "#faf0e6": "linen",
+    "#ff0000": "red",
+    "#ff6347": "tomato",
+    "#ff7f50": "coral",
+    "#ffa500": "orange",
+    "#ffc0cb": "pink",
+    "#ffd700": "gold",
+    "#ffe4c4": "bisque",
+    "#fffafa": "snow",
+    "#fffff0": "ivory",
+    "#4b0082": "indigo",
+    "#f0e68c": "khaki",
+}
+_NAME_TO_HEX = {
+    "black": "#000",
+    "white": "#fff",
+    "yellow": "#ff0",
+    "fuchsia": "#f0f",
+    "magenta": "#f0f",
+    "darkblue": "#00008b",
+    "lightgray": "#d3d3d3",
+    "lightgrey": "#d3d3d3",
+}
+_GROUP_OVERHEAD = len("<g></g>")
+
+
+@dataclass(slots=True)
+class MinifyStats:
+    """Counters accumulated by :class:`Minifier` across every document it processed.
+
+    ``bytes_saved`` is estimated from the serialised form of each changed
+    attribute (`` name="value"``) and of the ``<g>`` wrappers it introduced.
+    """
+
+    attributes_removed: int = 0
+    attributes_hoisted: int = 0
+    colours_shortened: int = 0
+    groups_created: int = 0
+    bytes_saved: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain mapping."""
+
+        return asdict(self)
+
+
+class Minifier:
+    """Node pass that shrinks translated output without changing how it renders.
+
+    The pass normalises whitespace in attribute values and text, shortens
+    colour notations, drops attributes equal to their initial value (or to the
+    value already inherited from an ancestor), and hoists inherited
+    presentation attributes shared by all children of an existing ``g`` onto
+    it (never onto a ``g`` with text of its own). Elements carrying ``class``
+    or ``style`` stop inheritance-based rewrites below them, because
+    stylesheet rules could override the attributes.
+
+    With ``group`` the pass also wraps runs of siblings sharing attributes in
+    new ``g`` elements. That changes the document structure seen by sibling
+    selectors, ``use`` references and scripts, so it is off by default.
+    """
+
+    def __init__(
+        self,
+        *,
+        drop_defaults: bool = True,
+        hoist: bool = True,
+        group: bool = False,
+        shorten_colours: bool = True,
+    ) -> None:
+        self.drop_defaults = drop_defaults
+        self.hoist = hoist
+        self.group = group
+        self.shorten_colours = shorten_colours
+        self.stats = MinifyStats()
+
+    def __call__(self, nodes: list[NodeSpec]) -> list[NodeSpec]:
+        result = [self._minify_node(node, {}, preserve_space=False) for node in nodes]
+        return self._group_runs(result) if self.group else result
+
+    def _minify_node(
+        self,
+        node: NodeSpec,
+        inherited: Mapping[str, str] | None,
+        *,
+        preserve_space: bool,
+    ) -> NodeSpec:
+        element_type = str(node.get("type", "")).lower()
+        attributes = node.get("attributes") or {}
+        minified: dict[str, Any] = {}
+        stats = self.stats
+        for key, value in attributes.items():
+            if not isinstance(value, str) or str(key).startswith("data-"):
+                minified[key] = value
+                continue
+            name = canonical_attribute_name(str(key))
+            collapse = not preserve_space and name in WHITESPACE_ATTRIBUTES
+            new_value = _collapse_whitespace(value) if collapse else value
+            if self.shorten_colours and name in COLOUR_PROPERTIES:
+                shortened = shorten_colour(new_value)
+                if shortened != new_value:
+                    stats.colours_shortened += 1
+                    new_value = shortened
+            if self.drop_defaults and self._is_redundant(element_type, name, new_value, inherited):
+                stats.attributes_removed += 1
+                stats.bytes_saved += attribute_size(name, value)
+                continue
+            stats.bytes_saved += attribute_size(name, value) - attribute_size(name, new_value)
+            minified[key] = new_value
+
+        result = dict(node)
+        result["attributes"] = minified
+        preserve_space = preserve_space or minified.get("xml:space") == "preserve"
+        text = node.get("text")
+        if isinstance(text, str) and not preserve_space:
+            collapsed = _collapse_text(text)
+            stats.bytes_saved += _size(text) - _size(collapsed)
+            result["text"] = collapsed
+
+        children = node.get("children")
+        if children:
+            child_inherited = _child_inheritance(inherited, minified)
+            minified_children = [
+                self._minify_node(child, child_inherited, preserve_space=preserve_space)
+                for child in children
+            ]
+            # Text embedded in the group would inherit the hoisted attributes too.
+            if self.hoist and element_type == "g" and child_inherited is not None and not text:
+                self._hoist_into(minified, minified_children)
+            if self.group and element_type == "g" and child_inherited is not None:
+                minified_children = self._group_runs(minified_children)
+            result["children"] = minified_children
+        return result
+
+    def _is_redundant(
+        self,
+        element_type: str,
+        name: str,
+        value: str,
+        inherited: Mapping[str, str] | None,
+    ) -> bool:
+        if name in INHERITED_PROPERTIES:
+            if inherited is None or name not in inherited:
+                return False
+            return _equivalent(value, inherited[name])
+        default = _GLOBAL_DEFAULTS.get(name)
+        if default is None:
+            default = _ELEMENT_DEFAULTS.get(element_type, {}).get(name)
+        return default is not None and _equivalent(value, default)
+
+    def _hoist_into(self, attributes: dict[str, Any], children: list[NodeSpec]) -> None:
+        """Move inherited attributes shared by every child onto their ``g`` parent."""
+
+        common = _shared_inherited(children)
+        for name, value in common.items():
+            removed = _remove_attribute(children, name)
+            current = _find_attribute(attributes, name)
+            if current is not None:
+                del attributes[current]
+            attributes[name] = value
+            self.stats.attributes_hoisted += len(children)
+            self.stats.bytes_saved += removed - attribute_size(name, value)
+
+    def _group_runs(self, nodes: list[NodeSpec]) -> list[NodeSpec]:
+        """Wrap consecutive siblings sharing inherited attributes in a new ``g`` when it pays off."""
+
+        grouped: list[NodeSpec] = []
+        index = 0
+        while index < len(nodes):
+            common = _inherited_attributes(nodes[index])
+            end = index + 1
+            while common and end < len(nodes):
+                candidate = _intersect(common, _inherited_attributes(nodes[end]))
+                if not candidate:
+                    break
+                common = candidate
+                end += 1
+            run = nodes[index:end]
+            savings = (len(run) - 1) * sum(attribute_size(name, value) for name, value in common.items())
+            if len(run) > 1 and savings > _GROUP_OVERHEAD:
+                for name in common:
+                    _remove_attribute(run, name)
+                grouped.append({"type": "g", "attributes": dict(common), "children": run})
+                self.stats.groups_created += 1
+                self.stats.attributes_hoisted += len(run) * len(common)
+                self.stats.bytes_saved += savings - _GROUP_OVERHEAD
+            else:
+                grouped.extend(run)
+            index = end
+        return grouped
+
+
+def canonical_attribute_name(key: str) -> str:
+    """Return the serialised (kebab-case) name for a template attribute key."""
+
+    if ":" in key:
+        return key
+    return to_snake_case(key.replace("-", "_")).rstrip("_").replace("_", "-")
+
+
+def shorten_colour(value: str) -> str:
+    """Return the shortest equivalent spelling of a colour value."""
+
+    lowered = value.strip().lower()
+    match = _RGB.fullmatch(lowered)
+    if match:
+        channels = [int(channel) for channel in match.groups()]
+        if all(channel <= 255 for channel in channels):
+            lowered = "#" + "".join(f"{channel:02x}" for channel in channels)
+    lowered = _NAME_TO_HEX.get(lowered, lowered)
+    if _HEX6.fullmatch(lowered):
+        name = _HEX_TO_NAME.get(lowered)
+        if name is not None:
+            return name
+        if lowered[1] == lowered[2] and lowered[3] == lowered[4] and lowered[5] == lowered[6]:
+            return f"#{lowered[1]}{lowered[3]}{lowered[5]}"
+        return lowered
+    if lowered.startswith("#") or lowered in _HEX_TO_NAME.values():
+        return lowered
+    return value
+
+
+def attribute_size(name: str, value: str) -> int:
+    """Return the serialised byte size of `` name="value"``."""
+
+    return _size(name) + _size(value) + 4
+
+
+def _size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _collapse_whitespace(value: str) -> str:
+    return _WHITESPACE.sub(" ", value) if "  " in value or "\n" in value or "\t" in value else value
+
+
+def _collapse_text(value: str) -> str:
+    """Apply ``xml:space="default"`` handling: drop newlines, turn tabs into spaces, merge spaces."""
+
+    if "\n" in value or "\r" in value:
+        value = value.replace("\r", "").replace("\n", "")
+    if "\t" in value:
+        value = value.replace("\t", " ")
+    return _SPACES.sub(" ", value) if "  " in value else value
+
+
+def _equivalent(value: str, reference: str) -> bool:
+    if value == reference:
+        return True
+    try:
+        return float(value) == float(reference)
+    except ValueError:
+        return False
+
+
+def _child_inheritance(
+    inherited: Mapping[str, str] | None,
+    attributes: Mapping[str, Any],
+) -> dict[str, str] | None:
+    """Return the attribute-level inheritance seen by children, or ``None`` when unknown."""
+
+    if inherited is None or attributes.get("class") is not None or attributes.get("style") is not None:
+        return None
+    merged = dict(inherited)
+    merged.update(_inherited_from(attributes))
+    return merged
+
+
+def _inherited_from(attributes: Mapping[str, Any]) -> dict[str, str]:
+    found: dict[str, str] = {}
+    for key, value in attributes.items():
+        name = canonical_attribute_name(str(key))
+        if name in INHERITED_PROPERTIES and isinstance(value, str):
+            found[name] = value
+    return found
+
+
+def _inherited_attributes(node: NodeSpec) -> dict[str, str]:
+    return _inherited_from(node.get("attributes") or {})
+
+
+def _intersect(left: Mapping[str, str], right: Mapping[str, str]) -> dict[str, str]:
+    return {name: value for name, value in left.items() if right.get(name) == value}
+
+
+def _shared_inherited(children: list[NodeSpec]) -> dict[str, str]:
+    if not children:
+        return {}
+    common = _inherited_attributes(children[0])
+    for child in children[1:]:
+        common = _intersect(common, _inherited_attributes(child))
+        if not common:
+            break
+    return common
+
+
+def _find_attribute(attributes: Mapping[str, Any], name: str) -> str | None:
+    for key in attributes:
+        if canonical_attribute_name(str(key)) == name:
+            return key
+    return None
+
+
+def _remove_attribute(nodes: list[NodeSpec], name: str) -> int:
+    """Remove ``name`` from every node's attributes and return the bytes removed."""
+
+    removed = 0
+    for node in nodes:
+        attributes = node["attributes"]
+        key = _find_attribute(attributes, name)
+        if key is not None:
+            removed += attribute_size(name, attributes.pop(key))
+    return removed
+
+
+@dataclass(slots=True)
+class InstanceStats:
+    """Counters accumulated by :class:`Instancer` across every document it processed."""
+
+    symbols_created: int = 0
+    instances_replaced: int = 0
+    bytes_saved: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain mapping."""
+
+        return asdict(self)
+
+
+class Instancer:
+    """Node pass that emits repeated identical subtrees once and references them with ``use``.
+
+    Subtrees are compared structurally, ignoring the ``transform`` of the
+    subtree root, so copies that differ only in placement (icons, markers,
+    card backgrounds translated per item) collapse onto one ``symbol`` in a
+    leading ``defs`` element. Each copy becomes
+    ``<use href="#id" transform="..."/>``. A subtree is instanced only when it
+    occurs at least ``min_count`` times and the estimated markup shrinks; the
+    outermost qualifying subtree wins, so nested repeats are not instanced
+    twice. Symbols get ``overflow="visible"`` so content at negative
+    coordinates is not clipped by the symbol viewport.
+    """
+
+    def __init__(self, *, min_count: int = 2, prefix: str = "ig-sym-") -> None:
+        if min_count < 2:
+            raise ValueError("min_count must be at least 2")
+        self.min_count = min_count
+        self.prefix = prefix
+        self.stats = InstanceStats()
+
+    def __call__(self, nodes: list[NodeSpec]) -> list[NodeSpec]:
+        keys: dict[int, tuple[Any, ...]] = {}
+        counts: dict[tuple[Any, ...], int] = {}
+        sizes: dict[tuple[Any, ...], int] = {}
+        used_ids: set[str] = set()
+        pinned: set[tuple[Any, ...]] = set()
+        for node in nodes:
+            _index_subtree(node, keys, counts, sizes, used_ids, pinned)
+
+        symbols: dict[tuple[Any, ...], str] = {}
+        definitions: list[NodeSpec] = []
+        allocator = _IdAllocator(self.prefix, used_ids)
+
+        def rewrite(node: NodeSpec) -> NodeSpec:
+            key = keys[id(node)]
+            element_type = key[0]
+            if (
+                element_type not in _NOT_INSTANCEABLE
+                and key not in pinned
+                and self._worth_instancing(counts[key], sizes[key])
+            ):
+                symbol_id = symbols.get(key)
+                if symbol_id is None:
+                    symbol_id = symbols[key] = allocator.next()
+                    definitions.append(_symbol_for(node, symbol_id))
+                    self.stats.symbols_created += 1
+                    self.stats.bytes_saved -= sizes[key] + _SYMBOL_OVERHEAD + len(symbol_id)
+                self.stats.instances_replaced += 1
+                self.stats.bytes_saved += sizes[key] - _USE_OVERHEAD - len(symbol_id)
+                return _use_for(node, symbol_id)
+            children = node.get("children")
+            if not children or element_type != "g":
+                return node
+            result = dict(node)
+            result["children"] = [rewrite(child) for child in children]
+            return result
+
+        rewritten = [rewrite(node) for node in nodes]
+        if not definitions:
+            return rewritten
+        return [{"type": "defs", "attributes": {}, "children": definitions}, *rewritten]
+
+    def _worth_instancing(self, count: int, size: int) -> bool:
+        if count < self.min_count:
+            return False
+        expanded = count * size
+        instanced = size + _SYMBOL_OVERHEAD + count * _USE_OVERHEAD
+        return instanced < expanded
+
+
+_SYMBOL_OVERHEAD = len('<symbol id="" overflow="visible"></symbol>')
+_USE_OVERHEAD = len('<use href="#"/>')
+_TAG_OVERHEAD = len("<></>")
+# Definitions, text fragments, and existing references must stay where they are.
+_NOT_INSTANCEABLE = frozenset(
+    {"defs", "symbol", "use", "clippath", "lineargradient", "radialgradient", "stop", "tspan"}
+)
+
+
+class _IdAllocator:
+    __slots__ = ("_prefix", "_taken", "_counter")
+
+    def __init__(self, prefix: str, taken: set[str]) -> None:
+        self._prefix = prefix
+        self._taken = taken
+        self._counter = 0
+
+    def next(self) -> str:
+        while True:
+            candidate = f"{self._prefix}{self._counter}"
+            self._counter += 1
+            if candidate not in self._taken:
+                self._taken.add(candidate)
+                return candidate
+
+
+def _index_subtree(
+    node: NodeSpec,
+    keys: dict[int, tuple[Any, ...]],
+    counts: dict[tuple[Any, ...], int],
+    sizes: dict[tuple[Any, ...], int],
+    used_ids: set[str],
+    pinned: set[tuple[Any, ...]],
+) -> tuple[Any, ...]:
+    """Record the structural key of ``node`` and all descendants; return the full key of ``node``.
+
+    The key used for instancing ignores the root ``transform``; the returned
+    key (used by the parent) includes it, because a child's placement is part
+    of its parent's structure. Keys of subtrees declaring an ``id`` are added
+    to ``pinned`` so referenced elements are never moved into a symbol.
+    """
+
+    attributes = node.get("attributes") or {}
+    element_id = attributes.get("id")
+    if isinstance(element_id, str):
+        used_ids.add(element_id)
+    child_keys = tuple(
+        _index_subtree(child, keys, counts, sizes, used_ids, pinned) for child in node.get("children") or ()
+    )
+    frozen = tuple(
+        sorted((str(name), _freeze(value)) for name, value in attributes.items() if value is not None)
+    )
+    text = node.get("text")
+    placement = tuple(item for item in frozen if item[0] == "transform")
+    body = tuple(item for item in frozen if item[0] != "transform")
+    key = (str(node.get("type", "")).lower(), body, text, child_keys)
+    keys[id(node)] = key
+    if element_id is not None or any(child_key[0] in pinned for child_key in child_keys):
+        pinned.add(key)
+    counts[key] = counts.get(key, 0) + 1
+    if key not in sizes:
+        sizes[key] = _estimate_size(node)
+    return (key, placement)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(name), _freeze(item)) for name, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value if isinstance(value, (str, int, float, bool)) else repr(value)
+
+
+def _estimate_size(node: NodeSpec) -> int:
+    """Approximate serialised size of ``node`` excluding its ``transform``."""
+
+    size = _TAG_OVERHEAD + 2 * len(str(node.get("type", "")))
+    for name, value in (node.get("attributes") or {}).items():
+        if name != "transform" and value is not None:
+            size += attribute_size(str(name), str(value))
+    text = node.get("text")
+    if text is not None:
+        size += _size(str(text))
+    for child in node.get("children") or ():
+        size += _estimate_size(child)
+    return size
+
+
+def _symbol_for(node: NodeSpec, symbol_id: str) -> NodeSpec:
+    body = dict(node)
+    attributes = node.get("attributes") or {}
+    body["attributes"] = {name: value for name, value in attributes.items() if name != "transform"}
+    if body["type"] == "g" and not body["attributes"] and not body.get("text"):
+        children = list(node.get("children") or [])
+    else:
+        children = [body]
+    return {"type": "symbol", "attributes": {"id": symbol_id, "overflow": "visible"}, "children": children}
+
+
+def _use_for(node: NodeSpec, symbol_id: str) -> NodeSpec:
+    attributes: dict[str, Any] = {"href": f"#{symbol_id}"}
+    transform = (node.get("attributes") or {}).get("transform")
+    if transform is not None:
+        attributes["transform"] = transform
+    return {"type": "use", "attributes": attributes, "children": []}
+
+
+@dataclass(slots=True)
+class DefsStats:
+    """Counters accumulated by :class:`DefsInterner` across every document it processed."""
+
+    definitions_kept: int = 0
+    definitions_removed: int = 0
+    references_rewritten: int = 0
+    bytes_saved: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain mapping."""
+
+        return asdict(self)
+
+
+class DefsInterner:
+    """Node pass that keeps one copy of each distinct definition in a single top-level ``defs``.
+
+    Gradients and clip paths carrying an ``id`` are collected from anywhere in
+    the tree, keyed by their content (everything except the ``id``), and the
+    first definition of each distinct content is kept. ``url(#id)`` and
+    ``href="#id"`` references are rewritten to the surviving ids. A later
+    definition reusing an id that was already defined is dropped, matching
+    how documents resolve duplicate ids to the first element. ``defs``
+    elements left empty are removed.
+    """
+
+    def __init__(self, *, types: Iterable[str] = DEFINITION_TYPES) -> None:
+        self.types = frozenset(element_type.lower() for element_type in types)
+        self.stats = DefsStats()
+
+    def __call__(self, nodes: list[NodeSpec]) -> list[NodeSpec]:
+        aliases: dict[str, str] = {}
+        canonical: dict[tuple[Any, ...], str] = {}
+        kept: list[NodeSpec] = []
+        remaining = self._extract(nodes, aliases, canonical, kept)
+        if not kept:
+            return nodes
+        rewritten = [self._rewrite(node, aliases) for node in remaining]
+        if rewritten and rewritten[0].get("type") == "defs" and not rewritten[0].get("attributes"):
+            head = dict(rewritten[0])
+            head["children"] = [*kept, *head.get("children", [])]
+            return [head, *rewritten[1:]]
+        return [{"type": "defs", "attributes": {}, "children": kept}, *rewritten]
+
+    def _extract(
+        self,
+        nodes: Iterable[NodeSpec],
+        aliases: dict[str, str],
+        canonical: dict[tuple[Any, ...], str],
+        kept: list[NodeSpec],
+    ) -> list[NodeSpec]:
+        """Remove identified definitions from ``nodes``, recording which id each one maps to."""
+
+        remaining: list[NodeSpec] = []
+        stats = self.stats
+        for node in nodes:
+            element_type = str(node.get("type", "")).lower()
+            definition_id = (node.get("attributes") or {}).get("id")
+            if element_type in self.types and isinstance(definition_id, str):
+                if definition_id not in aliases:
+                    definition = self._rewrite(node, aliases)
+                    key = _content_key(definition)
+                    existing = canonical.get(key)
+                    if existing is None:
+                        canonical[key] = aliases[definition_id] = definition_id
+                        kept.append(definition)
+                        stats.definitions_kept += 1
+                        continue
+                    aliases[definition_id] = existing
+                stats.definitions_removed += 1
+                stats.bytes_saved += _estimate_size(node)
+                continue
+            children = node.get("children")
+            if children:
+                node = dict(node)
+                node["children"] = self._extract(children, aliases, canonical, kept)
+                if element_type == "defs" and not node["children"] and not node.get("attributes"):
+                    stats.bytes_saved += _TAG_OVERHEAD + 2 * len("defs")
+                    continue
+            remaining.append(node)
+        return remaining
+
+    def _rewrite(self, node: NodeSpec, aliases: Mapping[str, str]) -> NodeSpec:
+        """Return ``node`` with every id reference resolved through ``aliases``."""
+
+        attributes = node.get("attributes") or {}
+        updated: dict[str, Any] | None = None
+        for name, value in attributes.items():
+            if not isinstance(value, str) or "#" not in value:
+                continue
+            replaced = self._replace_references(str(name), value, aliases)
+            if replaced != value:
+                if updated is None:
+                    updated = dict(attributes)
+                updated[name] = replaced
+        children = node.get("children")
+        rewritten_children = [self._rewrite(child, aliases) for child in children] if children else None
+        if updated is None and rewritten_children is None:
+            return node
+        result = dict(node)
+        if updated is not None:
+            result["attributes"] = updated
+        if rewritten_children is not None:
+            result["children"] = rewritten_children
+        return result
+
+    def _replace_references(self, name: str, value: str, aliases: Mapping[str, str]) -> str:
+        if name in _HREF_ATTRIBUTES and value.startswith("#"):
+            target = aliases.get(value[1:])
+            if target is not None and target != value[1:]:
+                self.stats.references_rewritten += 1
+                self.stats.bytes_saved += len(value) - 1 - len(target)
+                return f"#{target}"
+            return value
+
+        def substitute(match: re.Match[str]) -> str:
+            reference = match.group(1)
+            target = aliases.get(reference)
+            if target is None or target == reference:
+                return match.group(0)
+            self.stats.references_rewritten += 1
+            self.stats.bytes_saved += len(reference) - len(target)
+            return f"url(#{target})"
+
+        return _URL_REFERENCE.sub(substitute, value)
+
+
+def _content_key(node: NodeSpec, *, root: bool = True) -> tuple[Any, ...]:
+    attributes = node.get("attributes") or {}
+    frozen = tuple(
+        sorted(
+            (str(name), _freeze(value))
+            for name, value in attributes.items()
+            if value is not None and not (root and name == "id")
+        )
+    )
+    children = tuple(_content_key(child, root=False) for child in node.get("children") or ())
+    return (str(node.get("type", "")).lower(), frozen, node.get("text"), children)
+
+
+@dataclass(slots=True)
+class SimplifyStats:
+    """Counters accumulated by :class:`PathSimplifier` across every document it processed."""
+
+    shapes_simplified: int = 0
+    vertices_before: int = 0
+    vertices_after: int = 0
+    bytes_saved: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain mapping."""
+
+        return asdict(self)
+
+
+class PathSimplifier:
+    """Node pass that simplifies straight-segment geometry already present in the tree.
+
+    ``path`` data made of ``M``/``L``/``H``/``V``/``Z`` commands and the
+    ``points`` of ``polyline``/``polygon`` elements are simplified with
+    :func:`~infogroove.geometry.simplify`, rounded to ``precision`` decimals,
+    and paths are re-emitted with relative commands when ``relative`` is set.
+    Paths with curves or arcs, and rewrites that would not be shorter, are left
+    unchanged.
+    """
+
+    def __init__(
+        self,
+        *,
+        tolerance: float = 0.5,
+        method: str = "rdp",
+        grid: float | None = None,
+        relative: bool = True,
+        precision: int = 2,
+    ) -> None:
+        if method not in SIMPLIFIERS:
+            raise ValueError(f"method must be one of {sorted(SIMPLIFIERS)}")
+        self.tolerance = tolerance
+        self.method = method
+        self.grid = grid
+        self.relative = relative
+        self._format = NumberFormat(decimals=precision).formatter()
+        self.stats = SimplifyStats()
+
+    def __call__(self, nodes: list[NodeSpec]) -> list[NodeSpec]:
+        return [self._visit(node) for node in nodes]
+
+    def _visit(self, node: NodeSpec) -> NodeSpec:
+        element_type = str(node.get("type", "")).lower()
+        attributes = node.get("attributes") or {}
+        result = node
+        name = "d" if element_type == "path" else "points" if element_type in _POINT_ELEMENTS else None
+        value = attributes.get(name) if name else None
+        if isinstance(value, str):
+            rewritten = self._simplify_path(value) if name == "d" else self._simplify_points(value)
+            if rewritten is not None and len(rewritten) < len(value):
+                self.stats.shapes_simplified += 1
+                self.stats.bytes_saved += _size(value) - _size(rewritten)
+                result = dict(node)
+                result["attributes"] = {**attributes, name: rewritten}
+        children = node.get("children")
+        if children:
+            if result is node:
+                result = dict(node)
+            result["children"] = [self._visit(child) for child in children]
+        return result
+
+    def _simplify_path(self, data: str) -> str | None:
+        subpaths = parse_path(data)
+        if not subpaths:
+            return None
+        simplified = [
+            Subpath(*self._simplify(subpath.xs, subpath.ys), closed=subpath.closed) for subpath in subpaths
+        ]
+        return format_path(simplified, self._format, relative=self.relative)
+
+    def _simplify_points(self, points: str) -> str | None:
+        try:
+            numbers = [float(token) for token in _NUMBER.findall(points)]
+        except ValueError:
+            return None
+        if len(numbers) % 2:
+            return None
+        xs, ys = self._simplify(numbers[0::2], numbers[1::2])
+        fmt = self._format
+        return " ".join(f"{fmt(x)},{fmt(y)}" for x, y in zip(xs, ys))
+
+    def _simplify(self, xs: list[float], ys: list[float]) -> tuple[list[float], list[float]]:
+        self.stats.vertices_before += len(xs)
+        xs, ys = simplify(xs, ys, method=self.method, tolerance=self.tolerance, grid=self.grid)
+        self.stats.vertices_after += len(xs)
+        return xs, ys
+
+
+_POINT_ELEMENTS = frozenset({"polyline", "polygon"})
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
@@ -0,0 +1,176 @@
+"""Opt-in profiling of element, binding, and placeholder evaluation."""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable
+
+from .formula import ExpressionStatsTable, _evaluate_with_backend
+
+ELEMENT = "element"
+LET = "let"
+PLACEHOLDER = "placeholder"
+WHERE = "where"
+
+_REPEAT_INDEX_PATTERN = re.compile(r"(?<=\])\[\d+\]")
+
+
+@dataclass(slots=True)
+class ProfileEntry:
+    """Accumulated timings for a single element path, binding, or placeholder."""
+
+    kind: str
+    label: str
+    calls: int = 0
+    total: float = 0.0
+    backends: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean(self) -> float:
+        """Average wall time per call in seconds."""
+
+        return self.total / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of the entry."""
+
+        return {
+            "kind": self.kind,
+            "label": self.label,
+            "calls": self.calls,
+            "total_seconds": self.total,
+            "mean_seconds": self.mean,
+            "backends": dict(self.backends),
+        }
+
+
+class RenderProfiler:
+    """Collect per-element, per-binding, and per-placeholder render timings.
+
+    Labels reuse the element paths computed by the renderer (for example
+    ``template[0].children[2]``) with repeat indices removed, so every
+    iteration of a repeated element accumulates into a single entry. Element
+    timings are inclusive of children, and binding timings include any
+    dependent bindings resolved on demand. The ``evaluate_*`` methods accept
+    the renderer's :class:`~infogroove.formula.ExpressionStatsTable` as
+    ``stats`` so profiling never changes how expressions are routed.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._entries: dict[tuple[str, str], ProfileEntry] = {}
+
+    def reset(self) -> None:
+        """Discard all recorded timings."""
+
+        self._entries.clear()
+
+    def clock(self) -> float:
+        """Return the current reading of the profiler clock."""
+
+        return self._clock()
+
+    def record(self, kind: str, label: str, elapsed: float, backend: str | None = None) -> None:
+        """Accumulate ``elapsed`` seconds for the entry identified by ``kind`` and ``label``."""
+
+        key = (kind, _REPEAT_INDEX_PATTERN.sub("", label))
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = ProfileEntry(kind=key[0], label=key[1])
+        entry.calls += 1
+        entry.total += elapsed
+        if backend is not None:
+            entry.backends[backend] = entry.backends.get(backend, 0) + 1
+
+    def evaluate_binding(
+        self,
+        expression: str,
+        context: Mapping[str, Any],
+        *,
+        label: str | None = None,
+        stats: ExpressionStatsTable | None = None,
+    ) -> Any:
+        """Evaluate a ``let`` expression while recording its timing and backend."""
+
+        return self._timed(LET, label or expression, expression, context, label, stats)
+
+    def evaluate_filter(
+        self,
+        expression: str,
+        context: Mapping[str, Any],
+        *,
+        label: str | None = None,
+        stats: ExpressionStatsTable | None = None,
+    ) -> Any:
+        """Evaluate a repeat ``where`` predicate while recording its timing and backend."""
+
+        return self._timed(WHERE, label or expression, expression, context, label, stats)
+
+    def evaluate_placeholder(
+        self,
+        expression: str,
+        context: Mapping[str, Any],
+        *,
+        label: str | None = None,
+        stats: ExpressionStatsTable | None = None,
+    ) -> Any:
+        """Evaluate a ``{placeholder}`` expression while recording its timing and backend."""
+
+        key = f"{label} {{{expression}}}" if label else f"{{{expression}}}"
+        return self._timed(PLACEHOLDER, key, expression, context, label, stats)
+
+    def entries(self, kind: str | None = None) -> list[ProfileEntry]:
+        """Return recorded entries sorted by total time, slowest first."""
+
+        selected = [
+            entry for entry in self._entries.values() if kind is None or entry.kind == kind
+        ]
+        return sorted(selected, key=lambda entry: (-entry.total, entry.kind, entry.label))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the profile as a JSON-serialisable mapping."""
+
+        return {"entries": [entry.as_dict() for entry in self.entries()]}
+
+    def write_json(self, handle: IO[str]) -> None:
+        """Serialise the profile as JSON into ``handle``."""
+
+        json.dump(self.as_dict(), handle, ensure_ascii=False, indent=2)
+        handle.write("\n")
+
+    def format_report(self, limit: int | None = None) -> str:
+        """Return a plain-text table of the slowest entries."""
+
+        entries = self.entries()
+        if limit is not None:
+            entries = entries[:limit]
+        lines = [f"{'kind':<12}{'calls':>8}{'total ms':>12}{'mean us':>12}  {'backends':<18}label"]
+        for entry in entries:
+            backends = ",".join(f"{name}={count}" for name, count in sorted(entry.backends.items()))
+            lines.append(
+                f"{entry.kind:<12}{entry.calls:>8}{entry.total * 1e3:>12.3f}"
+                f"{entry.mean * 1e6:>12.1f}  {backends or '-':<18}{entry.label}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def _timed(
+        self,
+        kind: str,
+        key: str,
+        expression: str,
+        context: Mapping[str, Any],
+        label: str | None,
+        stats: ExpressionStatsTable | None,
+    ) -> Any:
+        start = self._clock()
+        try:
+            value, backend = _evaluate_with_backend(expression, context, label=label, stats=stats)
+        except Exception:
+            self.record(kind, key, self._clock() - start, "error")
+            raise
+        self.record(kind, key, self._clock() - start, backend)
+        return value
@@ -0,0 +1,120 @@
+"""Selection clauses (``where``, ``groupBy``, ``orderBy``, ``offset``/``limit``) for repeat blocks."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any, Callable
+
+from .exceptions import RenderError
+from .models import RepeatSpec
+from .utils import compile_path
+
+_MISSING = object()
+
+
+class RepeatQuery:
+    """Compiled selection clauses of a single repeat block.
+
+    Key paths are tokenised once when the query is built. Clauses run in the
+    order ``where`` → ``groupBy`` → ``orderBy`` → ``offset``/``limit``; sorting
+    combined with a limit keeps only the top ``offset + limit`` entries in a
+    heap instead of sorting the whole collection.
+    """
+
+    __slots__ = ("_repeat", "_group_key", "_sort_keys", "_uniform_direction")
+
+    def __init__(self, repeat: RepeatSpec) -> None:
+        self._repeat = repeat
+        self._group_key = _safe_getter(repeat.group_by) if repeat.group_by else None
+        self._sort_keys = [(_safe_getter(key.path), key.descending) for key in repeat.order_by]
+        directions = {descending for _, descending in self._sort_keys}
+        self._uniform_direction = directions.pop() if len(directions) == 1 else None
+
+    def apply(
+        self,
+        items: Iterable[Any],
+        predicate: Callable[[Any], bool] | None = None,
+    ) -> list[Any]:
+        """Return the items that survive every clause, in their final order."""
+
+        repeat = self._repeat
+        if predicate is not None:
+            items = filter(predicate, items)
+        if self._group_key is not None:
+            items = self._group(items)
+
+        stop = None if repeat.limit is None else repeat.offset + repeat.limit
+        try:
+            if self._sort_keys:
+                items = self._sort(items, stop)
+        except TypeError as exc:
+            raise RenderError(
+                f"Unable to order repeat items at '{repeat.items}': values are not comparable"
+            ) from exc
+        return list(islice(items, repeat.offset, stop))
+
+    def _group(self, items: Iterable[Any]) -> list[dict[str, Any]]:
+        groups: dict[Any, list[Any]] = {}
+        getter = self._group_key
+        for item in items:
+            key = getter(item)  # type: ignore[misc]
+            if key is _MISSING:
+                key = None
+            try:
+                bucket = groups.get(key)
+            except TypeError as exc:
+                repeat = self._repeat
+                raise RenderError(
+                    f"Unable to group repeat items at '{repeat.items}': groupBy '{repeat.group_by}' "
+                    f"resolved to an unhashable {type(key).__name__} value"
+                ) from exc
+            if bucket is None:
+                bucket = groups[key] = []
+            bucket.append(item)
+        return [{"key": key, "items": members, "count": len(members)} for key, members in groups.items()]
+
+    def _sort(self, items: Iterable[Any], stop: int | None) -> list[Any]:
+        descending = self._uniform_direction
+        if descending is not None:
+            key = self._sort_key(descending)
+            if stop is not None:
+                select = heapq.nlargest if descending else heapq.nsmallest
+                return select(stop, items, key=key)
+            return sorted(items, key=key, reverse=descending)
+
+        ordered = list(items)
+        for getter, term_descending in reversed(self._sort_keys):
+            ordered.sort(key=_term_key(getter, term_descending), reverse=term_descending)
+        return ordered
+
+    def _sort_key(self, descending: bool) -> Callable[[Any], tuple[Any, ...]]:
+        terms = [_term_key(getter, descending) for getter, _ in self._sort_keys]
+        if len(terms) == 1:
+            return terms[0]
+        return lambda item: tuple(term(item) for term in terms)
+
+
+def _term_key(getter: Callable[[Any], Any], descending: bool) -> Callable[[Any], tuple[bool, Any]]:
+    """Return a sort key that places missing values last in either direction."""
+
+    def key(item: Any) -> tuple[bool, Any]:
+        value = getter(item)
+        if value is _MISSING or value is None:
+            return (not descending, None)
+        return (descending, value)
+
+    return key
+
+
+def _safe_getter(path: str) -> Callable[[Any], Any]:
+    resolver = compile_path(path)
+
+    def getter(item: Any) -> Any:
+        try:
+            return resolver(item)
+        except (KeyError, IndexError, TypeError, ValueError):
+            return _MISSING
+
+    return getter
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import gzip
+import os
+from collections import ChainMap
+from collections.abc import Iterable, Mapping, Sequence, Sized
 from dataclasses import dataclass
+from functools import partial
 from inspect import signature
-from typing import Any, Callable, Iterator
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Iterator
 
-from jsonschema import ValidationError as JSONSchemaValidationError
 from jsonschema import SchemaError
-from jsonschema import validate as validate_jsonschema
+from jsonschema.exceptions import best_match
+from jsonschema.validators import extend as extend_validator
+from jsonschema.validators import validator_for
 
 from svg import (
     Circle,
@@ -26,24 +32,51 @@ from svg import (
     Rect,
     SVG,
     Stop,
+    Symbol,
     TSpan,
     Text,
+    Use,
 )
 
+from .aggregates import compute_aggregates
+from .columns import Columns, to_python
+from .downsample import downsample_items
 from .exceptions import DataValidationError, RenderError
-from .formula import evaluate_expression
-from .models import ElementSpec, RepeatSpec, TemplateSpec
+from .formula import ExpressionStatsTable
+from .geometry import BOUNDED_ATTRIBUTES, shape_bounds
+from .hooks import RenderHooks
+from .models import (
+    AggregateSpec,
+    DownsampleSpec,
+    ElementSpec,
+    PointSeriesSpec,
+    RepeatSpec,
+    TemplateSpec,
+)
+from .nodes import Node, NodeSpec
+from .optimize import NodePass
+from .profiling import ELEMENT, RenderProfiler
+from .query import RepeatQuery
+from .series import PointSeries
 from .utils import (
     MappingAdapter,
+    NumberFormat,
     PLACEHOLDER_PATTERN,
     ensure_accessible,
     fill_placeholders,
+    find_identifier_tokens,
     resolve_path,
     stringify,
     to_snake_case,
+    tokenize_path,
+    unwrap_adapter,
 )
 
-NodeSpec = dict[str, Any]
+# Visible area as ``(left, top, right, bottom)`` in canvas coordinates, margin included.
+Viewport = tuple[float, float, float, float]
+
+_COMPRESSED_SUFFIXES = (".svgz", ".gz")
+_WRITE_CHUNK = 1 << 16
 
 
 @dataclass(slots=True, frozen=True)
@@ -76,25 +109,407 @@ SUPPORTED_ELEMENTS = {
     "radialgradient": RadialGradient,
     "stop": Stop,
     "tspan": TSpan,
+    "symbol": Symbol,
+    "use": Use,
 }
 
 
-def _builtin_node_renderer(payload: RendererInput, _: Mapping[str, Any]) -> list[NodeSpec]:
-    node: NodeSpec = {
-        "type": payload.type,
-        "attributes": dict(payload.attributes),
-        "children": [child for child in payload.children],
-    }
-    if payload.text is not None:
-        node["text"] = stringify(payload.text)
-    return [node]
+def _builtin_node_renderer(payload: RendererInput, _: Mapping[str, Any]) -> list[Node]:
+    text = stringify(payload.text) if payload.text is not None else None
+    attributes = payload.attributes
+    return [Node(payload.type, tuple(attributes), tuple(attributes.values()), payload.children, text)]
 
 
-_ELEMENT_PARAMETERS: dict[str, set[str]] = {
-    key: {name for name in signature(factory.__init__).parameters if name != "self"}
+_ELEMENT_PARAMETERS: dict[str, frozenset[str]] = {
+    key: frozenset(name for name in signature(factory.__init__).parameters if name != "self")
     for key, factory in SUPPORTED_ELEMENTS.items()
 }
 
+# How a raw attribute reaches svg.py: as a factory parameter, as a whole ``data``/``extra``
+# mapping, as one ``data-*`` entry, or as an arbitrary extra attribute.
+_PARAMETER, _BUCKET, _DATA, _EXTRA = range(4)
+# Keys routed per element type before new ones stop being cached (guards data-driven names).
+_MAX_ROUTES = 4096
+
+
+def _normalise_attribute_key(key: str) -> str:
+    key = key.replace("-", "_")
+    if key == "class":
+        return "class_"
+    if any(ch.isupper() for ch in key):
+        return to_snake_case(key)
+    return key
+
+
+def _plain_route(key: str, normalised: str, parameters: frozenset[str]) -> tuple[int, str]:
+    if normalised in parameters:
+        return _PARAMETER, normalised
+    if key.startswith("data-"):
+        return _DATA, key.removeprefix("data-")
+    return _EXTRA, key
+
+
+class _AttributeRoutes(dict):
+    """Raw attribute names of one element type mapped to ``(route, target name)``.
+
+    Keys are routed on first use and cached, so serialising an attribute costs
+    a single dict lookup. ``data``/``extra`` keys are routed to ``_BUCKET``;
+    callers fall back to :func:`_plain_route` when their value is not a mapping.
+    """
+
+    __slots__ = ("parameters",)
+
+    def __init__(self, parameters: frozenset[str]) -> None:
+        super().__init__()
+        self.parameters = parameters
+
+    def __missing__(self, key: Any) -> tuple[int, str]:
+        original = str(key)
+        normalised = _normalise_attribute_key(original)
+        if normalised in ("data", "extra"):
+            route = (_BUCKET, normalised)
+        else:
+            route = _plain_route(original, normalised, self.parameters)
+        if len(self) < _MAX_ROUTES:
+            self[key] = route
+        return route
+
+
+_ATTRIBUTE_ROUTES: dict[str, _AttributeRoutes] = {
+    key: _AttributeRoutes(parameters) for key, parameters in _ELEMENT_PARAMETERS.items()
+}
+
+
+_UNSET = object()
+_MISSING = object()
+
+# Base context entries that are only computed when a template looks them up.
+_LAZY_CONTEXT_NAMES = frozenset(
+    {"data", "payload", "items", "values", "item_values", "maxValue", "minValue", "averageValue"}
+)
+# Every name the renderer binds itself; template-declared names must not shadow them.
+_RESERVED_CONTEXT_NAMES = _LAZY_CONTEXT_NAMES | frozenset(
+    {
+        "total",
+        "count",
+        "canvas",
+        "properties",
+        "variables",
+        "Math",
+        "math",
+        "__index__",
+        "__count__",
+        "__total__",
+        "__first__",
+        "__last__",
+    }
+)
+
+
+class _LazyEntry:
+    """Cached result of a deferred base context computation."""
+
+    __slots__ = ("_factory", "_shadowed", "_value")
+
+    def __init__(self, factory: Callable[[], Any], shadowed: Any) -> None:
+        self._factory = factory
+        self._shadowed = shadowed
+        self._value: Any = _UNSET
+
+    def resolve(self) -> Any:
+        if self._value is _UNSET:
+            value = self._factory()
+            self._value = self._shadowed if value is _MISSING else value
+        return self._value
+
+
+class _LazyContext(dict):
+    """Rendering context whose registered entries are computed on first access.
+
+    Lazy entries are shared by every copy made with :meth:`copy`, so each one
+    is computed at most once per render regardless of how many repeat frames
+    look it up.
+    """
+
+    __slots__ = ("_lazy",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy: dict[str, _LazyEntry] = {}
+
+    def set_lazy(self, key: str, factory: Callable[[], Any]) -> None:
+        """Defer ``key`` to ``factory``; returning ``_MISSING`` keeps any shadowed value."""
+
+        self._lazy[key] = _LazyEntry(factory, self.pop(key, _MISSING))
+
+    def __missing__(self, key: str) -> Any:
+        entry = self._lazy.get(key)
+        if entry is None:
+            raise KeyError(key)
+        value = entry.resolve()
+        if value is _MISSING:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if dict.__contains__(self, key):
+            return True
+        entry = self._lazy.get(key)  # type: ignore[call-overload]
+        return entry is not None and entry.resolve() is not _MISSING
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def copy(self) -> "_LazyContext":
+        clone = _LazyContext(self)
+        clone._lazy = self._lazy
+        return clone
+
+    def materialise(self) -> None:
+        """Resolve every lazy entry so the context can be iterated or copied with ``dict``."""
+
+        for key in list(self._lazy):
+            if key not in self:
+                continue
+            self[key]
+
+
+class _SequenceMetrics:
+    """Numeric ``value`` statistics gathered from the primary sequence in one pass."""
+
+    __slots__ = ("_sequence", "_values", "_minimum", "_maximum", "_total")
+
+    def __init__(self, sequence: Sequence[Any]) -> None:
+        self._sequence = sequence
+        self._values: list[float] | None = None
+        self._minimum: float = 0
+        self._maximum: float = 0
+        self._total: float = 0
+
+    def _scan(self) -> list[float]:
+        if self._values is None:
+            values: list[float] = []
+            minimum = maximum = total = 0
+            for candidate in self._candidates():
+                if isinstance(candidate, (int, float)):
+                    if not values:
+                        minimum = maximum = candidate
+                    elif candidate < minimum:
+                        minimum = candidate
+                    elif candidate > maximum:
+                        maximum = candidate
+                    total += candidate
+                    values.append(candidate)
+            self._values = values
+            self._minimum, self._maximum, self._total = minimum, maximum, total
+        return self._values
+
+    def _candidates(self) -> Iterator[Any]:
+        sequence = self._sequence
+        if isinstance(sequence, Columns):
+            if "value" in sequence.names:
+                yield from map(to_python, sequence.column("value"))
+            return
+        for item in sequence:
+            if isinstance(item, Mapping):
+                yield item.get("value")
+
+    def values(self) -> Any:
+        return self._scan() or _MISSING
+
+    def minimum(self) -> Any:
+        return self._minimum if self._scan() else _MISSING
+
+    def maximum(self) -> Any:
+        return self._maximum if self._scan() else _MISSING
+
+    def average(self) -> Any:
+        values = self._scan()
+        return self._total / len(values) if values else _MISSING
+
+
+class _RepeatItemView(Mapping[str, Any]):
+    """Read-only view of a repeated mapping item with the repeat helpers layered underneath.
+
+    Keys of the item take precedence over the helpers, matching a copy made
+    with ``setdefault`` without duplicating the item.
+    """
+
+    __slots__ = ("_item", "_index", "_total")
+
+    _HELPERS = ("__index__", "__count__", "__total__", "__first__", "__last__")
+
+    def __init__(self, item: Mapping[str, Any], index: int, total: int) -> None:
+        self._item = item
+        self._index = index
+        self._total = total
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._item:
+            return self._item[key]
+        if key == "__index__":
+            return self._index
+        if key == "__count__":
+            return self._index + 1
+        if key == "__total__":
+            return self._total
+        if key == "__first__":
+            return self._index == 0
+        if key == "__last__":
+            return self._index == self._total - 1
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._item or key in self._HELPERS
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._item
+        for key in self._HELPERS:
+            if key not in self._item:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._item) + sum(1 for key in self._HELPERS if key not in self._item)
+
+
+class _AggregateBatch:
+    """Aggregates sharing one source collection, computed together on first access."""
+
+    __slots__ = ("_context", "_path", "_primary", "_specs", "_results")
+
+    def __init__(
+        self,
+        context: Mapping[str, Any],
+        path: str | None,
+        primary: Sequence[Any] | None,
+        specs: Mapping[str, AggregateSpec],
+    ) -> None:
+        self._context = context
+        self._path = path
+        self._primary = primary
+        self._specs = specs
+        self._results: dict[str, Any] | None = None
+
+    def result(self, name: str) -> Any:
+        if self._results is None:
+            self._results = {
+                key: ensure_accessible(value)
+                for key, value in compute_aggregates(self._specs, self._items()).items()
+            }
+        return self._results[name]
+
+    def _items(self) -> Iterable[Any]:
+        if self._path is None:
+            return self._primary if self._primary is not None else ()
+        try:
+            collection = unwrap_adapter(resolve_path(self._context, self._path))
+        except KeyError as exc:
+            raise RenderError(f"Unable to resolve aggregate items at '{self._path}'") from exc
+        if isinstance(collection, (str, bytes, Mapping)) or not isinstance(collection, Iterable):
+            raise RenderError(f"Aggregate items at '{self._path}' are not a collection")
+        return collection
+
+
+def _flush_chunks(handle: BinaryIO, chunks: list[bytes]) -> int:
+    """Write the buffered ``chunks`` in one call, clear them, and return the byte count."""
+
+    data = b"".join(chunks)
+    chunks.clear()
+    handle.write(data)
+    return len(data)
+
+
+def _outside(bounds: tuple[float, float, float, float], viewport: Viewport) -> bool:
+    left, top, right, bottom = bounds
+    return right < viewport[0] or bottom < viewport[1] or left > viewport[2] or top > viewport[3]
+
+
+def _check_repeat_total(
+    collection: Iterable[Any],
+    total: int,
+    *,
+    repeat: RepeatSpec,
+    label: str,
+) -> Iterator[Any]:
+    """Yield ``collection`` while checking that it holds exactly ``total`` items."""
+
+    count = 0
+    for item in collection:
+        if count == total:
+            raise RenderError(
+                f"{label} total: '{repeat.items}' yielded more than the declared {total} items"
+            )
+        count += 1
+        yield item
+    if count != total:
+        raise RenderError(f"{label} total: '{repeat.items}' yielded {count} items, expected {total}")
+
+
+def _copy_context(context: Mapping[str, Any]) -> dict[str, Any]:
+    if isinstance(context, dict):
+        return context.copy()
+    return dict(context)
+
+
+def _collect_expressions(element: ElementSpec) -> Iterator[str]:
+    """Yield every expression string an element (and its children) may evaluate."""
+
+    for value in element.attributes.values():
+        yield from _placeholder_expressions(value)
+    if element.text is not None:
+        yield from _placeholder_expressions(element.text)
+    yield from _binding_expressions(element.let)
+    if element.when:
+        yield element.when
+    for series in element.series.values():
+        tokens = tokenize_path(series.items)
+        if tokens:
+            yield tokens[0]
+        yield series.x
+        yield series.y
+    if element.repeat is not None:
+        tokens = tokenize_path(element.repeat.items)
+        if tokens:
+            yield tokens[0]
+        if element.repeat.where:
+            yield element.repeat.where
+        if element.repeat.total:
+            yield element.repeat.total
+        yield from _binding_expressions(element.repeat.let)
+    for child in element.children:
+        yield from _collect_expressions(child)
+
+
+def _placeholder_expressions(value: str) -> Iterator[str]:
+    for match in PLACEHOLDER_PATTERN.finditer(value):
+        yield match.group(1).strip()
+
+
+def _binding_expressions(value: Any) -> Iterator[str]:
+    if isinstance(value, Mapping):
+        for sub_value in value.values():
+            yield from _binding_expressions(sub_value)
+    elif isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        for item in value:
+            yield from _binding_expressions(item)
+    elif isinstance(value, str):
+        if PLACEHOLDER_PATTERN.search(value):
+            yield from _placeholder_expressions(value)
+        else:
+            yield value
+
+
+def _referenced_names(elements: Sequence[ElementSpec]) -> frozenset[str]:
+    names: set[str] = set()
+    for element in elements:
+        for expression in _collect_expressions(element):
+            names.update(find_identifier_tokens(expression))
+    return frozenset(names)
+
 
 class _OverlayMapping(Mapping[str, Any]):
     """Mapping overlay that lazily resolves dependent let bindings."""
@@ -188,11 +603,27 @@ class InfogrooveRenderer:
         self,
         template: TemplateSpec,
         renderers: Mapping[str, ElementRenderer] | None = None,
+        *,
+        profiler: RenderProfiler | None = None,
+        hooks: Sequence[RenderHooks] | None = None,
+        number_format: NumberFormat | None = None,
+        passes: Sequence[NodePass] | None = None,
+        cull_margin: float | None = None,
     ) -> None:
         self._template = template
         self._renderers: dict[str, ElementRenderer] = {
             key: _builtin_node_renderer for key in SUPPORTED_ELEMENTS
         }
+        self._profiler = profiler
+        self._expression_stats = ExpressionStatsTable()
+        self._hooks: tuple[RenderHooks, ...] = tuple(hooks or ())
+        self._template_names: frozenset[str] | None = None
+        self._repeat_queries: dict[int, RepeatQuery] = {}
+        self._point_series_builders: dict[int, PointSeries] = {}
+        self._validator: Any = None
+        self.number_format = number_format
+        self._passes: tuple[NodePass, ...] = tuple(passes or ())
+        self.cull_margin = cull_margin
         if renderers:
             self.register_renderers(renderers)
 
@@ -202,25 +633,166 @@ class InfogrooveRenderer:
 
         return self._template
 
+    @property
+    def profiler(self) -> RenderProfiler | None:
+        """Return the profiler recording render timings, if profiling is enabled."""
+
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: RenderProfiler | None) -> None:
+        self._profiler = profiler
+
+    @property
+    def expression_stats(self) -> ExpressionStatsTable:
+        """Return this renderer's expression backend counters and routing preferences.
+
+        Call ``expression_stats.reset()`` to make the next render route every
+        expression from scratch.
+        """
+
+        return self._expression_stats
+
+    @property
+    def number_format(self) -> NumberFormat | None:
+        """Return the policy used to stringify floats in attributes and text."""
+
+        return self._number_format
+
+    @number_format.setter
+    def number_format(self, number_format: NumberFormat | None) -> None:
+        self._number_format = number_format
+        self._format_value = number_format.formatter() if number_format is not None else stringify
+        self._point_series_builders = {}
+
+    @property
+    def passes(self) -> tuple[NodePass, ...]:
+        """Return the node passes applied to translated output before serialisation."""
+
+        return self._passes
+
+    @passes.setter
+    def passes(self, passes: Sequence[NodePass]) -> None:
+        self._passes = tuple(passes)
+
+    @property
+    def cull_margin(self) -> float | None:
+        """Return the margin around the canvas beyond which shapes are dropped, or ``None``."""
+
+        return self._cull_margin
+
+    @cull_margin.setter
+    def cull_margin(self, margin: float | None) -> None:
+        if margin is not None and margin < 0:
+            raise ValueError("Cull margin must not be negative")
+        self._cull_margin = margin
+
+    @property
+    def hooks(self) -> tuple[RenderHooks, ...]:
+        """Return the observers notified of render lifecycle events."""
+
+        return self._hooks
+
+    def add_hook(self, hook: RenderHooks) -> None:
+        """Register an observer for render lifecycle events."""
+
+        self._hooks = (*self._hooks, hook)
+
+    def remove_hook(self, hook: RenderHooks) -> None:
+        """Stop notifying a previously registered observer."""
+
+        self._hooks = tuple(candidate for candidate in self._hooks if candidate is not hook)
+
     def translate(self, data: Any) -> list[NodeSpec]:
         """Return the resolved node specifications without creating SVG markup."""
 
-        payload = self._validate_data(data)
-        base_context = self._build_base_context(payload)
-        return self._translate_from_context(base_context)
+        started = perf_counter() if self._hooks else 0.0
+        base_context = self._prepare_base_context(data)
+        nodes = self._translate_from_context(base_context)
+        if self._hooks:
+            self._emit("on_render_end", perf_counter() - started)
+        return nodes
 
     def render(self, data: Any) -> str:
         """Render the template with the supplied data and return SVG markup."""
 
-        payload = self._validate_data(data)
-        base_context = self._build_base_context(payload)
+        hooks = self._hooks
+        started = perf_counter() if hooks else 0.0
+        base_context = self._prepare_base_context(data)
         width, height = self._resolve_canvas_dimensions(base_context)
-        node_specs = self._translate_from_context(base_context)
+        node_specs = [node for rendered in self._iter_output_nodes(base_context) for node in rendered]
 
+        serialize_started = perf_counter() if hooks else 0.0
         svg_root = SVG(width=width, height=height, elements=[])
         svg_nodes = [self._spec_to_svg(spec) for spec in node_specs]
         svg_root.elements = (svg_root.elements or []) + svg_nodes
-        return svg_root.as_str()
+        markup = svg_root.as_str()
+        if hooks:
+            finished = perf_counter()
+            self._emit("on_serialize", len(markup), finished - serialize_started)
+            self._emit("on_render_end", finished - started)
+        return markup
+
+    def render_to(
+        self,
+        data: Any,
+        target: str | os.PathLike[str] | BinaryIO,
+        *,
+        compress: bool | None = None,
+        compresslevel: int = 9,
+    ) -> int:
+        """Render ``data`` and stream UTF-8 SVG markup into ``target``.
+
+        ``target`` is a path or a writable binary file object. Markup is
+        written element by element, so the full document never exists as a
+        single string. With ``compress`` the bytes are gzip-compressed as they
+        are produced; for paths it defaults to ``True`` when the suffix is
+        ``.svgz`` or ``.gz``. Returns the number of uncompressed bytes written.
+        The output is byte-for-byte identical to ``render(data)``.
+        """
+
+        if isinstance(target, (str, os.PathLike)):
+            if compress is None:
+                compress = os.path.splitext(os.fspath(target))[1].lower() in _COMPRESSED_SUFFIXES
+            with open(target, "wb") as handle:
+                return self.render_to(data, handle, compress=compress, compresslevel=compresslevel)
+        if compress:
+            with gzip.GzipFile(fileobj=target, mode="wb", compresslevel=compresslevel, mtime=0) as stream:
+                return self._write_markup(data, stream)
+        return self._write_markup(data, target)
+
+    def _write_markup(self, data: Any, handle: BinaryIO) -> int:
+        hooks = self._hooks
+        started = perf_counter() if hooks else 0.0
+        base_context = self._prepare_base_context(data)
+        width, height = self._resolve_canvas_dimensions(base_context)
+        root = SVG(width=width, height=height).as_str()
+
+        serialize_elapsed = 0.0
+        pending: list[bytes] = []
+        pending_size = 0
+        written = 0
+        for rendered in self._iter_output_nodes(base_context):
+            serialize_started = perf_counter() if hooks else 0.0
+            for spec in rendered:
+                if not written and not pending:
+                    pending.append(f"{root[:-2]}>".encode("utf-8"))
+                chunk = self._spec_to_svg(spec).as_str().encode("utf-8")
+                pending.append(chunk)
+                pending_size += len(chunk)
+                if pending_size >= _WRITE_CHUNK:
+                    written += _flush_chunks(handle, pending)
+                    pending_size = 0
+            if hooks:
+                serialize_elapsed += perf_counter() - serialize_started
+
+        closing = "</svg>" if written or pending else root
+        pending.append(closing.encode("utf-8"))
+        written += _flush_chunks(handle, pending)
+        if hooks:
+            self._emit("on_serialize", written, serialize_elapsed)
+            self._emit("on_render_end", perf_counter() - started)
+        return written
 
     def register_renderer(self, element_type: str, renderer: ElementRenderer) -> None:
         """Register or override the renderer used for a specific element type."""
@@ -237,12 +809,53 @@ class InfogrooveRenderer:
         for key, handler in renderers.items():
             self.register_renderer(key, handler)
 
+    def _emit(self, event: str, *args: Any) -> None:
+        for hook in self._hooks:
+            getattr(hook, event)(*args)
+
+    def _prepare_base_context(self, data: Any) -> dict[str, Any]:
+        names = self._context_names()
+        if not self._hooks:
+            return self._build_base_context(self._validate_data(data), names=names)
+        self._emit("on_validation_start", data)
+        started = perf_counter()
+        payload = self._validate_data(data)
+        validated = perf_counter()
+        self._emit("on_validation_end", data, validated - started)
+        context = self._build_base_context(payload, names=names)
+        self._emit("on_base_context", context, perf_counter() - validated)
+        return context
+
     def _translate_from_context(self, base_context: Mapping[str, Any]) -> list[NodeSpec]:
-        nodes: list[NodeSpec] = []
-        for index, element in enumerate(self._template.template):
-            nodes.extend(self._render_to_nodes(element, base_context, path=f"template[{index}]"))
+        """Return the translated tree in its public dict form, after any node passes."""
+
+        nodes = [node.to_dict() for rendered in self._iter_top_level_nodes(base_context) for node in rendered]
+        for node_pass in self._passes:
+            nodes = node_pass(nodes)
         return nodes
 
+    def _iter_output_nodes(self, base_context: Mapping[str, Any]) -> Iterator[list[Node]]:
+        """Yield serialisable node batches; passes need the whole tree, so they disable streaming."""
+
+        if self._passes:
+            specs = self._translate_from_context(base_context)
+            yield [self._coerce_node_spec(spec, f"pass output[{index}]") for index, spec in enumerate(specs)]
+        else:
+            yield from self._iter_top_level_nodes(base_context)
+
+    def _iter_top_level_nodes(self, base_context: Mapping[str, Any]) -> Iterator[list[Node]]:
+        """Yield the node specifications produced by each top-level element in turn."""
+
+        hooks = self._hooks
+        viewport = self._viewport(base_context)
+        for index, element in enumerate(self._template.template):
+            path = f"template[{index}]"
+            started = perf_counter() if hooks else 0.0
+            rendered = self._render_to_nodes(element, base_context, path=path, viewport=viewport)
+            if hooks:
+                self._emit("on_element", path, element, len(rendered), perf_counter() - started)
+            yield rendered
+
     def _resolve_canvas_dimensions(self, context: Mapping[str, Any]) -> tuple[float, float]:
         width = self._template.canvas.width
         height = self._template.canvas.height
@@ -256,6 +869,15 @@ class InfogrooveRenderer:
                 height = self._template.canvas.height
         return width, height
 
+    def _viewport(self, context: Mapping[str, Any]) -> Viewport | None:
+        """Return the culling bounds for this render, or ``None`` when culling is disabled."""
+
+        margin = self._cull_margin
+        if margin is None:
+            return None
+        width, height = self._resolve_canvas_dimensions(context)
+        return (-margin, -margin, width + margin, height + margin)
+
     def _render_to_nodes(
         self,
         element: ElementSpec,
@@ -263,13 +885,21 @@ class InfogrooveRenderer:
         *,
         ignore_repeat: bool = False,
         path: str,
-    ) -> list[NodeSpec]:
+        viewport: Viewport | None = None,
+    ) -> list[Node]:
         if element.repeat and not ignore_repeat:
-            items, total = self._resolve_repeat_items(element.repeat, context)
-            rendered: list[NodeSpec] = []
+            started = perf_counter() if self._hooks else 0.0
+            items, total = self._resolve_repeat_items(
+                element.repeat,
+                context,
+                label=f"{path} ({element.type}) repeat",
+            )
+            rendered: list[Node] = []
             for index, item in enumerate(items):
                 frame = self._build_repeat_context(context, element.repeat, item, index, total)
                 repeat_path = f"{path}[{index}]"
+                if element.when and not self._is_visible(element, frame, path=repeat_path):
+                    continue
                 if element.repeat.let:
                     repeat_bindings = self._evaluate_bindings(
                         element.repeat.let,
@@ -278,11 +908,50 @@ class InfogrooveRenderer:
                     )
                     frame.update(self._make_accessible_bindings(repeat_bindings))
                 rendered.extend(
-                    self._render_to_nodes(element, frame, ignore_repeat=True, path=repeat_path)
+                    self._render_to_nodes(
+                        element,
+                        frame,
+                        ignore_repeat=True,
+                        path=repeat_path,
+                        viewport=viewport,
+                    )
                 )
+            if self._hooks:
+                self._emit("on_repeat", path, element, total, perf_counter() - started)
             return rendered
 
-        working_context = dict(context)
+        if element.when and not ignore_repeat and not self._is_visible(element, context, path=path):
+            return []
+
+        profiler = self._profiler
+        if profiler is None:
+            return self._render_element(element, context, path=path, viewport=viewport)
+        start = profiler.clock()
+        try:
+            return self._render_element(element, context, path=path, viewport=viewport)
+        finally:
+            profiler.record(ELEMENT, f"{path} ({element.type})", profiler.clock() - start)
+
+    def _is_visible(self, element: ElementSpec, context: Mapping[str, Any], *, path: str) -> bool:
+        """Evaluate the element's ``when`` condition before any of its bindings."""
+
+        evaluate = self._evaluator(RenderProfiler.evaluate_binding)
+        label = f"{path} ({element.type}) when"
+        result = evaluate(element.when, context, label=label)
+        try:
+            return bool(result)
+        except TypeError as exc:
+            raise RenderError(f"{label}: '{element.when}' did not evaluate to a boolean") from exc
+
+    def _render_element(
+        self,
+        element: ElementSpec,
+        context: Mapping[str, Any],
+        *,
+        path: str,
+        viewport: Viewport | None = None,
+    ) -> list[Node]:
+        working_context = _copy_context(context)
         if element.let:
             bindings = self._evaluate_bindings(
                 element.let,
@@ -291,22 +960,51 @@ class InfogrooveRenderer:
             )
             accessible = self._make_accessible_bindings(bindings)
             working_context.update(accessible)
-        child_nodes: list[NodeSpec] = []
+
+        evaluate = self._placeholder_evaluator()
+        format_value = self._format_value
+
+        def fill(key: str, value: Any) -> Any:
+            return fill_placeholders(
+                value,
+                working_context,
+                label=f"{path} ({element.type}) attribute '{key}'",
+                evaluate=evaluate,
+                format_value=format_value,
+            )
+
+        element_type = element.type.lower()
+        transformed = "transform" in element.attributes
+        # Position bindings are evaluated first so shapes outside the viewport skip everything else.
+        # Registered renderers may emit geometry unrelated to the template attributes.
+        geometry: dict[str, Any] = {}
+        if (
+            viewport is not None
+            and not transformed
+            and not element.children
+            and self._renderers.get(element_type) is _builtin_node_renderer
+        ):
+            names = BOUNDED_ATTRIBUTES.get(element_type, ())
+            geometry = {key: fill(key, element.attributes[key]) for key in names if key in element.attributes}
+            bounds = shape_bounds(element_type, geometry) if names else None
+            if bounds is not None and _outside(bounds, viewport):
+                return []
+
+        # Descendants share the canvas coordinate system only through untransformed groups.
+        child_viewport = viewport if element_type == "g" and not transformed else None
+        child_nodes: list[Node] = []
         for child_index, child in enumerate(element.children):
             child_nodes.extend(
                 self._render_to_nodes(
                     child,
                     working_context,
                     path=f"{path}.children[{child_index}]",
+                    viewport=child_viewport,
                 )
             )
 
         prepared_attributes = {
-            key: fill_placeholders(
-                value,
-                working_context,
-                label=f"{path} ({element.type}) attribute '{key}'",
-            )
+            key: geometry[key] if key in geometry else fill(key, value)
             for key, value in element.attributes.items()
         }
         text_value = (
@@ -314,20 +1012,38 @@ class InfogrooveRenderer:
                 element.text,
                 working_context,
                 label=f"{path} ({element.type}) text",
+                evaluate=evaluate,
+                format_value=format_value,
             )
             if element.text is not None
             else None
         )
 
+        for key, series in element.series.items():
+            target = None
+            if series.downsample is not None:
+                target = self._downsample_target(series.downsample, working_context)
+            prepared_attributes[key] = self._point_series(series, key).build(
+                working_context,
+                label=f"{path} ({element.type}) attribute '{key}'",
+                evaluate=evaluate,
+                target=target,
+            )
+
         renderer = self._renderers.get(element.type.lower())
         if renderer is None:
             raise RenderError(f"Unsupported element type '{element.type}'")
 
+        if renderer is _builtin_node_renderer:
+            children: tuple[Any, ...] = tuple(child_nodes)
+        else:
+            # Registered renderers get mutable dicts, as they always have; their output is coerced back.
+            children = tuple(child.to_dict() for child in child_nodes)
         payload = RendererInput(
             type=element.type,
             attributes=prepared_attributes,
             text=text_value,
-            children=tuple(child_nodes),
+            children=children,
             spec=element,
         )
 
@@ -338,22 +1054,28 @@ class InfogrooveRenderer:
         except Exception as exc:  # pragma: no cover - depends on custom renderer
             raise RenderError(f"Renderer for '{element.type}' failed: {exc}") from exc
 
+        if renderer is _builtin_node_renderer:
+            # Built-in output is a well-formed list of Nodes by construction.
+            return outputs
         return self._normalise_renderer_outputs(outputs, element.type)
 
-    def _normalise_renderer_outputs(self, outputs: Any, element_type: str) -> list[NodeSpec]:
+    def _normalise_renderer_outputs(self, outputs: Any, element_type: str) -> list[Node]:
         if outputs is None:
             return []
         if not isinstance(outputs, Sequence) or isinstance(outputs, (str, bytes)):
             raise RenderError(
                 f"Renderer for '{element_type}' must return a sequence of node specifications"
             )
-        resolved: list[NodeSpec] = []
+        resolved: list[Node] = []
         for index, candidate in enumerate(outputs):
             node = self._coerce_node_spec(candidate, f"{element_type}[{index}]")
             resolved.append(node)
         return resolved
 
-    def _coerce_node_spec(self, candidate: Any, label: str) -> NodeSpec:
+    def _coerce_node_spec(self, candidate: Any, label: str) -> Node:
+        if isinstance(candidate, Node):
+            # Nodes are only built from coerced or built-in output, and never change afterwards.
+            return candidate
         if isinstance(candidate, Mapping):
             tag = candidate.get("type") or candidate.get("tag")
             if not isinstance(tag, str):
@@ -363,14 +1085,14 @@ class InfogrooveRenderer:
                 raise RenderError(f"Renderer output '{label}.attributes' must be a mapping")
             children_block = candidate.get("children", [])
             children = self._coerce_children(children_block, f"{label}.children")
-            node: NodeSpec = {
-                "type": tag,
-                "attributes": dict(attributes_block),
-                "children": children,
-            }
-            if "text" in candidate and candidate["text"] is not None:
-                node["text"] = str(candidate["text"])
-            return node
+            text = candidate.get("text")
+            return Node(
+                tag,
+                tuple(attributes_block),
+                tuple(attributes_block.values()),
+                children,
+                None if text is None else str(text),
+            )
 
         if isinstance(candidate, Sequence) and not isinstance(candidate, (str, bytes)):
             if not candidate:
@@ -417,71 +1139,61 @@ class InfogrooveRenderer:
                     )
                 text_value = str(value)
 
-            node: NodeSpec = {
-                "type": tag,
-                "attributes": dict(attrs_block or {}),
-                "children": self._coerce_children(
+            attrs_block = attrs_block or {}
+            return Node(
+                tag,
+                tuple(attrs_block),
+                tuple(attrs_block.values()),
+                self._coerce_children(
                     children_payload if children_payload is not None else [],
                     f"{label}.children",
                 ),
-            }
-            if text_value is not None:
-                node["text"] = text_value
-            return node
+                text_value,
+            )
 
         raise RenderError(
             f"Renderer output '{label}' must be a mapping or sequence describing an element"
         )
 
-    def _coerce_children(self, payload: Any, label: str) -> list[NodeSpec]:
-        if payload in (None, []):
-            return []
+    def _coerce_children(self, payload: Any, label: str) -> tuple[Node, ...]:
+        if payload is None or (isinstance(payload, (list, tuple)) and not payload):
+            return ()
         if not isinstance(payload, Sequence) or isinstance(payload, (str, bytes)):
             raise RenderError(f"Renderer output '{label}' must be a sequence of child elements")
-        children: list[NodeSpec] = []
-        for index, child in enumerate(payload):
-            children.append(self._coerce_node_spec(child, f"{label}[{index}]"))
-        return children
-
-    def _spec_to_svg(self, spec: NodeSpec) -> Any:
-        element_type = spec.get("type")
-        if not isinstance(element_type, str):
-            raise RenderError("Renderer output is missing required 'type' value")
-        factory = SUPPORTED_ELEMENTS.get(element_type.lower())
+        return tuple(self._coerce_node_spec(child, f"{label}[{index}]") for index, child in enumerate(payload))
+
+    def _spec_to_svg(self, spec: Node) -> Any:
+        element_type = spec.type
+        lookup_key = element_type.lower()
+        factory = SUPPORTED_ELEMENTS.get(lookup_key)
         if factory is None:
             raise RenderError(f"Unsupported element type '{element_type}'")
 
-        raw_attributes = spec.get("attributes", {})
-        if not isinstance(raw_attributes, Mapping):
-            raise RenderError("Renderer output 'attributes' must be a mapping")
-
-        param_names = _ELEMENT_PARAMETERS.get(element_type.lower(), set())
+        routes = _ATTRIBUTE_ROUTES[lookup_key]
+        param_names = routes.parameters
         prepared_attributes: dict[str, Any] = {}
         deferred_data: dict[str, Any] = {}
         extra_attributes: dict[str, Any] = {}
+        stringify_value = self._stringify_attribute_value
 
-        for key, value in raw_attributes.items():
+        for key, value in zip(spec.names, spec.values):
             if value is None:
                 continue
-            original_key = str(key)
-            normalised_key = self._normalise_attribute_key(original_key)
-
-            if normalised_key in {"data", "extra"} and isinstance(value, Mapping):
-                prepared_attributes[normalised_key] = {
-                    str(inner_key): self._stringify_attribute_value(inner_value)
-                    for inner_key, inner_value in value.items()
-                }
-                continue
-
-            if normalised_key in param_names:
-                prepared_attributes[normalised_key] = self._stringify_attribute_value(value)
-                continue
-
-            if original_key.startswith("data-"):
-                deferred_data[original_key.removeprefix("data-")] = self._stringify_attribute_value(value)
-                continue
+            route, name = routes[key]
+            if route == _BUCKET:
+                if isinstance(value, Mapping):
+                    prepared_attributes[name] = {
+                        str(inner_key): stringify_value(inner_value) for inner_key, inner_value in value.items()
+                    }
+                    continue
+                route, name = _plain_route(str(key), name, param_names)
 
-            extra_attributes[original_key] = self._stringify_attribute_value(value)
+            if route == _PARAMETER:
+                prepared_attributes[name] = stringify_value(value)
+            elif route == _DATA:
+                deferred_data[name] = stringify_value(value)
+            else:
+                extra_attributes[name] = stringify_value(value)
 
         if deferred_data:
             if "data" in param_names:
@@ -504,11 +1216,11 @@ class InfogrooveRenderer:
                 )
 
         if factory in (Text, TSpan):
-            text_value = self._stringify_text(spec.get("text"))
+            text_value = self._stringify_text(spec.text)
             node = factory(text=text_value, **prepared_attributes)
         else:
             node = factory(**prepared_attributes)
-            text_payload = spec.get("text")
+            text_payload = spec.text
             if text_payload not in (None, ""):
                 if hasattr(node, "elements"):
                     text_node = Text(text=self._stringify_text(text_payload))
@@ -519,7 +1231,7 @@ class InfogrooveRenderer:
                         f"Element type '{element_type}' does not support embedded text content"
                     )
 
-        children_payload = spec.get("children", [])
+        children_payload = spec.children
         if children_payload:
             if not hasattr(node, "elements"):
                 raise RenderError(f"Element type '{element_type}' does not support nested children")
@@ -529,45 +1241,134 @@ class InfogrooveRenderer:
 
         return node
 
-    @staticmethod
-    def _stringify_attribute_value(value: Any) -> Any:
+    def _stringify_attribute_value(self, value: Any) -> Any:
         if isinstance(value, Mapping):
             return {
-                str(key): InfogrooveRenderer._stringify_attribute_value(sub_value)
+                str(key): self._stringify_attribute_value(sub_value)
                 for key, sub_value in value.items()
             }
         if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
-            return [InfogrooveRenderer._stringify_attribute_value(item) for item in value]
+            return [self._stringify_attribute_value(item) for item in value]
         if value is None:
             return ""
-        return stringify(value)
+        return self._format_value(value)
 
-    @staticmethod
-    def _stringify_text(value: Any) -> str:
+    def _stringify_text(self, value: Any) -> str:
         if value is None:
             return ""
-        return stringify(value)
+        return self._format_value(value)
 
     def _resolve_repeat_items(
         self,
         repeat: RepeatSpec,
         context: Mapping[str, Any],
-    ) -> tuple[list[Any], int]:
+        *,
+        label: str | None = None,
+    ) -> tuple[Iterable[Any], int]:
+        """Return the repeat collection and its length without copying sequences.
+
+        Sequences and other sized collections are iterated in place. Unsized
+        iterables (such as generators) are consumed lazily when the repeat
+        declares a ``total`` expression and materialised otherwise.
+        """
+
         try:
             collection = resolve_path(context, repeat.items)
         except KeyError as exc:
             raise RenderError(f"Unable to resolve repeat items at '{repeat.items}'") from exc
+        label = label or repeat.items
 
-        if isinstance(collection, Sequence):
-            items = list(collection)
-        else:
-            try:
-                items = list(collection)
-            except TypeError as exc:  # pragma: no cover - defensive
-                raise RenderError(f"Repeat items at '{repeat.items}' are not iterable") from exc
+        if not isinstance(collection, Iterable) or isinstance(collection, (str, bytes)):
+            raise RenderError(f"Repeat items at '{repeat.items}' are not iterable")
+        collection = unwrap_adapter(collection)
 
+        if repeat.has_query:
+            collection = self._repeat_query(repeat).apply(
+                collection,
+                self._repeat_predicate(repeat, context, label=label),
+            )
+            if repeat.downsample is None:
+                return collection, len(collection)
+        if repeat.downsample is not None:
+            points = collection if isinstance(collection, Sequence) else list(collection)
+            target = self._downsample_target(repeat.downsample, context)
+            try:
+                items = downsample_items(points, repeat.downsample, target)
+            except RenderError as exc:
+                raise RenderError(f"{label} downsample: {exc}") from exc
+            return items, len(items)
+        if isinstance(collection, Sized):
+            return collection, len(collection)
+        if repeat.total is not None:
+            total = self._evaluate_repeat_total(repeat, context, label=label)
+            return _check_repeat_total(collection, total, repeat=repeat, label=label), total
+        items = list(collection)
         return items, len(items)
 
+    def _evaluate_repeat_total(
+        self,
+        repeat: RepeatSpec,
+        context: Mapping[str, Any],
+        *,
+        label: str,
+    ) -> int:
+        evaluate = self._evaluator(RenderProfiler.evaluate_binding)
+        error_label = f"{label} total"
+        value = evaluate(repeat.total, context, label=error_label)
+        try:
+            total = int(value)
+        except (TypeError, ValueError) as exc:
+            raise RenderError(f"{error_label}: '{repeat.total}' did not evaluate to an integer") from exc
+        if total < 0:
+            raise RenderError(f"{error_label}: '{repeat.total}' evaluated to a negative length")
+        return total
+
+    def _point_series(self, series: PointSeriesSpec, attribute: str) -> PointSeries:
+        builder = self._point_series_builders.get(id(series))
+        if builder is None:
+            builder = self._point_series_builders[id(series)] = PointSeries(
+                series, attribute, self._format_value
+            )
+        return builder
+
+    def _downsample_target(self, spec: DownsampleSpec, context: Mapping[str, Any]) -> int:
+        """Return the point budget, defaulting to one point per horizontal canvas pixel."""
+
+        if spec.target is not None:
+            return spec.target
+        return max(int(self._resolve_canvas_dimensions(context)[0]), 3)
+
+    def _repeat_query(self, repeat: RepeatSpec) -> RepeatQuery:
+        query = self._repeat_queries.get(id(repeat))
+        if query is None:
+            query = self._repeat_queries[id(repeat)] = RepeatQuery(repeat)
+        return query
+
+    def _repeat_predicate(
+        self,
+        repeat: RepeatSpec,
+        context: Mapping[str, Any],
+        *,
+        label: str,
+    ) -> Callable[[Any], bool] | None:
+        """Build the ``where`` filter, evaluated with only the alias bound over ``context``."""
+
+        where = repeat.where
+        if where is None:
+            return None
+        evaluate = self._evaluator(RenderProfiler.evaluate_filter)
+        error_label = f"{label} where"
+
+        def predicate(item: Any) -> bool:
+            frame = ChainMap({repeat.alias: ensure_accessible(item)}, context)
+            result = evaluate(where, frame, label=error_label)
+            try:
+                return bool(result)
+            except TypeError as exc:
+                raise RenderError(f"{error_label}: '{where}' did not evaluate to a boolean") from exc
+
+        return predicate
+
     def _build_repeat_context(
         self,
         parent_context: Mapping[str, Any],
@@ -576,16 +1377,10 @@ class InfogrooveRenderer:
         index: int,
         total: int,
     ) -> dict[str, Any]:
-        frame = dict(parent_context)
+        frame = _copy_context(parent_context)
         alias_binding: Any
         if isinstance(item, Mapping):
-            alias_payload = dict(item)
-            alias_payload.setdefault("__index__", index)
-            alias_payload.setdefault("__count__", index + 1)
-            alias_payload.setdefault("__total__", total)
-            alias_payload.setdefault("__first__", index == 0)
-            alias_payload.setdefault("__last__", index == total - 1)
-            alias_binding = ensure_accessible(alias_payload)
+            alias_binding = MappingAdapter(_RepeatItemView(unwrap_adapter(item), index, total))
         else:
             alias_binding = ensure_accessible(item)
         frame["__index__"] = index
@@ -598,54 +1393,69 @@ class InfogrooveRenderer:
 
         return frame
 
-    def _build_base_context(self, payload: Any) -> dict[str, Any]:
-        context: dict[str, Any] = {}
-        accessible_payload = ensure_accessible(payload)
-        context["data"] = accessible_payload
-        context["payload"] = accessible_payload
+    def _context_names(self) -> frozenset[str] | None:
+        """Return the identifiers the template can reference, or ``None`` when unknown.
+
+        Custom renderers receive the full context, so any registered renderer
+        other than the built-in one disables the analysis.
+        """
+
+        if any(renderer is not _builtin_node_renderer for renderer in self._renderers.values()):
+            return None
+        if self._template_names is None:
+            names = set(_referenced_names(self._template.template))
+            for spec in self._template.aggregates.values():
+                tokens = tokenize_path(spec.items) if spec.items else []
+                if tokens:
+                    names.add(tokens[0])
+            self._template_names = frozenset(names)
+        return self._template_names
+
+    def _build_base_context(
+        self,
+        payload: Any,
+        *,
+        names: frozenset[str] | None = None,
+    ) -> dict[str, Any]:
+        """Build the root rendering context for ``payload``.
+
+        Payload adapters and ``value`` metrics are registered as lazy entries
+        computed on first lookup. When ``names`` is provided, lazy entries the
+        template never references are omitted altogether.
+        """
+
+        context = _LazyContext()
+
+        def lazy(key: str, factory: Callable[[], Any]) -> None:
+            if names is None or key in names:
+                context.set_lazy(key, factory)
+
+        lazy("data", lambda: ensure_accessible(payload))
+        lazy("payload", lambda: ensure_accessible(payload))
 
         primary_sequence: Sequence[Any] | None = None
-        sequence_length: int | None = None
 
         if isinstance(payload, Sequence) and not isinstance(payload, (str, bytes)):
             primary_sequence = payload
-            sequence_length = len(payload)
-            context["items"] = ensure_accessible(payload)
+            lazy("items", lambda: ensure_accessible(payload))
         elif isinstance(payload, Mapping):
             for key, value in payload.items():
                 context[key] = ensure_accessible(value)
             default_items = payload.get("items")
             if isinstance(default_items, Sequence) and not isinstance(default_items, (str, bytes)):
                 primary_sequence = default_items
-                sequence_length = len(default_items)
-                context.setdefault("items", ensure_accessible(default_items))
 
-        metrics: dict[str, Any] = {}
-        values: list[float] = []
         if primary_sequence is not None:
-            for item in primary_sequence:
-                if isinstance(item, Mapping):
-                    candidate = item.get("value")
-                    if isinstance(candidate, (int, float)):
-                        values.append(candidate)
-
-        if values:
-            metrics.update(
-                {
-                    "item_values": values,
-                    "values": values,
-                    "maxValue": max(values),
-                    "minValue": min(values),
-                    "averageValue": sum(values) / len(values),
-                }
-            )
-
-        if sequence_length is not None:
-            metrics.setdefault("total", sequence_length)
-            metrics.setdefault("count", sequence_length)
+            metrics = _SequenceMetrics(primary_sequence)
+            for key in ("item_values", "values"):
+                lazy(key, metrics.values)
+            lazy("maxValue", metrics.maximum)
+            lazy("minValue", metrics.minimum)
+            lazy("averageValue", metrics.average)
+            context["total"] = len(primary_sequence)
+            context["count"] = len(primary_sequence)
 
-        if metrics:
-            context.update(metrics)
+        self._register_aggregates(context, primary_sequence, names)
 
         properties = dict(self._template.properties)
 
@@ -666,8 +1476,28 @@ class InfogrooveRenderer:
         context["properties"] = properties_adapter
         context["variables"] = properties_adapter  # backwards-friendly alias
 
+        if names is None:
+            context.materialise()
         return context
 
+    def _register_aggregates(
+        self,
+        context: _LazyContext,
+        primary_sequence: Sequence[Any] | None,
+        names: frozenset[str] | None,
+    ) -> None:
+        """Expose declared aggregates as lazy entries, one shared pass per source collection."""
+
+        sources: dict[str | None, dict[str, AggregateSpec]] = {}
+        for name, spec in self._template.aggregates.items():
+            if names is None or name in names:
+                sources.setdefault(spec.items, {})[name] = spec
+
+        for path, specs in sources.items():
+            batch = _AggregateBatch(context, path, primary_sequence, specs)
+            for name in specs:
+                context.set_lazy(name, partial(batch.result, name))
+
     def _evaluate_bindings(
         self,
         bindings: Mapping[str, Any],
@@ -750,16 +1580,37 @@ class InfogrooveRenderer:
         if isinstance(value, str):
             scope = _FormulaScope(overlay, base_context, resolved, bindings, name)
             error_label = f"{label} let '{name}'"
+            evaluate = self._evaluator(RenderProfiler.evaluate_binding)
             if PLACEHOLDER_PATTERN.search(value):
                 match = PLACEHOLDER_PATTERN.fullmatch(value.strip())
                 if match:
                     token = match.group(1).strip()
-                    return evaluate_expression(token, scope, label=error_label)
-                return fill_placeholders(value, scope, label=error_label)
-            return evaluate_expression(value, scope, label=error_label)
+                    return evaluate(token, scope, label=error_label)
+                return fill_placeholders(
+                    value,
+                    scope,
+                    label=error_label,
+                    evaluate=self._placeholder_evaluator(),
+                    format_value=self._format_value,
+                )
+            return evaluate(value, scope, label=error_label)
 
         return value
 
+    def _placeholder_evaluator(self) -> Callable[..., Any]:
+        return self._evaluator(RenderProfiler.evaluate_placeholder)
+
+    def _evaluator(self, profiled: Callable[..., Any]) -> Callable[..., Any]:
+        """Return an evaluator routed through this renderer's expression stats.
+
+        ``profiled`` is the :class:`RenderProfiler` method used while a profiler
+        is attached.
+        """
+
+        if self._profiler is None:
+            return self._expression_stats.evaluate
+        return partial(profiled, self._profiler, stats=self._expression_stats)
+
     @staticmethod
     def _make_accessible_bindings(bindings: Mapping[str, Any]) -> dict[str, Any]:
         return {key: ensure_accessible(value) for key, value in bindings.items()}
@@ -767,7 +1618,11 @@ class InfogrooveRenderer:
     def _validate_data(self, data: Any) -> Any:
         minimum, maximum = self._template.expected_range()
         if isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
-            if not all(isinstance(item, Mapping) for item in data):
+            # Sequences that vouch for their items (such as streamed arrays, which
+            # are checked while they are indexed) skip the per-item pass.
+            if not getattr(data, "items_validated", False) and not all(
+                isinstance(item, Mapping) for item in data
+            ):
                 raise DataValidationError("Each data item must be a mapping")
             if minimum is not None or maximum is not None:
                 count = len(data)
@@ -779,20 +1634,32 @@ class InfogrooveRenderer:
         schema = self._template.schema
         if schema is not None:
             try:
-                validate_jsonschema(data, schema)
-            except JSONSchemaValidationError as exc:
-                raise DataValidationError(
-                    f"Input data does not satisfy the template schema: {exc.message}"
-                ) from exc
+                error = best_match(self._schema_validator().iter_errors(data))
             except SchemaError as exc:
                 raise DataValidationError("Template schema definition is invalid") from exc
+            if error is not None:
+                raise DataValidationError(
+                    f"Input data does not satisfy the template schema: {error.message}"
+                )
         return data
 
-    @staticmethod
-    def _normalise_attribute_key(key: str) -> str:
-        key = key.replace("-", "_")
-        if key == "class":
-            return "class_"
-        if any(ch.isupper() for ch in key):
-            return to_snake_case(key)
-        return key
+    def _schema_validator(self) -> Any:
+        """Return a cached validator that also accepts non-list sequences and mappings.
+
+        Columnar inputs (:class:`~infogroove.columns.Columns`), tuples, and other
+        read-only containers validate as JSON arrays and objects.
+        """
+
+        if self._validator is None:
+            schema = self._template.schema
+            base = validator_for(schema)
+            base.check_schema(schema)
+            type_checker = base.TYPE_CHECKER.redefine_many(
+                {
+                    "array": lambda _, value: isinstance(value, Sequence)
+                    and not isinstance(value, (str, bytes)),
+                    "object": lambda _, value: isinstance(value, Mapping),
+                }
+            )
+            self._validator = extend_validator(base, type_checker=type_checker)(schema)
+        return self._validator
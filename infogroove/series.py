@@ -0,0 +1,184 @@
+"""Coordinate strings for ``points`` and ``d`` attributes built from point collections."""
+
+from __future__ import annotations
+
+from collections import ChainMap
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from math import isfinite
+from operator import itemgetter
+from typing import Any
+
+from .columns import Columns, to_python
+from .downsample import DOWNSAMPLE_METHODS
+from .exceptions import RenderError
+from .formula import compile_point_expression
+from .geometry import Subpath, format_path, simplify
+from .models import PointSeriesSpec
+from .utils import NumberFormat, compile_path, ensure_accessible, resolve_path, unwrap_adapter
+
+Evaluate = Callable[..., Any]
+
+_NEGATIVE_ZERO = {"-0": "0"}
+
+
+class PointSeries:
+    """Builder turning one point-collection attribute into its coordinate string.
+
+    Each of the ``x``/``y`` expressions is reduced once per render to a plain
+    numeric function of the point fields it reads (see
+    :func:`~infogroove.formula.compile_point_expression`), then mapped over
+    whole columns of field values; :class:`~infogroove.columns.Columns` input
+    hands its columns over without building rows. Expressions sympy cannot
+    reduce fall back to evaluating per point. Polyline and polygon ``points``
+    are emitted as ``x,y x,y ...`` and path ``d`` as ``Mx,yLx,y x,y ...``.
+    """
+
+    __slots__ = ("_spec", "_path", "_format")
+
+    def __init__(self, spec: PointSeriesSpec, attribute: str, format_value: Callable[[Any], str]) -> None:
+        self._spec = spec
+        self._path = attribute == "d"
+        self._format = format_value
+
+    def build(
+        self,
+        context: Mapping[str, Any],
+        *,
+        label: str,
+        evaluate: Evaluate,
+        target: int | None = None,
+    ) -> str:
+        """Return the coordinate string for the points found in ``context``.
+
+        With a ``target`` and a ``downsample`` declaration, the computed
+        coordinates are reduced to about ``target`` points before formatting;
+        a ``simplify`` declaration then drops vertices within its tolerance
+        and snaps the rest to its grid.
+        """
+
+        spec = self._spec
+        try:
+            collection = resolve_path(context, spec.items)
+        except KeyError as exc:
+            raise RenderError(f"{label}: unable to resolve point items at '{spec.items}'") from exc
+        collection = unwrap_adapter(collection)
+        if not isinstance(collection, Iterable) or isinstance(collection, (str, bytes, Mapping)):
+            raise RenderError(f"{label}: point items at '{spec.items}' are not a collection")
+        if not isinstance(collection, Sequence):
+            collection = list(collection)
+
+        xs = self._coordinates(spec.x, collection, context, label=label, evaluate=evaluate)
+        ys = self._coordinates(spec.y, collection, context, label=label, evaluate=evaluate)
+        if spec.downsample is not None and target is not None and len(xs) > target:
+            try:
+                indices = DOWNSAMPLE_METHODS[spec.downsample.method](xs, ys, target)
+            except TypeError as exc:
+                raise RenderError(f"{label}: downsampling needs numeric coordinates") from exc
+            xs = [xs[index] for index in indices]
+            ys = [ys[index] for index in indices]
+        simplification = spec.simplify
+        if simplification is not None:
+            try:
+                xs, ys = simplify(
+                    xs,
+                    ys,
+                    method=simplification.method,
+                    tolerance=simplification.tolerance,
+                    grid=simplification.grid,
+                )
+            except TypeError as exc:
+                raise RenderError(f"{label}: simplification needs numeric coordinates") from exc
+            if simplification.relative:
+                return format_path([Subpath(xs, ys)], self._scalar_format(), relative=True)
+        pairs = list(map(_join_pair, self._format_column(xs), self._format_column(ys)))
+        if not self._path:
+            return " ".join(pairs)
+        if not pairs:
+            return ""
+        if len(pairs) == 1:
+            return f"M{pairs[0]}"
+        return f"M{pairs[0]}L{' '.join(pairs[1:])}"
+
+    def _scalar_format(self) -> Callable[[Any], str]:
+        decimals = self._spec.precision
+        return self._format if decimals is None else NumberFormat(decimals=decimals).formatter()
+
+    def _format_column(self, values: Iterable[Any]) -> list[str]:
+        # NumPy-backed columns yield NumPy scalars; format them as Python numbers.
+        values = list(map(to_python, values))
+        decimals = self._spec.precision
+        if decimals is None:
+            return list(map(self._format, values))
+        if decimals == 0:
+            return [str(round(value)) if type(value) is float and isfinite(value) else str(value) for value in values]
+        # Same output as NumberFormat(decimals=...) with trimming, without a call per value.
+        spec = f".{decimals}f"
+        texts = [
+            format(value, spec).rstrip("0").rstrip(".") if type(value) is float else str(value)
+            for value in values
+        ]
+        return [_NEGATIVE_ZERO.get(text, text) for text in texts] if "-0" in texts else texts
+
+    def _coordinates(
+        self,
+        expression: str,
+        points: Sequence[Any],
+        context: Mapping[str, Any],
+        *,
+        label: str,
+        evaluate: Evaluate,
+    ) -> list[Any]:
+        alias = self._spec.alias
+        compiled = compile_point_expression(expression, context, alias=alias)
+        if compiled is None:
+            return self._evaluate_each(expression, points, context, label=label, evaluate=evaluate)
+        function, paths = compiled
+        columns = [_field_column(points, path, label=label) for path in paths]
+        try:
+            return list(map(function, *columns)) if columns else [function()] * len(points)
+        except (TypeError, ValueError, ZeroDivisionError, OverflowError) as exc:
+            raise RenderError(f"{label}: unable to evaluate '{expression}' for every point ({exc})") from exc
+
+    def _evaluate_each(
+        self,
+        expression: str,
+        points: Sequence[Any],
+        context: Mapping[str, Any],
+        *,
+        label: str,
+        evaluate: Evaluate,
+    ) -> list[Any]:
+        alias = self._spec.alias
+        frame: dict[str, Any] = {}
+        scope = ChainMap(frame, context)
+        values: list[Any] = []
+        for index, point in enumerate(points):
+            frame[alias] = ensure_accessible(point)
+            frame["__index__"] = index
+            values.append(evaluate(expression, scope, label=label))
+        return values
+
+
+def _join_pair(x: str, y: str) -> str:
+    return f"{x},{y}"
+
+
+def _field_column(points: Sequence[Any], path: str | None, *, label: str) -> Sequence[Any]:
+    """Return the values of ``path`` for every point (``None`` means the point index)."""
+
+    if path is None:
+        return range(len(points))
+    if path == "":
+        return points
+    if isinstance(points, Columns) and path in points.names:
+        return points.column(path)
+    if path.isidentifier():
+        try:
+            return list(map(itemgetter(path), points))
+        except (KeyError, IndexError, TypeError):
+            pass  # Not plain mappings; resolve through the general path logic below.
+    resolver = compile_path(path)
+    try:
+        return [resolver(point) for point in points]
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        raise RenderError(f"{label}: every point needs a value at '{path}'") from exc
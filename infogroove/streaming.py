@@ -0,0 +1,233 @@
+"""Memory-mapped, incrementally decoded JSON arrays for large input files."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import queue
+import re
+import threading
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import IO, Any
+
+from .exceptions import DataValidationError
+
+# A complete JSON string (escapes included) or a single structural character.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},:]', re.DOTALL)
+_WHITESPACE = b" \t\r\n"
+_END = object()
+
+
+class JSONArrayStream(Sequence[dict[str, Any]]):
+    """Read-only sequence over an array of JSON objects inside a memory-mapped file.
+
+    Opening the stream scans the file once with a structural tokenizer that
+    records the byte span of every array element and checks that each one is
+    an object; no element is decoded during the scan. Elements are decoded on
+    access, so resident memory is bounded by the span index (16 bytes per item)
+    plus whatever the caller keeps, independent of the input size.
+
+    Because the scan already rejects non-object elements, the stream sets
+    ``items_validated`` so the renderer skips its own per-item mapping check,
+    which would otherwise decode every element up front.
+    """
+
+    items_validated = True
+
+    def __init__(self, path: str | Path, *, key: str | None = "items") -> None:
+        self._path = Path(path)
+        try:
+            with self._path.open("rb") as handle:
+                self._buffer: Any = (
+                    mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                    if self._path.stat().st_size
+                    else b""
+                )
+        except OSError as exc:
+            raise DataValidationError(f"Unable to read input data '{self._path}'") from exc
+        self._starts = array("q")
+        self._ends = array("q")
+        try:
+            self._index(key)
+        except DataValidationError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Release the memory map."""
+
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = b""
+
+    def __enter__(self) -> JSONArrayStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index: int) -> dict[str, Any]:  # type: ignore[override]
+        if isinstance(index, slice):
+            raise TypeError("JSONArrayStream does not support slicing")
+        return self._decode(self._starts[index], self._ends[index])
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for start, end in zip(self._starts, self._ends):
+            yield self._decode(start, end)
+
+    def __repr__(self) -> str:
+        return f"JSONArrayStream({str(self._path)!r}, items={len(self)})"
+
+    def _decode(self, start: int, end: int) -> dict[str, Any]:
+        try:
+            return json.loads(self._buffer[start:end])
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise DataValidationError(
+                f"Input data file is not valid JSON (item at byte {start})"
+            ) from exc
+
+    def _index(self, key: str | None) -> None:
+        buffer = self._buffer
+        position = _skip_whitespace(buffer, 0)
+        opening = buffer[position : position + 1]
+        if opening == b"{" and key is not None:
+            position = self._find_key(key, position + 1)
+        elif opening != b"[":
+            raise DataValidationError(
+                "Input data must be a JSON array of objects or contain an 'items' array"
+            )
+        self._scan_array(position)
+
+    def _find_key(self, key: str, position: int) -> int:
+        """Return the offset of the ``[`` opening the array stored under ``key``."""
+
+        buffer = self._buffer
+        depth = 0
+        expect_key = True
+        for match in _TOKEN.finditer(buffer, position):
+            token = match.group()
+            first = token[:1]
+            if depth == 0 and first == b'"' and expect_key:
+                colon = _skip_whitespace(buffer, match.end())
+                if buffer[colon : colon + 1] != b":":
+                    break
+                value = _skip_whitespace(buffer, colon + 1)
+                if json.loads(token) == key and buffer[value : value + 1] == b"[":
+                    return value
+                expect_key = False
+            elif first in b"{[":
+                depth += 1
+            elif first in b"}]":
+                if depth == 0:
+                    break
+                depth -= 1
+            elif first == b"," and depth == 0:
+                expect_key = True
+        raise DataValidationError(
+            "Input data must be a JSON array of objects or contain an 'items' array"
+        )
+
+    def _scan_array(self, position: int) -> None:
+        """Record the byte span of every element of the array opening at ``position``."""
+
+        buffer = self._buffer
+        starts, ends = self._starts, self._ends
+        depth = 0
+        item_start = 0
+        previous_end = position + 1
+        for match in _TOKEN.finditer(buffer, position + 1):
+            first = match.group()[:1]
+            if first in b"{[":
+                if depth == 0:
+                    item_start = match.start()
+                    if first != b"{" or not _is_separator(buffer, previous_end, item_start, bool(starts)):
+                        raise DataValidationError("Each element in the data array must be an object")
+                depth += 1
+            elif first in b"}]":
+                if depth == 0:
+                    if first != b"]" or buffer[previous_end : match.start()].strip(_WHITESPACE):
+                        raise DataValidationError("Each element in the data array must be an object")
+                    return
+                depth -= 1
+                if depth == 0:
+                    starts.append(item_start)
+                    ends.append(match.end())
+                    previous_end = match.end()
+            elif depth == 0 and first == b'"':
+                raise DataValidationError("Each element in the data array must be an object")
+        raise DataValidationError("Input data file is not valid JSON (unterminated array)")
+
+
+def _skip_whitespace(buffer: Any, position: int) -> int:
+    length = len(buffer)
+    while position < length and buffer[position : position + 1] in (b" ", b"\t", b"\r", b"\n"):
+        position += 1
+    return position
+
+
+def _is_separator(buffer: Any, start: int, end: int, needs_comma: bool) -> bool:
+    gap = buffer[start:end].strip(_WHITESPACE)
+    return gap == (b"," if needs_comma else b"")
+
+
+
+def iter_ndjson(
+    handle: IO[str],
+    *,
+    prefetch: int = 16,
+) -> Iterator[tuple[int, Any | DataValidationError]]:
+    """Yield ``(line_number, payload)`` for each non-blank line of an NDJSON stream.
+
+    Lines are read and decoded on a background thread up to ``prefetch`` lines
+    ahead of the consumer, so parsing the next dataset overlaps with whatever
+    the caller does with the current one. Lines that are not valid JSON yield a
+    :class:`DataValidationError` in place of the payload instead of stopping
+    the stream; read errors are re-raised in the consumer.
+    """
+
+    pending: queue.Queue[Any] = queue.Queue(maxsize=max(prefetch, 1))
+    stop = threading.Event()
+
+    def put(entry: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pending.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reader() -> None:
+        try:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    payload: Any = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    payload = DataValidationError(f"Input line is not valid JSON: {exc.msg}")
+                if not put((line_number, payload)):
+                    return
+        except BaseException as exc:  # pragma: no cover - surfaced in the consumer
+            put(exc)
+        put(_END)
+
+    thread = threading.Thread(target=reader, name="infogroove-ndjson-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            entry = pending.get()
+            if entry is _END:
+                return
+            if isinstance(entry, BaseException):
+                raise entry
+            yield entry
+    finally:
+        stop.set()
+        # The reader may be blocked on an interactive stream; it is a daemon thread.
+        thread.join(timeout=1.0)
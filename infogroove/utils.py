@@ -12,7 +12,7 @@ import tokenize
 from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from types import SimpleNamespace
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator
 
 PLACEHOLDER_PATTERN = re.compile(r"\{([^{}]+)\}")
 
@@ -87,12 +87,66 @@ def unwrap_accessible(value: Any) -> Any:
 _unwrap_accessible = unwrap_accessible
 
 
+def unwrap_adapter(value: Any) -> Any:
+    """Return the container wrapped by an adapter without copying it."""
+
+    if isinstance(value, MappingAdapter):
+        return value._mapping
+    if isinstance(value, SequenceAdapter):
+        return value._values
+    return value
+
+
 def stringify(value: Any) -> str:
     """Convert scalars into user-friendly strings for placeholder expansion."""
 
     return str(value)
 
 
+@dataclass(slots=True, frozen=True)
+class NumberFormat:
+    """Policy for rendering floating point results into SVG output.
+
+    ``decimals`` rounds to a fixed number of decimal places; otherwise
+    ``significant`` keeps that many significant digits (``g`` formatting, which
+    may use exponent notation for very large or small magnitudes). ``trim``
+    drops trailing zeros and a dangling decimal point. Integers, booleans,
+    non-finite floats, and non-numeric values are left untouched.
+    """
+
+    decimals: int | None = None
+    significant: int | None = None
+    trim: bool = True
+
+    def __post_init__(self) -> None:
+        if self.decimals is not None and self.decimals < 0:
+            raise ValueError("NumberFormat.decimals must not be negative")
+        if self.significant is not None and self.significant < 1:
+            raise ValueError("NumberFormat.significant must be at least 1")
+
+    def formatter(self) -> Callable[[Any], str]:
+        """Return a stringifier applying this policy, specialised once up front."""
+
+        if self.decimals is not None:
+            spec = f".{self.decimals}f"
+        elif self.significant is not None:
+            spec = f".{self.significant}g"
+        else:
+            return stringify
+        trim = self.trim and self.decimals is not None
+        isfinite = math.isfinite
+
+        def format_value(value: Any) -> str:
+            if not isinstance(value, float) or not isfinite(value):
+                return str(value)
+            text = format(value, spec)
+            if trim and "." in text:
+                text = text.rstrip("0").rstrip(".")
+            return "0" if text == "-0" else text
+
+        return format_value
+
+
 def derive_schema_item_bounds(schema: Mapping[str, Any]) -> tuple[int | None, int | None]:
     """Return ``(minItems, maxItems)`` for a JSON Schema array definition when available."""
 
@@ -174,7 +228,19 @@ def tokenize_path(expression: str) -> list[str]:
 def resolve_path(context: Mapping[str, Any], path: str) -> Any:
     """Resolve a dotted path against a nested mapping/sequence context."""
 
-    tokens = tokenize_path(path)
+    return resolve_tokens(context, tokenize_path(path))
+
+
+def compile_path(path: str) -> Callable[[Any], Any]:
+    """Tokenize ``path`` once and return a resolver that applies it to any value."""
+
+    tokens = tuple(tokenize_path(path))
+    return lambda value: resolve_tokens(value, tokens)
+
+
+def resolve_tokens(context: Any, tokens: Sequence[str]) -> Any:
+    """Resolve pre-tokenized path segments against a nested mapping/sequence value."""
+
     current: Any = context
     for idx, token in enumerate(tokens):
         is_last = idx == len(tokens) - 1
@@ -650,14 +716,23 @@ def fill_placeholders(
     context: Mapping[str, Any],
     *,
     label: str | None = None,
+    evaluate: Callable[..., Any] | None = None,
+    format_value: Callable[[Any], str] = stringify,
 ) -> str:
-    """Inject context values into ``{placeholder}`` slots within a template string."""
+    """Inject context values into ``{placeholder}`` slots within a template string.
+
+    ``evaluate`` overrides the expression evaluator; it receives the placeholder
+    expression, the context, and the ``label`` keyword argument.
+    ``format_value`` converts each non-``None`` result into text (see
+    :meth:`NumberFormat.formatter`).
+    """
+
+    if evaluate is None:
+        from .formula import evaluate_expression as evaluate
 
     def _replacement(match: re.Match[str]) -> str:
         token = match.group(1).strip()
-        from .formula import evaluate_expression
-
-        value = evaluate_expression(token, context, label=label)
-        return "" if value is None else stringify(value)
+        value = evaluate(token, context, label=label)
+        return "" if value is None else format_value(value)
 
     return PLACEHOLDER_PATTERN.sub(_replacement, template)
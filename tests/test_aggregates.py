@@ -0,0 +1,85 @@
+import pytest
+
+from infogroove.aggregates import compute_aggregates, percentile
+from infogroove.exceptions import RenderError
+from infogroove.models import AggregateSpec
+
+
+class CountingRows:
+    def __init__(self, rows):
+        self.rows = rows
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return iter(self.rows)
+
+
+ROWS = [
+    {"value": 4, "kind": "a"},
+    {"value": 1, "kind": "b"},
+    {"value": 7, "kind": "a"},
+    {"value": "n/a", "kind": "b"},
+    {"kind": "c"},
+]
+
+
+def test_compute_aggregates_shares_a_single_pass():
+    rows = CountingRows(ROWS)
+    specs = {
+        "low": AggregateSpec(op="min", field="value"),
+        "high": AggregateSpec(op="max", field="value"),
+        "sum": AggregateSpec(op="sum", field="value"),
+        "mean": AggregateSpec(op="mean", field="value"),
+        "rows": AggregateSpec(op="count"),
+        "valued": AggregateSpec(op="count", field="value"),
+        "quartiles": AggregateSpec(op="percentile", field="value", q=(25.0, 75.0)),
+    }
+
+    result = compute_aggregates(specs, rows)
+
+    assert rows.passes == 1
+    assert result == {
+        "low": 1,
+        "high": 7,
+        "sum": 12,
+        "mean": 4,
+        "rows": 5,
+        "valued": 4,
+        "quartiles": [2.5, 5.5],
+    }
+
+
+def test_grouped_aggregates_return_a_mapping_in_first_seen_order():
+    specs = {
+        "totals": AggregateSpec(op="sum", field="value", group_by="kind"),
+        "sizes": AggregateSpec(op="count", group_by="kind"),
+    }
+
+    result = compute_aggregates(specs, ROWS)
+
+    assert result["totals"] == {"a": 11, "b": 1}
+    assert list(result["sizes"].items()) == [("a", 2), ("b", 2), ("c", 1)]
+
+
+def test_unhashable_group_keys_raise_render_error():
+    specs = {"byTags": AggregateSpec(op="count", group_by="tags")}
+
+    with pytest.raises(RenderError, match="Aggregate 'byTags': groupBy 'tags'.*unhashable list"):
+        compute_aggregates(specs, [{"tags": ["a", "b"]}])
+
+
+def test_empty_input_yields_none_for_value_operations():
+    specs = {
+        "high": AggregateSpec(op="max", field="value"),
+        "mean": AggregateSpec(op="mean", field="value"),
+        "p90": AggregateSpec(op="percentile", field="value", q=90.0),
+        "rows": AggregateSpec(op="count"),
+    }
+
+    assert compute_aggregates(specs, []) == {"high": None, "mean": None, "p90": None, "rows": 0}
+
+
+@pytest.mark.parametrize("q, expected", [(0, 1), (50, 2.5), (100, 4), (90, 3.7)])
+def test_percentile_interpolates_linearly(q, expected):
+    assert percentile([1, 2, 3, 4], q) == pytest.approx(expected)
@@ -1,10 +1,13 @@
+import gzip
+import io
 import json
+import sys
 from pathlib import Path
 
 import pytest
 
 from infogroove import render_svg
-from infogroove.cli import _load_data, _write_output, main
+from infogroove.cli import _TextSink, _load_data, _write_output, main
 from infogroove.exceptions import DataValidationError
 
 
@@ -95,6 +98,38 @@ def test_main_defaults_to_stdout_when_output_missing(tmp_path, capsys):
     assert "svg" in captured.out
 
 
+def test_failed_render_keeps_existing_output_and_prints_nothing(tmp_path, capsys):
+    template_path = tmp_path / "def.json"
+    template_path.write_text(
+        json.dumps(
+            {
+                "properties": {"canvas": {"width": 100, "height": 100}},
+                "template": [
+                    {
+                        "type": "text",
+                        "text": "{1 / item.value}",
+                        "repeat": {"items": "data", "as": "item"},
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps([{"value": 1}, {"value": 0}]), encoding="utf-8")
+    output_path = tmp_path / "out.svg"
+    output_path.write_text("OLD CONTENT", encoding="utf-8")
+
+    for destination in (str(output_path), "-"):
+        with pytest.raises(SystemExit) as exc:
+            main(["-f", str(template_path), "-i", str(data_path), "-o", destination])
+        assert exc.value.code == 1
+
+    assert output_path.read_text(encoding="utf-8") == "OLD CONTENT"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["data.json", "def.json", "out.svg"]
+    assert capsys.readouterr().out == ""
+
+
 @pytest.mark.parametrize(
     "payload",
     [
@@ -141,3 +176,256 @@ def test_render_svg_helper(tmp_path, payload):
     else:
         with pytest.raises(DataValidationError):
             _load_data(str(data_path))
+
+
+def test_gen_data_writes_schema_valid_payload(tmp_path):
+    template_path = tmp_path / "def.json"
+    template_path.write_text(
+        json.dumps(
+            {
+                "properties": {"canvas": {"width": 100, "height": 100}},
+                "template": [],
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "items": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "required": ["label"],
+                                "properties": {"label": {"type": "string"}},
+                            },
+                        }
+                    },
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "data.json"
+
+    exit_code = main(
+        ["gen-data", "-f", str(template_path), "--items", "500", "--seed", "1", "-o", str(output_path)]
+    )
+
+    assert exit_code == 0
+    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    assert len(payload["items"]) == 500
+    assert all(isinstance(entry["label"], str) for entry in payload["items"])
+
+
+def test_main_streams_large_inputs(tmp_path):
+    template_path = tmp_path / "def.json"
+    template_path.write_text(
+        json.dumps(
+            {
+                "properties": {"canvas": {"width": 100, "height": 100}},
+                "template": [
+                    {
+                        "type": "rect",
+                        "attributes": {"width": "{row.value / maxValue * 100}", "height": "2"},
+                        "repeat": {"items": "items", "as": "row"},
+                    }
+                ],
+                "schema": {"type": "array", "items": {"type": "object", "required": ["value"]}},
+            }
+        ),
+        encoding="utf-8",
+    )
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps({"items": [{"value": value} for value in range(1, 51)]}), encoding="utf-8")
+    streamed_path = tmp_path / "streamed.svg"
+    loaded_path = tmp_path / "loaded.svg"
+
+    assert main(["-f", str(template_path), "-i", str(data_path), "-o", str(streamed_path), "--stream"]) == 0
+    assert main(["-f", str(template_path), "-i", str(data_path), "-o", str(loaded_path)]) == 0
+
+    streamed = streamed_path.read_text(encoding="utf-8")
+    assert streamed == loaded_path.read_text(encoding="utf-8")
+    assert streamed.count("<rect") == 50
+
+
+def test_main_renders_ndjson_lines_into_out_dir(tmp_path, monkeypatch, capsys):
+    template_path = tmp_path / "def.json"
+    template_path.write_text(
+        json.dumps(
+            {
+                "properties": {"canvas": {"width": 100, "height": 100}},
+                "template": [
+                    {
+                        "type": "text",
+                        "text": "{row.label}",
+                        "repeat": {"items": "items", "as": "row"},
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    lines = [
+        json.dumps([{"label": "first"}]),
+        "",
+        "{not json",
+        json.dumps({"items": [{"label": "third"}, {"label": "again"}]}),
+        json.dumps({"rows": []}),
+    ]
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(lines) + "\n"))
+    out_dir = tmp_path / "out"
+
+    status = main(["-f", str(template_path), "--ndjson", "-i", "-", "--out-dir", str(out_dir)])
+
+    assert status == 1
+    assert sorted(path.name for path in out_dir.iterdir()) == ["000001.svg", "000004.svg"]
+    assert "first" in (out_dir / "000001.svg").read_text(encoding="utf-8")
+    assert (out_dir / "000004.svg").read_text(encoding="utf-8").count("<text") == 2
+    errors = capsys.readouterr().err.splitlines()
+    assert errors[0].startswith("error: line 3: Input line is not valid JSON")
+    assert errors[1].startswith("error: line 5: Input data must be")
+
+
+def test_ndjson_requires_out_dir(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["-f", str(tmp_path / "def.json"), "--ndjson", "-i", "-"])
+
+
+def test_main_reads_stdin_and_writes_gzip_to_stdout(tmp_path, monkeypatch, capsysbinary):
+    template_path = tmp_path / "def.json"
+    template_path.write_text(
+        json.dumps(
+            {
+                "properties": {"canvas": {"width": 100, "height": 100}},
+                "template": [{"type": "text", "text": "{row.label}", "repeat": {"items": "items", "as": "row"}}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    payload = json.dumps([{"label": "piped ✓"}]).encode("utf-8")
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(payload), encoding="utf-8"))
+
+    assert main(["-f", str(template_path), "-i", "-", "--gzip"]) == 0
+
+    markup = gzip.decompress(capsysbinary.readouterr().out).decode("utf-8")
+    assert markup.startswith("<svg") and "piped ✓" in markup
+
+
+def test_write_output_compresses_files(tmp_path):
+    output_path = tmp_path / "output.svgz"
+    markup = "<svg>" + "<rect/>" * 100_000 + "</svg>"
+
+    _write_output(markup, str(output_path), compress=True)
+
+    compressed = output_path.read_bytes()
+    assert len(compressed) < len(markup) // 100
+    assert gzip.decompress(compressed).decode("utf-8") == markup
+
+
+def test_main_compresses_svgz_destinations(tmp_path):
+    template_path = tmp_path / "def.json"
+    template_path.write_text(
+        json.dumps({"properties": {"canvas": {"width": 10, "height": 10}}, "template": [{"type": "rect"}]}),
+        encoding="utf-8",
+    )
+    data_path = tmp_path / "data.json"
+    data_path.write_text("[]", encoding="utf-8")
+    output_path = tmp_path / "chart.svgz"
+
+    args = ["-f", str(template_path), "-i", str(data_path), "-o", str(output_path), "--compression-level", "1"]
+    assert main(args) == 0
+
+    assert gzip.decompress(output_path.read_bytes()).decode("utf-8").endswith("<rect/></svg>")
+
+
+def test_main_minify_reports_savings(tmp_path, capsys):
+    template_path = tmp_path / "def.json"
+    template = {
+        "properties": {"canvas": {"width": 10, "height": 10}},
+        "template": [{"type": "rect", "attributes": {"x": "0", "fill": "#FF0000", "opacity": "1"}}],
+    }
+    template_path.write_text(json.dumps(template), encoding="utf-8")
+    data_path = tmp_path / "data.json"
+    data_path.write_text("[]", encoding="utf-8")
+    output_path = tmp_path / "chart.svg"
+
+    assert main(["-f", str(template_path), "-i", str(data_path), "-o", str(output_path), "--minify"]) == 0
+
+    assert output_path.read_text(encoding="utf-8").endswith('<rect fill="red"/></svg>')
+    assert "minify: saved ~" in capsys.readouterr().err
+
+
+def test_main_cull_drops_offscreen_shapes(tmp_path):
+    template_path = tmp_path / "def.json"
+    template = {
+        "properties": {"canvas": {"width": 10, "height": 10}},
+        "template": [
+            {"type": "rect", "attributes": {"x": "20", "width": "4", "height": "4"}},
+            {"type": "rect", "attributes": {"x": "2", "width": "4", "height": "4"}},
+        ],
+    }
+    template_path.write_text(json.dumps(template), encoding="utf-8")
+    data_path = tmp_path / "data.json"
+    data_path.write_text("[]", encoding="utf-8")
+    output_path = tmp_path / "chart.svg"
+
+    assert main(["-f", str(template_path), "-i", str(data_path), "-o", str(output_path), "--cull"]) == 0
+    assert output_path.read_text(encoding="utf-8").count("<rect") == 1
+
+    assert main(["-f", str(template_path), "-i", str(data_path), "-o", str(output_path), "--cull", "12"]) == 0
+    assert output_path.read_text(encoding="utf-8").count("<rect") == 2
+
+
+def test_main_writes_to_text_only_stdout(tmp_path, monkeypatch):
+    template_path = tmp_path / "def.json"
+    template = {
+        "properties": {"canvas": {"width": 10, "height": 10}},
+        "template": [{"type": "text", "text": "{items[0].label}"}],
+    }
+    template_path.write_text(json.dumps(template), encoding="utf-8")
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps([{"label": "é" * 70000}]), encoding="utf-8")
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    assert main(["-f", str(template_path), "-i", str(data_path)]) == 0
+    assert stdout.getvalue().endswith("é</text></svg>")
+
+    with pytest.raises(SystemExit) as excinfo:
+        main(["-f", str(template_path), "-i", str(data_path), "--gzip"])
+    assert excinfo.value.code == 1
+
+
+def test_text_sink_decodes_characters_split_across_writes():
+    target = io.StringIO()
+    sink = _TextSink(target)
+
+    encoded = "née".encode("utf-8")
+    sink.write(encoded[:2])
+    sink.write(encoded[2:])
+    sink.close()
+
+    assert target.getvalue() == "née"
+
+
+def test_main_compresses_raw_output_for_gz_destinations(tmp_path):
+    template_path = tmp_path / "def.json"
+    template = {"properties": {"canvas": {"width": 10, "height": 10}}, "template": [{"type": "rect"}]}
+    template_path.write_text(json.dumps(template), encoding="utf-8")
+    data_path = tmp_path / "data.json"
+    data_path.write_text("[]", encoding="utf-8")
+    output_path = tmp_path / "nodes.json.gz"
+
+    assert main(["-f", str(template_path), "-i", str(data_path), "-o", str(output_path), "--raw"]) == 0
+
+    assert json.loads(gzip.decompress(output_path.read_bytes()))[0]["type"] == "rect"
+
+
+def test_ndjson_reports_missing_input_file(tmp_path, capsys):
+    template_path = tmp_path / "def.json"
+    template = {"properties": {"canvas": {"width": 10, "height": 10}}, "template": [{"type": "rect"}]}
+    template_path.write_text(json.dumps(template), encoding="utf-8")
+    args = ["-f", str(template_path), "-i", str(tmp_path / "missing.ndjson")]
+
+    with pytest.raises(SystemExit) as excinfo:
+        main([*args, "--ndjson", "--out-dir", str(tmp_path / "out")])
+
+    assert excinfo.value.code == 1
+    assert "Unable to read input data" in capsys.readouterr().err
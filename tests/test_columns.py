@@ -0,0 +1,84 @@
+from array import array
+
+import pytest
+
+from infogroove import Columns, Infogroove
+from infogroove.columns import RowView, to_python
+from infogroove.exceptions import DataValidationError
+
+
+class FakeScalar:
+    """Stand-in for a NumPy scalar: exposes ``dtype`` and ``item()``."""
+
+    dtype = "float64"
+
+    def __init__(self, value):
+        self._value = value
+
+    def item(self):
+        return self._value
+
+
+TEMPLATE = {
+    "properties": {"canvas": {"width": 100, "height": 40}},
+    "template": [
+        {
+            "type": "rect",
+            "repeat": {"items": "items", "as": "row", "where": "row.value > 1"},
+            "attributes": {"width": "{row.value / maxValue * 100}", "height": "4", "class": "{row.label}"},
+        }
+    ],
+    "schema": {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["label", "value"],
+                    "properties": {"label": {"type": "string"}, "value": {"type": "number"}},
+                },
+            }
+        },
+    },
+}
+
+
+def test_rows_are_views_over_the_columns():
+    columns = Columns({"label": ["a", "b"], "value": array("d", [1.5, 2.5])})
+
+    row = columns[-1]
+
+    assert isinstance(row, RowView)
+    assert len(columns) == 2
+    assert dict(row) == {"label": "b", "value": 2.5}
+    assert [dict(view) for view in columns] == [{"label": "a", "value": 1.5}, {"label": "b", "value": 2.5}]
+    with pytest.raises(IndexError):
+        columns[2]
+
+
+def test_columns_must_share_a_length():
+    with pytest.raises(ValueError, match="same length"):
+        Columns({"label": ["a"], "value": [1, 2]})
+
+
+def test_numpy_like_scalars_are_converted():
+    assert to_python(FakeScalar(3)) == 3
+    assert Columns({"value": [FakeScalar(4.0)]})[0]["value"] == 4.0
+
+
+def test_renderer_accepts_columnar_payloads():
+    renderer = Infogroove(TEMPLATE)
+    data = {"items": Columns({"label": ["a", "b", "c"], "value": array("i", [1, 2, 4])})}
+
+    node_specs = renderer.translate(data)
+
+    assert [node["attributes"]["width"] for node in node_specs] == ["50", "100"]
+    assert [node["attributes"]["class"] for node in node_specs] == ["b", "c"]
+
+
+def test_columnar_payloads_are_validated_against_the_schema():
+    renderer = Infogroove(TEMPLATE)
+
+    with pytest.raises(DataValidationError, match="'label' is a required property"):
+        renderer.translate({"items": Columns({"value": [1, 2]})})
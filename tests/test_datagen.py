@@ -0,0 +1,165 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft202012Validator, validate
+
+from infogroove import Infogroove
+from infogroove.datagen import find_collection_key, generate_data, iter_items, write_data
+from infogroove.exceptions import TemplateError
+from infogroove.loader import load_path
+
+EXAMPLES = sorted(Path(__file__).resolve().parent.parent.joinpath("examples").glob("*/def.json"))
+
+SCHEMA = {
+    "type": "object",
+    "required": ["items", "title"],
+    "properties": {
+        "title": {"type": "string", "maxLength": 8},
+        "items": {
+            "type": "array",
+            "minItems": 1,
+            "maxItems": 100,
+            "items": {
+                "type": "object",
+                "required": ["label", "value", "kind"],
+                "properties": {
+                    "label": {"type": "string"},
+                    "value": {"type": "number", "minimum": 10, "maximum": 20},
+                    "count": {"type": "integer", "minimum": 1, "maximum": 3},
+                    "kind": {"enum": ["a", "b"]},
+                    "tags": {"type": "array", "items": {"$ref": "#/$defs/tag"}},
+                },
+                "additionalProperties": False,
+            },
+        },
+    },
+    "$defs": {"tag": {"type": "string", "minLength": 2}},
+}
+
+
+@pytest.mark.parametrize("template_path", EXAMPLES, ids=lambda path: path.parent.name)
+def test_generated_data_satisfies_example_schemas(template_path):
+    renderer = load_path(template_path)
+    schema = renderer.template.schema
+
+    payload = generate_data(schema, seed=1)
+
+    validate(payload, schema)
+    assert "<svg" in renderer.render(payload)
+
+
+def test_generate_data_is_deterministic_and_respects_constraints():
+    first = generate_data(SCHEMA, items=25, seed=7)
+    second = generate_data(SCHEMA, items=25, seed=7)
+
+    assert first == second
+    assert first != generate_data(SCHEMA, items=25, seed=8)
+    validate(first, SCHEMA)
+    assert len(first["items"]) == 25
+    assert all(10 <= entry["value"] <= 20 for entry in first["items"])
+    assert {entry["kind"] for entry in first["items"]} <= {"a", "b"}
+
+
+def test_write_data_streams_the_same_payload():
+    buffer = io.StringIO()
+
+    count = write_data(SCHEMA, buffer, items=40, seed=3)
+
+    assert count == 40
+    assert json.loads(buffer.getvalue()) == generate_data(SCHEMA, items=40, seed=3)
+
+
+def test_item_count_must_respect_schema_bounds():
+    with pytest.raises(TemplateError, match="at most 100"):
+        list(iter_items(SCHEMA, items=101))
+
+    with pytest.raises(TemplateError, match="at least 1"):
+        list(iter_items(SCHEMA, items=0))
+
+
+def test_array_root_schema_generates_list():
+    schema = {"type": "array", "items": {"type": "object", "properties": {"x": {"type": "integer"}}}}
+
+    payload = generate_data(schema, items=3)
+
+    assert find_collection_key(schema) is None
+    assert isinstance(payload, list) and len(payload) == 3
+    assert all(isinstance(entry["x"], int) for entry in payload)
+
+
+def test_exclusive_bounds_only_step_by_one_for_integers():
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "ratio": {"type": "number", "exclusiveMinimum": 0, "maximum": 0.5},
+                "count": {"type": "integer", "exclusiveMinimum": 0.5, "exclusiveMaximum": 3},
+            },
+            "required": ["ratio", "count"],
+        },
+    }
+
+    payload = generate_data(schema, items=50, seed=1)
+
+    validate(payload, schema)
+    assert all(0 < entry["ratio"] <= 0.5 for entry in payload)
+    assert {entry["count"] for entry in payload} <= {1, 2}
+
+
+def test_unresolved_schema_reference_raises_template_error():
+    schema = {"type": "array", "items": {"$ref": "#/$defs/missing"}}
+
+    with pytest.raises(TemplateError, match="Unresolved schema reference '#/\\$defs/missing'"):
+        generate_data(schema, items=1)
+
+
+def test_generated_data_satisfies_format_multiple_and_unique_constraints():
+    schema = {
+        "type": "object",
+        "properties": {
+            "items": {
+                "type": "array",
+                "uniqueItems": True,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "when": {"type": "string", "format": "date-time"},
+                        "id": {"type": "string", "format": "uuid"},
+                        "step": {"type": "number", "multipleOf": 0.1, "minimum": 0, "maximum": 5},
+                        "even": {"type": "integer", "multipleOf": 2, "minimum": 1, "maximum": 9},
+                        "tags": {"type": "array", "uniqueItems": True, "items": {"enum": ["a", "b", "c"]}},
+                    },
+                    "required": ["when", "id", "step", "even", "tags"],
+                },
+            }
+        },
+    }
+    renderer = Infogroove(
+        {"properties": {"canvas": {"width": 10, "height": 10}}, "template": [], "schema": schema}
+    )
+
+    payload = generate_data(schema, items=30, seed=4)
+
+    renderer.render(payload)
+    Draft202012Validator(schema, format_checker=Draft202012Validator.FORMAT_CHECKER).validate(payload)
+    assert all(entry["even"] % 2 == 0 for entry in payload["items"])
+    assert all(sorted(entry["tags"]) == ["a", "b", "c"] for entry in payload["items"])
+
+
+@pytest.mark.parametrize(
+    "field, message",
+    [
+        ({"type": "string", "pattern": "^[A-Z]{3}$"}, "'pattern' keyword"),
+        ({"type": "string", "format": "iri"}, "'format' keyword value 'iri'"),
+        ({"type": "integer", "multipleOf": 7, "minimum": 1, "maximum": 6}, "No multiple of 7"),
+        ({"type": "array", "uniqueItems": True, "minItems": 3, "items": {"enum": [1, 2]}}, "distinct items"),
+    ],
+)
+def test_unsupported_or_unsatisfiable_keywords_raise_template_error(field, message):
+    schema = {"type": "array", "items": {"type": "object", "properties": {"code": field}}}
+
+    with pytest.raises(TemplateError, match=message):
+        generate_data(schema, items=1)
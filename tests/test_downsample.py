@@ -0,0 +1,127 @@
+import math
+
+import pytest
+
+from infogroove import Infogroove
+from infogroove.downsample import downsample_items, lttb_indices, minmax_indices
+from infogroove.exceptions import RenderError
+from infogroove.models import DownsampleSpec
+
+
+def _interpolation_error(xs, ys, indices):
+    """Largest vertical distance between the series and its downsampled polyline."""
+
+    worst = 0.0
+    for left, right in zip(indices, indices[1:]):
+        for index in range(left, right + 1):
+            t = (xs[index] - xs[left]) / (xs[right] - xs[left])
+            estimate = ys[left] + t * (ys[right] - ys[left])
+            worst = max(worst, abs(estimate - ys[index]))
+    return worst
+
+
+def test_lttb_bounds_error_on_smooth_series_and_keeps_endpoints():
+    xs = [index / 100 for index in range(10_000)]
+    ys = [math.sin(x) for x in xs]
+
+    indices = lttb_indices(xs, ys, 500)
+
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == len(xs) - 1
+    assert indices == sorted(indices)
+    assert _interpolation_error(xs, ys, indices) < 0.01
+
+
+def test_lttb_keeps_isolated_spikes():
+    ys = [0.0] * 5_000
+    ys[1234] = 100.0
+
+    indices = lttb_indices(range(len(ys)), ys, 100)
+
+    assert 1234 in indices
+
+
+def test_minmax_preserves_the_envelope_of_every_bucket():
+    ys = [math.sin(index / 7) * (index % 13) for index in range(4_000)]
+    target = 200
+
+    indices = minmax_indices(range(len(ys)), ys, target)
+
+    bucket_size = len(ys) / (target // 2)
+    for bucket in range(target // 2):
+        window = range(int(bucket * bucket_size), int((bucket + 1) * bucket_size))
+        kept = [ys[index] for index in indices if index in window]
+        assert min(kept) == min(ys[index] for index in window)
+        assert max(kept) == max(ys[index] for index in window)
+    assert len(indices) <= target + 2
+
+
+def test_short_series_are_returned_unchanged():
+    assert lttb_indices([0, 1, 2], [5, 6, 7], 10) == [0, 1, 2]
+    assert minmax_indices([0, 1, 2], [5, 6, 7], 3) == [0, 1, 2]
+
+
+def test_downsample_items_reads_paths_and_reports_non_numeric_values():
+    items = [{"t": index, "v": index % 5} for index in range(100)]
+
+    selected = downsample_items(items, DownsampleSpec(method="minmax", x="t", y="v"), 10)
+
+    assert selected[0] is items[0] and selected[-1] is items[-1]
+    with pytest.raises(RenderError, match="numeric value at 'v'"):
+        downsample_items([{"v": "high"}] * 20, DownsampleSpec(y="v"), 5)
+
+
+def test_downsampling_without_y_only_accepts_numeric_items():
+    values = [index % 7 for index in range(50)]
+
+    assert len(downsample_items(values, DownsampleSpec(), 10)) == 10
+    with pytest.raises(RenderError, match="without 'y' needs numeric items"):
+        downsample_items([{"v": index} for index in range(50)], DownsampleSpec(), 10)
+
+
+def test_repeat_downsampling_defaults_to_canvas_width():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 50, "height": 20}},
+            "template": [
+                {
+                    "type": "circle",
+                    "repeat": {"items": "data", "as": "p", "downsample": {"y": "v", "x": "t"}},
+                    "attributes": {"cx": "{p.t / 20}", "cy": "{p.v}", "r": "1", "data-total": "{__total__}"},
+                }
+            ],
+        }
+    )
+
+    nodes = renderer.translate([{"t": index, "v": math.sin(index / 50)} for index in range(1_000)])
+
+    assert len(nodes) == 50
+    assert nodes[0]["attributes"]["data-total"] == "50"
+
+
+def test_point_collections_downsample_computed_coordinates():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 200, "height": 20}},
+            "template": [
+                {
+                    "type": "polyline",
+                    "attributes": {
+                        "points": {
+                            "items": "data",
+                            "as": "p",
+                            "x": "__index__ / 10",
+                            "y": "p.v",
+                            "downsample": {"method": "lttb", "target": 40},
+                        }
+                    },
+                }
+            ],
+        }
+    )
+
+    nodes = renderer.translate([{"v": index % 7} for index in range(2_000)])
+
+    points = nodes[0]["attributes"]["points"].split(" ")
+    assert len(points) == 40
+    assert points[0] == "0,0" and points[-1] == "199.9,4"
@@ -1,11 +1,13 @@
+import math
 from types import SimpleNamespace
 
 import pytest
 import sympy
 
+from infogroove import Infogroove
 from infogroove.exceptions import FormulaEvaluationError
 from infogroove import formula as formula_module
-from infogroove.formula import FormulaEngine, evaluate_expression
+from infogroove.formula import ExpressionStatsTable, FormulaEngine, evaluate_expression
 
 
 def test_formula_engine_evaluates_with_sympy_numbers():
@@ -91,3 +93,67 @@ def test_expression_cache_reuses_ast_parse(monkeypatch):
     assert evaluate_expression("value + 1", {"value": 2}) == 3
 
     assert calls["parse"] == first_count
+
+
+def test_expression_routes_to_ast_after_sympy_fallback(monkeypatch):
+    formula_module.reset_expression_stats()
+    table = ExpressionStatsTable()
+    calls = {"sympify": 0}
+    original = sympy.sympify
+
+    def counting(*args, **kwargs):
+        calls["sympify"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(sympy, "sympify", counting)
+
+    for value in (1, 4, 9):
+        assert table.evaluate("Math.sqrt(value)", {"value": value}) == math.sqrt(value)
+
+    assert calls["sympify"] == 1
+    report = table.fallback_report()
+    assert [stats.expression for stats in report] == ["Math.sqrt(value)"]
+    stats = report[0]
+    assert (stats.sympy_misses, stats.ast_hits, stats.routed) == (1, 3, 2)
+    assert stats.preferred == formula_module.AST_BACKEND
+    assert "Math.sqrt(value)" in table.format_fallback_report()
+    assert formula_module.expression_fallback_report() == []
+
+    table.reset()
+    assert table.fallback_report() == []
+
+
+def test_routed_expression_retries_sympy_when_ast_fails(monkeypatch):
+    formula_module.reset_expression_stats()
+
+    def boom(*args, **kwargs):
+        raise sympy.SympifyError("fail")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(sympy, "sympify", boom)
+        assert evaluate_expression("value * 2", {"value": 3}) == 6
+
+    with monkeypatch.context() as patch:
+        patch.setattr(formula_module, "safe_ast_eval", boom)
+        assert evaluate_expression("value * 2", {"value": 4}) == 8
+        assert formula_module.expression_fallback_report()[0].sympy_hits == 1
+
+        with pytest.raises(FormulaEvaluationError):
+            evaluate_expression("value * 2", {})
+
+
+def test_renderers_route_expressions_independently():
+    template = {
+        "properties": {"canvas": {"width": 10, "height": 10}},
+        "template": [{"type": "text", "text": "{Math.sqrt(4)}"}],
+    }
+    first = Infogroove(template)
+    second = Infogroove(template)
+
+    first.render([])
+
+    assert [stats.expression for stats in first.expression_stats.fallback_report()] == ["Math.sqrt(4)"]
+    assert second.expression_stats.fallback_report() == []
+
+    first.expression_stats.reset()
+    assert first.expression_stats.fallback_report() == []
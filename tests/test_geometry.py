@@ -0,0 +1,91 @@
+import math
+
+from infogroove.geometry import (
+    Subpath,
+    format_path,
+    parse_path,
+    quantize,
+    rdp_indices,
+    shape_bounds,
+    simplify,
+    visvalingam_indices,
+)
+from infogroove.utils import NumberFormat
+
+FORMAT = NumberFormat(decimals=2).formatter()
+
+
+def _max_deviation(xs, ys, indices):
+    """Largest distance from a dropped vertex to the kept segment spanning it."""
+
+    worst = 0.0
+    for left, right in zip(indices, indices[1:]):
+        dx, dy = xs[right] - xs[left], ys[right] - ys[left]
+        length = math.hypot(dx, dy)
+        for index in range(left + 1, right):
+            cross = (xs[index] - xs[left]) * dy - (ys[index] - ys[left]) * dx
+            worst = max(worst, abs(cross) / length)
+    return worst
+
+
+def _outline(count=5_000):
+    angles = [2 * math.pi * index / count for index in range(count)]
+    radii = [100 + 8 * math.sin(7 * angle) + 2 * math.sin(41 * angle) for angle in angles]
+    return [r * math.cos(a) for r, a in zip(radii, angles)], [r * math.sin(a) for r, a in zip(radii, angles)]
+
+
+def test_rdp_keeps_every_vertex_within_tolerance():
+    xs, ys = _outline()
+
+    indices = rdp_indices(xs, ys, 0.5)
+
+    assert indices[0] == 0 and indices[-1] == len(xs) - 1
+    assert len(indices) < len(xs) // 5
+    assert _max_deviation(xs, ys, indices) <= 0.5
+
+
+def test_visvalingam_drops_small_triangles_and_keeps_corners():
+    xs = [0, 1, 2, 3, 3, 3]
+    ys = [0, 0.01, 0, 0, 1, 2]
+
+    assert visvalingam_indices(xs, ys, 0.5) == [0, 3, 5]
+    xs, ys = _outline()
+    assert len(visvalingam_indices(xs, ys, 0.5)) < len(xs) // 5
+
+
+def test_quantize_snaps_to_grid_and_drops_repeated_points():
+    assert quantize([0.1, 0.4, 1.6, 2.2], [0, 0.2, 1.4, 1.6], 1) == ([0, 2, 2], [0, 1, 2])
+
+
+def test_simplify_combines_selection_and_quantisation():
+    xs, ys = simplify([0, 1, 2, 3], [0, 0.1, 0, 5.3], tolerance=0.5, grid=0.5)
+
+    assert (xs, ys) == ([0, 2, 3], [0, 0, 5.5])
+
+
+def test_parse_path_resolves_relative_and_axis_commands():
+    subpaths = parse_path("M10 10 l5 0 H30 v5 z m-10,-10 L0,0")
+
+    assert subpaths == [
+        Subpath([10, 15, 30, 30], [10, 10, 10, 15], closed=True),
+        Subpath([0, 0], [0, 0]),
+    ]
+    assert parse_path("M0 0 C1 1 2 2 3 3") is None
+    assert parse_path("10 10") is None
+
+
+def test_format_path_emits_relative_commands_without_drift():
+    subpaths = [Subpath([0.333, 0.666, 0.999], [0, 0, 0], closed=True), Subpath([5, 6], [5, 6])]
+
+    assert format_path(subpaths, FORMAT) == "M0.33,0L0.67,0 1,0ZM5,5L6,6"
+    assert format_path(subpaths, FORMAT, relative=True) == "m0.33,0l0.34,0 0.33,0zm4.67,5l1,1"
+
+
+def test_shape_bounds_covers_basic_shapes():
+    assert shape_bounds("rect", {"x": "5", "width": "10", "height": 4}) == (5, 0, 15, 4)
+    assert shape_bounds("circle", {"cx": "10", "cy": "10", "r": "2"}) == (8, 8, 12, 12)
+    assert shape_bounds("ellipse", {"rx": "3"}) == (-3, -3, 3, 3)
+    assert shape_bounds("line", {"x1": "4", "x2": "1", "y2": "-2"}) == (1, -2, 4, 0)
+    assert shape_bounds("text", {"x": "7", "y": "9"}) is None
+    assert shape_bounds("rect", {"x": "50%"}) is None
+    assert shape_bounds("path", {"d": "M0 0"}) is None
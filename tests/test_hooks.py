@@ -0,0 +1,106 @@
+import json
+
+from infogroove import HistogramRecorder, Infogroove, RenderHooks, loads
+from infogroove.hooks import Histogram
+
+TEMPLATE = {
+    "properties": {"canvas": {"width": 100, "height": 40}},
+    "template": [
+        {"type": "rect", "attributes": {"width": "100", "height": "40"}},
+        {
+            "type": "circle",
+            "attributes": {"cx": "{__index__ * 10}", "cy": "20", "r": "4"},
+            "repeat": {"items": "data", "as": "row"},
+        },
+    ],
+}
+
+
+class EventLog(RenderHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_template_load(self, template, elapsed):
+        self.events.append(("template_load",))
+
+    def on_validation_start(self, data):
+        self.events.append(("validation_start",))
+
+    def on_validation_end(self, data, elapsed):
+        self.events.append(("validation_end",))
+
+    def on_base_context(self, context, elapsed):
+        self.events.append(("base_context",))
+
+    def on_element(self, path, element, node_count, elapsed):
+        self.events.append(("element", path, node_count))
+
+    def on_repeat(self, path, element, item_count, elapsed):
+        self.events.append(("repeat", path, item_count))
+
+    def on_serialize(self, size, elapsed):
+        self.events.append(("serialize", size > 0))
+
+    def on_render_end(self, elapsed):
+        self.events.append(("render_end",))
+
+
+def test_hooks_receive_lifecycle_events_in_order():
+    log = EventLog()
+    renderer = loads(json.dumps(TEMPLATE), hooks=[log])
+
+    renderer.render([{}, {}, {}])
+
+    assert log.events == [
+        ("template_load",),
+        ("validation_start",),
+        ("validation_end",),
+        ("base_context",),
+        ("element", "template[0]", 1),
+        ("repeat", "template[1]", 3),
+        ("element", "template[1]", 3),
+        ("serialize", True),
+        ("render_end",),
+    ]
+
+
+def test_hooks_can_be_added_and_removed():
+    renderer = Infogroove(TEMPLATE)
+    log = EventLog()
+
+    renderer.add_hook(log)
+    renderer.translate([{}])
+    assert ("render_end",) in log.events
+    assert not any(event[0] == "serialize" for event in log.events)
+
+    renderer.remove_hook(log)
+    log.events.clear()
+    renderer.render([{}])
+    assert log.events == []
+
+
+def test_histogram_recorder_aggregates_durations_and_sizes():
+    recorder = HistogramRecorder()
+    renderer = Infogroove(TEMPLATE, hooks=[recorder])
+
+    for count in (1, 4, 16):
+        renderer.render([{}] * count)
+
+    assert recorder.histograms["template_load"].count == 1
+    assert recorder.histograms["render"].count == 3
+    assert recorder.histograms["element:template[1]"].count == 3
+    repeat_items = recorder.sizes["repeat_items"]
+    assert (repeat_items.minimum, repeat_items.maximum, repeat_items.total) == (1, 16, 21)
+    snapshot = recorder.snapshot()
+    assert json.loads(json.dumps(snapshot))["durations"]["render"]["count"] == 3
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram(bounds=(1.0, 10.0, 100.0))
+    for value in (0.5, 2, 3, 50, 500):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.quantile(0.5) == 10.0
+    assert histogram.quantile(1.0) == 500
+    assert histogram.mean == (0.5 + 2 + 3 + 50 + 500) / 5
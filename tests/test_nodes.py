@@ -0,0 +1,67 @@
+import pytest
+
+from infogroove import Infogroove
+from infogroove.nodes import Node
+
+
+def test_node_reads_like_its_dict_form():
+    node = Node("g", ("fill",), ("red",), (Node("text", ("x",), ("1",), text="hi"),))
+
+    assert node.to_dict() == {
+        "type": "g",
+        "attributes": {"fill": "red"},
+        "children": [{"type": "text", "attributes": {"x": "1"}, "children": [], "text": "hi"}],
+    }
+    assert node["attributes"] == {"fill": "red"}
+    assert node["children"][0]["text"] == "hi"
+    assert "text" not in node
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(TypeError):
+        node["attributes"]["fill"] = "blue"
+
+
+def test_custom_renderers_receive_nodes_and_translate_returns_dicts():
+    seen = []
+
+    def frame(payload, _context):
+        seen.extend(child["type"] for child in payload.children)
+        return [{"type": "g", "attributes": {"class": "frame"}, "children": list(payload.children)}]
+
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 10, "height": 10}},
+            "template": [{"type": "frame", "children": [{"type": "rect", "attributes": {"width": "{2 * 2}"}}]}],
+        },
+        renderers={"frame": frame},
+    )
+
+    nodes = renderer.translate([])
+
+    assert seen == ["rect"]
+    assert nodes == [
+        {
+            "type": "g",
+            "attributes": {"class": "frame"},
+            "children": [{"type": "rect", "attributes": {"width": "4"}, "children": []}],
+        }
+    ]
+    assert type(nodes[0]) is dict
+    assert renderer.render([]).endswith('<g class="frame"><rect width="4"/></g></svg>')
+
+
+def test_custom_renderers_can_edit_the_child_dicts_they_receive():
+    def tint(payload, _context):
+        for child in payload.children:
+            assert isinstance(child, dict)
+            child["attributes"]["fill"] = payload.attributes["colour"]
+        return [{"type": "g", "children": list(payload.children)}]
+
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 10, "height": 10}},
+            "template": [{"type": "tint", "attributes": {"colour": "red"}, "children": [{"type": "circle"}]}],
+        },
+        renderers={"tint": tint},
+    )
+
+    assert renderer.render([]).endswith('<g><circle fill="red"/></g></svg>')
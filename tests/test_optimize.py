@@ -0,0 +1,295 @@
+import pytest
+
+from infogroove import Infogroove
+from infogroove.optimize import (
+    DefsInterner,
+    Instancer,
+    Minifier,
+    PathSimplifier,
+    canonical_attribute_name,
+    shorten_colour,
+)
+
+
+def _node(element_type, attributes=None, children=None, text=None):
+    node = {"type": element_type, "attributes": dict(attributes or {}), "children": list(children or [])}
+    if text is not None:
+        node["text"] = text
+    return node
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("#FF0000", "red"),
+        ("#336699", "#369"),
+        ("#123456", "#123456"),
+        ("rgb(255, 255, 255)", "#fff"),
+        ("black", "#000"),
+        ("url(#paint)", "url(#paint)"),
+        ("currentColor", "currentColor"),
+    ],
+)
+def test_shorten_colour(value, expected):
+    assert shorten_colour(value) == expected
+
+
+def test_canonical_attribute_name_matches_serialised_form():
+    assert canonical_attribute_name("strokeWidth") == "stroke-width"
+    assert canonical_attribute_name("stroke_width") == "stroke-width"
+    assert canonical_attribute_name("font-family") == "font-family"
+    assert canonical_attribute_name("xlink:href") == "xlink:href"
+
+
+def test_minifier_drops_defaults_and_values_inherited_from_ancestors():
+    minifier = Minifier()
+    nodes = [
+        _node(
+            "g",
+            {"fill": "#336699", "class": None},
+            [
+                _node("rect", {"x": "0", "y": "0.0", "width": "4", "fill": "#336699", "opacity": "1"}),
+                _node("circle", {"cx": "2", "cy": "0", "r": "1", "fill": "#123456"}),
+            ],
+        )
+    ]
+
+    (group,) = minifier(nodes)
+
+    rect, circle = group["children"]
+    assert rect["attributes"] == {"width": "4"}
+    assert circle["attributes"] == {"cx": "2", "r": "1", "fill": "#123456"}
+    assert group["attributes"]["fill"] == "#369"
+    assert minifier.stats.attributes_removed == 5
+    assert minifier.stats.bytes_saved > 0
+
+
+def test_minifier_hoists_shared_attributes_onto_parent_group():
+    minifier = Minifier()
+    nodes = [
+        _node(
+            "g",
+            {"transform": "translate(4 4)"},
+            [
+                _node("circle", {"r": "1", "stroke": "#000000", "strokeWidth": "2"}),
+                _node("circle", {"r": "2", "stroke": "#000000", "strokeWidth": "2"}),
+            ],
+        )
+    ]
+
+    (group,) = minifier(nodes)
+
+    assert group["attributes"] == {"transform": "translate(4 4)", "stroke": "#000", "stroke-width": "2"}
+    assert [child["attributes"] for child in group["children"]] == [{"r": "1"}, {"r": "2"}]
+    assert minifier.stats.attributes_hoisted == 4
+
+
+def test_minifier_wraps_runs_of_top_level_siblings_only_when_grouping():
+    minifier = Minifier(group=True)
+    rows = [_node("rect", {"y": str(index), "width": "4", "fill": "#0ea5e9", "stroke": "none"}) for index in range(3)]
+    nodes = [*rows, _node("text", {"fill": "black"}, text="Total")]
+
+    grouped = minifier(nodes)
+
+    assert [node["type"] for node in grouped] == ["g", "text"]
+    assert grouped[0]["attributes"] == {"fill": "#0ea5e9", "stroke": "none"}
+    assert len(grouped[0]["children"]) == 3
+    assert grouped[1]["attributes"] == {"fill": "#000"}
+    assert minifier.stats.groups_created == 1
+    assert [node["type"] for node in Minifier()(nodes)] == ["rect", "rect", "rect", "text"]
+
+
+def test_minifier_respects_class_style_and_preserved_whitespace():
+    minifier = Minifier()
+    nodes = [
+        _node("g", {"fill": "red", "class": "theme"}, [_node("rect", {"fill": "red"})]),
+        _node("text", {"xml:space": "preserve"}, text="a   b"),
+        _node("text", {"data-label": "x   y"}, text="a \n  b"),
+        _node("image", {"aria-label": "Q1  results", "alt": "a\n b", "transform": "translate(1,  2)"}),
+    ]
+
+    styled, preserved, collapsed, labelled = minifier(nodes)
+
+    assert styled["children"][0]["attributes"] == {"fill": "red"}
+    assert preserved["text"] == "a   b"
+    assert collapsed["text"] == "a b"
+    assert collapsed["attributes"] == {"data-label": "x   y"}
+    assert labelled["attributes"] == {"aria-label": "Q1  results", "alt": "a\n b", "transform": "translate(1, 2)"}
+
+
+def test_minifier_follows_default_xml_space_and_keeps_text_groups_intact():
+    nodes = [
+        _node("text", {}, text="line\none\tand  two"),
+        _node("g", {}, [_node("rect", {"fill": "red"}), _node("rect", {"fill": "red"})], text="label"),
+    ]
+
+    text, group = Minifier()(nodes)
+
+    assert text["text"] == "lineone and two"
+    assert group["attributes"] == {}
+    assert [child["attributes"] for child in group["children"]] == [{"fill": "red"}, {"fill": "red"}]
+
+
+def test_renderer_applies_passes_to_every_output_path(tmp_path):
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 20, "height": 20}},
+            "template": [
+                {
+                    "type": "rect",
+                    "repeat": {"items": "items", "as": "row"},
+                    "attributes": {"x": "0", "y": "{row.y}", "width": "4", "fill": "#FFFFFF", "stroke": "#000000"},
+                }
+            ],
+        }
+    )
+    data = [{"y": 1}, {"y": 2}]
+    plain = renderer.render(data)
+    renderer.passes = [Minifier(group=True)]
+
+    minified = renderer.render(data)
+    output = tmp_path / "chart.svg"
+    renderer.render_to(data, output)
+
+    assert minified.endswith('<g stroke="#000" fill="#fff"><rect y="1" width="4"/><rect y="2" width="4"/></g></svg>')
+    assert len(minified) < len(plain)
+    assert output.read_text(encoding="utf-8") == minified
+    assert renderer.translate(data)[0]["type"] == "g"
+
+
+def _badge(x):
+    return _node(
+        "g",
+        {"transform": f"translate({x} 0)"},
+        [_node("rect", {"width": "8", "height": "8", "rx": "2"}), _node("path", {"d": "M1 1 L5 5 L1 5 Z"})],
+    )
+
+
+def test_instancer_replaces_identical_subtrees_with_use():
+    instancer = Instancer()
+
+    defs, *uses = instancer([_badge(0), _badge(10), _badge(20)])
+
+    (symbol,) = defs["children"]
+    assert defs["type"] == "defs"
+    assert symbol["attributes"] == {"id": "ig-sym-0", "overflow": "visible"}
+    assert [child["type"] for child in symbol["children"]] == ["rect", "path"]
+    assert [use["attributes"] for use in uses] == [
+        {"href": "#ig-sym-0", "transform": f"translate({x} 0)"} for x in (0, 10, 20)
+    ]
+    assert instancer.stats.symbols_created == 1
+    assert instancer.stats.instances_replaced == 3
+
+
+def test_instancer_skips_unique_small_and_identified_subtrees():
+    identified = [
+        _node("g", {"transform": f"translate({x} 0)"}, [_node("rect", {"id": "hit", "width": "800"})])
+        for x in (0, 1)
+    ]
+    tiny = [_node("circle", {"r": "1"}) for _ in range(3)]
+    nodes = [_badge(0), *identified, *tiny, _node("text", {}, [_node("tspan", {"dx": "1"})] * 3)]
+
+    assert Instancer()(nodes) == nodes
+
+
+def test_instancer_avoids_existing_ids_and_renders_use_elements():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 40, "height": 10}},
+            "template": [
+                {"type": "rect", "attributes": {"id": "ig-sym-0", "width": "40", "height": "10"}},
+                {
+                    "type": "g",
+                    "repeat": {"items": "items", "as": "row"},
+                    "attributes": {"transform": "translate({row.x} 0)"},
+                    "children": [
+                        {"type": "rect", "attributes": {"width": "8", "height": "8", "fill": "#e2e8f0"}},
+                        {"type": "path", "attributes": {"d": "M1 1 L5 5 L1 5 Z", "fill": "#0ea5e9"}},
+                    ],
+                },
+            ],
+        }
+    )
+    renderer.passes = [Instancer()]
+
+    markup = renderer.render([{"x": 0}, {"x": 10}])
+
+    assert '<symbol id="ig-sym-1" overflow="visible">' in markup
+    assert markup.count('<use href="#ig-sym-1"') == 2
+    assert 'transform="translate(10 0)"' in markup
+
+
+def _gradient(gradient_id, colour):
+    return _node(
+        "linearGradient",
+        {"id": gradient_id},
+        [_node("stop", {"offset": "0", "stop-color": colour}), _node("stop", {"offset": "1", "stop-color": "#fff"})],
+    )
+
+
+def test_defs_interner_keeps_one_copy_per_distinct_definition():
+    interner = DefsInterner()
+    colours = ["#f00", "#00f", "#f00", "#00f", "#f00"]
+    nodes = [
+        _node(
+            "g",
+            {},
+            [
+                _node("defs", {}, [_gradient(f"grad-{index}", colour)]),
+                _node("rect", {"fill": f"url(#grad-{index})", "style": f"stroke: url( #grad-{index} )"}),
+            ],
+        )
+        for index, colour in enumerate(colours)
+    ]
+
+    defs, *groups = interner(nodes)
+
+    assert [gradient["attributes"]["id"] for gradient in defs["children"]] == ["grad-0", "grad-1"]
+    fills = [group["children"][0]["attributes"]["fill"] for group in groups]
+    assert fills == ["url(#grad-0)", "url(#grad-1)", "url(#grad-0)", "url(#grad-1)", "url(#grad-0)"]
+    assert groups[2]["children"][0]["attributes"]["style"] == "stroke: url(#grad-0)"
+    assert all(len(group["children"]) == 1 for group in groups)
+    assert interner.stats.definitions_kept == 2
+    assert interner.stats.definitions_removed == 3
+
+
+def test_defs_interner_resolves_duplicate_ids_to_first_definition():
+    nodes = [
+        _gradient("shared", "#f00"),
+        _node("rect", {"fill": "url(#shared)"}),
+        _gradient("shared", "#0f0"),
+        _node("use", {"href": "#clip-b"}),
+        _node("clipPath", {"id": "clip-a"}, [_node("rect", {"width": "4"})]),
+        _node("clipPath", {"id": "clip-b"}, [_node("rect", {"width": "4"})]),
+    ]
+
+    defs, rect, use = DefsInterner()(nodes)
+
+    assert [child["attributes"]["id"] for child in defs["children"]] == ["shared", "clip-a"]
+    assert defs["children"][0]["children"][0]["attributes"]["stop-color"] == "#f00"
+    assert rect["attributes"] == {"fill": "url(#shared)"}
+    assert use["attributes"] == {"href": "#clip-a"}
+
+
+def test_defs_interner_leaves_documents_without_definitions_untouched():
+    nodes = [_node("rect", {"fill": "url(#external)"})]
+
+    assert DefsInterner()(nodes) is nodes
+
+
+def test_path_simplifier_rewrites_straight_geometry_only():
+    simplifier = PathSimplifier(tolerance=0.5)
+    line = " ".join(f"L{x} {x % 2 * 0.1}" for x in range(1, 200))
+    nodes = [
+        _node("g", {}, [_node("path", {"d": f"M0 0 {line} Z"})]),
+        _node("path", {"d": "M0 0 C10 10 20 10 30 0"}),
+        _node("polygon", {"points": "0,0 5,0.01 10,0 10,10"}),
+    ]
+
+    group, curve, polygon = simplifier(nodes)
+
+    assert group["children"][0]["attributes"]["d"] == "m0,0l199,0.1z"
+    assert curve is nodes[1]
+    assert polygon["attributes"]["points"] == "0,0 10,0 10,10"
+    assert simplifier.stats.shapes_simplified == 2
+    assert simplifier.stats.vertices_after == 5
@@ -0,0 +1,140 @@
+import io
+import json
+
+from infogroove import Infogroove, RenderProfiler
+from infogroove.cli import main
+
+
+def make_renderer():
+    return Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}, "gap": 10},
+            "template": [
+                {
+                    "type": "g",
+                    "repeat": {"items": "data", "as": "row"},
+                    "let": {
+                        "x": "__index__ * gap",
+                        "label": "row.label",
+                        "root": "Math.sqrt(__index__ + 1)",
+                    },
+                    "children": [
+                        {
+                            "type": "text",
+                            "attributes": {"x": "{x}", "y": "{x / 2}"},
+                            "text": "{label}",
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def test_profiler_aggregates_repeated_paths():
+    renderer = make_renderer()
+    profiler = RenderProfiler()
+    renderer.profiler = profiler
+
+    renderer.render([{"label": "A"}, {"label": "B"}, {"label": "C"}])
+
+    by_label = {(entry.kind, entry.label): entry for entry in profiler.entries()}
+    group = by_label[("element", "template[0] (g)")]
+    child = by_label[("element", "template[0].children[0] (text)")]
+    assert group.calls == 3
+    assert child.calls == 3
+    assert group.total >= child.total
+
+    x_binding = by_label[("let", "template[0] (g) let 'x'")]
+    assert x_binding.calls == 3
+    assert x_binding.backends == {"sympy": 3}
+    root_binding = by_label[("let", "template[0] (g) let 'root'")]
+    assert root_binding.backends == {"ast": 3}
+
+    placeholder = by_label[
+        ("placeholder", "template[0].children[0] (text) attribute 'y' {x / 2}")
+    ]
+    assert placeholder.calls == 3
+
+
+def test_profiler_records_where_predicates_under_their_own_kind():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}},
+            "template": [
+                {
+                    "type": "rect",
+                    "repeat": {"items": "data", "as": "row", "where": "row.value > 1"},
+                    "attributes": {"width": "{row.value}"},
+                }
+            ],
+        }
+    )
+    profiler = RenderProfiler()
+    renderer.profiler = profiler
+
+    renderer.render([{"value": 1}, {"value": 2}, {"value": 3}])
+
+    kinds = {entry.kind: entry for entry in profiler.entries()}
+    assert kinds["where"].calls == 3
+    assert "let" not in kinds
+
+
+def test_profiler_report_is_sorted_and_serialisable():
+    ticks = iter(range(1000))
+    profiler = RenderProfiler(clock=lambda: next(ticks))
+    renderer = make_renderer()
+    renderer.profiler = profiler
+    renderer.render([{"label": "A"}])
+
+    totals = [entry.total for entry in profiler.entries()]
+    assert totals == sorted(totals, reverse=True)
+    assert profiler.format_report(limit=1).count("\n") == 2
+
+    buffer = io.StringIO()
+    profiler.write_json(buffer)
+    payload = json.loads(buffer.getvalue())
+    assert payload["entries"][0]["label"] == "template[0] (g)"
+
+    profiler.reset()
+    assert profiler.entries() == []
+
+
+def test_cli_profile_output_writes_json(tmp_path):
+    template_path = tmp_path / "def.json"
+    template_path.write_text(
+        json.dumps(
+            {
+                "properties": {"canvas": {"width": 100, "height": 100}},
+                "template": [
+                    {
+                        "type": "text",
+                        "attributes": {"x": "{__index__ * 2}", "y": "0"},
+                        "text": "{item.label}",
+                        "repeat": {"items": "data", "as": "item"},
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    data_path = tmp_path / "data.json"
+    data_path.write_text(json.dumps([{"label": "A"}, {"label": "B"}]), encoding="utf-8")
+    profile_path = tmp_path / "profile.json"
+
+    exit_code = main(
+        [
+            "-f",
+            str(template_path),
+            "-i",
+            str(data_path),
+            "-o",
+            str(tmp_path / "out.svg"),
+            "--profile-output",
+            str(profile_path),
+        ]
+    )
+
+    assert exit_code == 0
+    entries = json.loads(profile_path.read_text(encoding="utf-8"))["entries"]
+    assert {"element", "placeholder"} <= {entry["kind"] for entry in entries}
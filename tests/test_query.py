@@ -0,0 +1,73 @@
+import pytest
+
+from infogroove.exceptions import RenderError
+from infogroove.models import RepeatSpec, SortKey
+from infogroove.query import RepeatQuery
+
+ROWS = [
+    {"label": "a", "value": 3, "kind": "x"},
+    {"label": "b", "value": 9, "kind": "y"},
+    {"label": "c", "kind": "x"},
+    {"label": "d", "value": 1, "kind": "y"},
+    {"label": "e", "value": 9, "kind": "x"},
+]
+
+
+def labels(rows):
+    return [row["label"] for row in rows]
+
+
+def query(**clauses):
+    return RepeatQuery(RepeatSpec(items="items", alias="row", **clauses))
+
+
+def test_order_by_places_missing_values_last_in_both_directions():
+    ascending = query(order_by=(SortKey("value"),)).apply(ROWS)
+    descending = query(order_by=(SortKey("value", descending=True),)).apply(ROWS)
+
+    assert labels(ascending) == ["d", "a", "b", "e", "c"]
+    assert labels(descending) == ["b", "e", "a", "d", "c"]
+
+
+def test_top_k_matches_a_full_sort_and_is_stable():
+    spec = {"order_by": (SortKey("value", descending=True),)}
+    full = query(**spec).apply(ROWS)
+
+    assert labels(query(limit=3, **spec).apply(ROWS)) == labels(full[:3])
+    assert labels(query(offset=1, limit=2, **spec).apply(ROWS)) == labels(full[1:3])
+
+
+def test_mixed_sort_directions():
+    ordered = query(order_by=(SortKey("kind"), SortKey("value", descending=True))).apply(ROWS)
+
+    assert labels(ordered) == ["e", "a", "c", "b", "d"]
+
+
+def test_where_runs_before_grouping_and_ordering():
+    groups = query(group_by="kind", order_by=(SortKey("count", descending=True),), limit=1).apply(
+        ROWS, predicate=lambda row: row.get("value", 0) > 2
+    )
+
+    assert len(groups) == 1
+    assert groups[0]["key"] == "x"
+    assert labels(groups[0]["items"]) == ["a", "e"]
+    assert groups[0]["count"] == 2
+
+
+def test_offset_and_limit_without_ordering_keep_source_order():
+    assert labels(query(offset=3).apply(ROWS)) == ["d", "e"]
+    assert labels(query(limit=0).apply(ROWS)) == []
+
+
+def test_incomparable_sort_values_raise_render_error():
+    rows = [{"value": 1}, {"value": "two"}]
+
+    with pytest.raises(RenderError, match="not comparable"):
+        query(order_by=(SortKey("value"),)).apply(rows)
+
+
+def test_unhashable_group_keys_raise_render_error():
+    rows = [{"tags": ["a"]}, {"tags": ["b"]}]
+
+    with pytest.raises(RenderError, match="groupBy 'tags' resolved to an unhashable list"):
+        query(group_by="tags").apply(rows)
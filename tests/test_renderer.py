@@ -1,4 +1,7 @@
+import gzip
+import io
 import json
+from collections.abc import Mapping
 
 import pytest
 
@@ -6,6 +9,7 @@ from infogroove.core import Infogroove
 from infogroove.exceptions import DataValidationError, RenderError
 from infogroove.models import CanvasSpec, ElementSpec, RepeatSpec, TemplateSpec
 from infogroove.renderer import InfogrooveRenderer
+from infogroove.utils import NumberFormat
 
 
 @pytest.fixture
@@ -556,3 +560,367 @@ def test_custom_renderer_handles_icon_elements(tmp_path):
     assert "data-icon=\"heart\"" in svg_markup
     assert "data-icon=\"star\"" in svg_markup
     assert "<path d=\"M1 1 L2 2 L1 3 Z\"" in svg_markup
+
+
+def test_base_context_metrics_are_lazy_and_computed_once(sample_template):
+    renderer = InfogrooveRenderer(sample_template)
+    scans = {"count": 0}
+
+    class CountingItems(list):
+        def __iter__(self):
+            scans["count"] += 1
+            return super().__iter__()
+
+    payload = {"items": CountingItems([{"label": "A", "value": 5}, {"label": "B", "value": 15}])}
+    context = renderer._build_base_context(payload, names=frozenset({"maxValue", "averageValue"}))
+
+    assert scans["count"] == 0
+    frame = renderer._build_repeat_context(context, sample_template.template[1].repeat, {}, 0, 1)
+    assert frame["maxValue"] == 15
+    assert context["averageValue"] == 10
+    assert context.get("minValue") is None
+    assert "values" not in context
+    assert scans["count"] == 1
+
+
+def test_base_context_keeps_payload_values_when_metrics_are_absent(sample_template):
+    renderer = InfogrooveRenderer(sample_template)
+
+    context = renderer._build_base_context(
+        {"items": [{"label": "A"}], "values": [1, 2]},
+        names=frozenset({"values"}),
+    )
+
+    assert list(context["values"]) == [1, 2]
+
+
+def test_render_only_materialises_referenced_metrics():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}},
+            "template": [
+                {
+                    "type": "rect",
+                    "repeat": {"items": "items", "as": "row"},
+                    "attributes": {"width": "{row.value / maxValue * 100}", "height": "4"},
+                }
+            ],
+        }
+    )
+
+    assert renderer._context_names() >= {"items", "row", "maxValue"}
+    node_specs = renderer.translate({"items": [{"value": 1}, {"value": 4}]})
+
+    assert [node["attributes"]["width"] for node in node_specs] == ["25", "100"]
+
+
+def test_aggregates_are_exposed_in_the_base_context():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}},
+            "aggregates": {
+                "peak": {"op": "max", "field": "value"},
+                "median": {"op": "percentile", "field": "value", "q": 50},
+                "perKind": {"op": "sum", "field": "value", "groupBy": "kind"},
+            },
+            "template": [
+                {
+                    "type": "rect",
+                    "repeat": {"items": "items", "as": "row"},
+                    "attributes": {"width": "{row.value / peak * 100}", "height": "{median}"},
+                },
+                {"type": "text", "text": "{perKind['a']}"},
+            ],
+        }
+    )
+    data = {"items": [{"value": 2, "kind": "a"}, {"value": 4, "kind": "b"}, {"value": 3, "kind": "a"}]}
+
+    node_specs = renderer.translate(data)
+
+    assert [node["attributes"]["width"] for node in node_specs[:3]] == ["50", "100", "75"]
+    assert node_specs[0]["attributes"]["height"] == "3"
+    assert node_specs[3]["text"] == "5"
+
+
+def test_repeat_selection_clauses_run_before_bindings():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}, "threshold": 2},
+            "template": [
+                {
+                    "type": "text",
+                    "repeat": {
+                        "items": "items",
+                        "as": "row",
+                        "where": "row.value > threshold",
+                        "orderBy": "value desc",
+                        "limit": 2,
+                    },
+                    "text": "{row.label} {__index__}/{__total__}",
+                },
+                {
+                    "type": "text",
+                    "repeat": {"items": "items", "as": "group", "groupBy": "kind", "orderBy": "key"},
+                    "text": "{group.key}={group.count}",
+                },
+            ],
+        }
+    )
+    data = {
+        "items": [
+            {"label": "a", "value": 1, "kind": "y"},
+            {"label": "b", "value": 5, "kind": "x"},
+            {"label": "c", "value": 3, "kind": "y"},
+            {"label": "d", "value": 4, "kind": "y"},
+        ]
+    }
+
+    texts = [node["text"] for node in renderer.translate(data)]
+
+    assert texts == ["b 0/2", "d 1/2", "x=1", "y=3"]
+
+
+def test_when_skips_the_whole_subtree_before_bindings_are_evaluated():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}, "showLegend": False},
+            "template": [
+                {
+                    "type": "g",
+                    "when": "showLegend",
+                    "let": {"broken": "missing_name + 1"},
+                    "children": [{"type": "text", "text": "{broken}"}],
+                },
+                {
+                    "type": "text",
+                    "repeat": {"items": "items", "as": "row"},
+                    "when": "{row.highlight}",
+                    "let": {"label": "row.label + '!'"},
+                    "text": "{label} {__index__}",
+                },
+            ],
+        }
+    )
+    data = {"items": [{"label": "a", "highlight": False}, {"label": "b", "highlight": True}, {"label": "c", "highlight": False}]}
+
+    node_specs = renderer.translate(data)
+
+    assert [node["text"] for node in node_specs] == ["b! 1"]
+
+
+class _TrackingRow(Mapping):
+    def __init__(self, values):
+        self._values = values
+        self.iterations = 0
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __iter__(self):
+        self.iterations += 1
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+
+def test_repeat_streams_lazy_iterables_with_an_explicit_total():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}},
+            "template": [
+                {
+                    "type": "text",
+                    "repeat": {"items": "rows", "as": "row", "total": "rowCount"},
+                    "text": "{row.label} {row.__count__}/{__total__} {__last__}",
+                }
+            ],
+        }
+    )
+    produced = []
+    rows = [_TrackingRow({"label": label}) for label in "abc"]
+
+    def generate():
+        for row in rows:
+            produced.append(row)
+            yield row
+
+    node_specs = renderer.translate({"rows": generate(), "rowCount": 3})
+
+    assert [node["text"] for node in node_specs] == ["a 1/3 False", "b 2/3 False", "c 3/3 True"]
+    assert len(produced) == 3
+    assert all(row.iterations == 0 for row in rows)
+
+
+def test_render_to_streams_markup_identical_to_render(sample_template, tmp_path):
+    renderer = InfogrooveRenderer(sample_template)
+    payload = {"items": [{"label": "A", "value": 3}, {"label": "Ü", "value": 4}]}
+    expected = renderer.render(payload)
+    buffer = io.BytesIO()
+
+    written = renderer.render_to(payload, buffer)
+    renderer.render_to(payload, tmp_path / "chart.svgz", compresslevel=1)
+
+    assert buffer.getvalue().decode("utf-8") == expected
+    assert written == len(expected.encode("utf-8"))
+    assert gzip.decompress((tmp_path / "chart.svgz").read_bytes()).decode("utf-8") == expected
+
+
+def test_render_to_writes_self_closing_root_without_nodes(tmp_path):
+    renderer = Infogroove({"properties": {"canvas": {"width": 10, "height": 10}}, "template": []})
+    buffer = io.BytesIO()
+
+    renderer.render_to([], buffer)
+
+    assert buffer.getvalue().decode("utf-8") == renderer.render([])
+
+
+def test_number_format_applies_to_placeholders_and_bindings():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}},
+            "template": [
+                {
+                    "type": "polyline",
+                    "let": {"points": "{10 / 3},{20 / 3} {2 * 1.5},1"},
+                    "attributes": {"points": "{points}", "stroke-width": "{1 / 7}"},
+                },
+            ],
+        }
+    )
+    renderer.number_format = NumberFormat(decimals=2)
+
+    markup = renderer.render([])
+
+    assert 'points="3.33,6.67 3,1"' in markup
+    assert 'stroke-width="0.14"' in markup
+
+
+def test_cull_margin_drops_shapes_outside_the_canvas_before_other_bindings():
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 50}},
+            "template": [
+                {
+                    "type": "circle",
+                    "repeat": {"items": "items", "as": "row"},
+                    "attributes": {"cx": "{row.x}", "cy": "10", "r": "4", "fill": "{row.colour}"},
+                },
+                {
+                    "type": "g",
+                    "attributes": {"transform": "translate(-200 0)"},
+                    "children": [{"type": "rect", "attributes": {"x": "250", "width": "5", "height": "5"}}],
+                },
+                {"type": "text", "attributes": {"x": "120", "y": "10", "text-anchor": "end"}, "text": "edge"},
+                {"type": "line", "attributes": {"x1": "-9", "x2": "-2"}},
+            ],
+        },
+        renderers={"line": lambda payload, _context: [{"type": "line", "attributes": {"x2": "9"}}]},
+    )
+    # Items outside the canvas have no colour, so evaluating their fill would fail.
+    data = [{"x": -20}, {"x": 10, "colour": "red"}, {"x": 103, "colour": "blue"}, {"x": 500}]
+    renderer.cull_margin = 0
+
+    nodes = renderer.translate(data)
+
+    assert [node["attributes"]["cx"] for node in nodes if node["type"] == "circle"] == ["10", "103"]
+    assert nodes[2]["children"][0]["attributes"]["x"] == "250"
+    assert [node["type"] for node in nodes[-2:]] == ["text", "line"]
+
+    with pytest.raises(ValueError):
+        renderer.cull_margin = -1
+
+
+def test_builtin_output_skips_coercion_while_custom_output_is_validated(monkeypatch):
+    template = {
+        "properties": {"canvas": {"width": 10, "height": 10}},
+        "template": [{"type": "g", "children": [{"type": "rect", "attributes": {"width": "4"}}]}],
+    }
+    renderer = Infogroove(template)
+
+    def fail(*_args):
+        raise AssertionError("built-in output must not be re-coerced")
+
+    monkeypatch.setattr(renderer, "_normalise_renderer_outputs", fail)
+    assert renderer.render([]).endswith('<g><rect width="4"/></g></svg>')
+
+    custom = Infogroove(template, renderers={"rect": lambda payload, _context: [{"attributes": {}}]})
+    with pytest.raises(RenderError, match="must declare a string 'type'"):
+        custom.render([])
+
+
+def test_attribute_routes_are_cached_per_element_type():
+    from infogroove.renderer import _ATTRIBUTE_ROUTES
+
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 10, "height": 10}},
+            "template": [
+                {
+                    "type": "rect",
+                    "attributes": {
+                        "strokeWidth": "2",
+                        "class": "bar",
+                        "data-row": "3",
+                        "aria-label": "Bar",
+                        "fill-opacity": "0.5",
+                    },
+                }
+            ],
+        }
+    )
+
+    markup = renderer.render([])
+
+    for fragment in ('stroke-width="2"', 'class="bar"', 'data-row="3"', 'aria-label="Bar"', 'fill-opacity="0.5"'):
+        assert fragment in markup
+    routes = _ATTRIBUTE_ROUTES["rect"]
+    assert routes["strokeWidth"][1] == "stroke_width"
+    assert routes["data-row"][1] == "row"
+    assert "aria-label" in routes
+
+
+def test_unhashable_callable_renderers_are_supported():
+    from dataclasses import dataclass
+
+    @dataclass
+    class Badge:
+        fill: str
+
+        def __call__(self, payload, _context):
+            return [{"type": "circle", "attributes": {"r": payload.attributes["size"], "fill": self.fill}}]
+
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 10, "height": 10}},
+            "template": [{"type": "badge", "attributes": {"size": "3"}}],
+        },
+        renderers={"badge": Badge("red")},
+    )
+
+    assert renderer.render([]).endswith('<circle r="3" fill="red"/></svg>')
+
+
+@pytest.mark.parametrize(
+    "count, message",
+    [
+        (2, r"'rows' yielded 2 items, expected 3"),
+        (4, r"'rows' yielded more than the declared 3 items"),
+    ],
+)
+def test_repeat_total_must_match_the_yielded_item_count(count, message):
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 40}},
+            "template": [
+                {
+                    "type": "circle",
+                    "repeat": {"items": "rows", "as": "row", "total": "3"},
+                    "attributes": {"cy": "{__total__}"},
+                }
+            ],
+        }
+    )
+
+    with pytest.raises(RenderError, match=r"template\[0\] \(circle\) repeat total: " + message):
+        renderer.translate({"rows": (index for index in range(count))})
@@ -0,0 +1,122 @@
+import pytest
+
+from infogroove import formula as formula_module
+from infogroove import Columns, Infogroove
+from infogroove.exceptions import RenderError
+from infogroove.formula import compile_point_expression
+
+
+def _renderer(attributes, element_type="polyline"):
+    return Infogroove(
+        {
+            "properties": {"canvas": {"width": 100, "height": 50}, "left": 10, "scale": 2},
+            "template": [{"type": element_type, "attributes": attributes}],
+        }
+    )
+
+
+def test_compile_point_expression_binds_context_once():
+    function, paths = compile_point_expression("left + p.t * scale - __index__", {"left": 10, "scale": 2}, alias="p")
+
+    assert paths == ("t", None)
+    assert function(3, 1) == 15
+
+
+def test_compile_point_expression_maps_math_helpers_and_rejects_unknown_names():
+    function, paths = compile_point_expression("Math.cos(p.angle) * p.r", {}, alias="p")
+
+    assert paths == ("angle", "r")
+    assert function(0, 4) == 4
+    assert compile_point_expression("p.value / unknown", {}, alias="p") is None
+
+
+def test_compiled_point_expressions_are_reused_for_the_same_constants():
+    formula_module._lambdify_point_expression.cache_clear()
+
+    first, _ = compile_point_expression("left + p.t * scale", {"left": 10, "scale": 2}, alias="p")
+    second, _ = compile_point_expression("left + p.t * scale", {"left": 10, "scale": 2}, alias="p")
+    other, _ = compile_point_expression("left + p.t * scale", {"left": 10, "scale": 2.0}, alias="p")
+
+    assert first is second
+    assert other is not first and other(1) == 12.0
+    unhashable, _ = compile_point_expression("p.t * len(extra)", {"extra": [1, 2]}, alias="p")
+    assert unhashable(3) == 6
+
+
+def test_polyline_points_are_built_from_a_collection():
+    renderer = _renderer(
+        {"points": {"items": "data", "as": "p", "x": "left + __index__ * scale", "y": "{50 - p.value / 3}"}}
+    )
+
+    markup = renderer.render([{"value": 0}, {"value": 10}, {"value": 20}])
+
+    assert '<polyline points="10,50 12,46.67 14,43.33"/>' in markup
+
+
+def test_path_data_uses_move_then_line_commands_with_precision():
+    renderer = _renderer(
+        {"d": {"items": "data", "as": "p", "x": "p.x", "y": "p.y", "precision": 1}, "fill": "none"},
+        element_type="path",
+    )
+
+    nodes = renderer.translate([{"x": 0.04, "y": -0.01}, {"x": 1.25, "y": 2}, {"x": 3, "y": 4.96}])
+
+    assert nodes[0]["attributes"]["d"] == "M0,0L1.2,2 3,5"
+
+
+def test_point_series_fall_back_to_per_point_evaluation():
+    renderer = _renderer({"points": {"items": "data", "as": "p", "x": "p.x", "y": "max(p.a, p.b)"}})
+
+    markup = renderer.render([{"x": 1, "a": 3, "b": 7}, {"x": 2, "a": 5, "b": 4}])
+
+    assert 'points="1,7 2,5"' in markup
+
+
+def test_point_series_read_columns_directly():
+    renderer = _renderer({"points": {"items": "data", "as": "p", "x": "p.x * scale", "y": "p.y"}})
+    columns = Columns({"x": [0.5, 1.5], "y": [4, 8]})
+
+    assert 'points="1,4 3,8"' in renderer.render(columns)
+
+
+def test_point_series_report_missing_fields():
+    renderer = _renderer({"points": {"items": "data", "as": "p", "x": "p.x", "y": "p.y"}})
+
+    with pytest.raises(RenderError, match="every point needs a value at 'y'"):
+        renderer.render([{"x": 1, "y": 2}, {"x": 2}])
+
+
+def test_point_series_simplify_and_emit_relative_path_commands():
+    renderer = _renderer(
+        {
+            "d": {
+                "items": "data",
+                "as": "p",
+                "x": "p.x",
+                "y": "p.y",
+                "simplify": {"tolerance": 0.5, "grid": 1, "relative": True},
+            }
+        },
+        element_type="path",
+    )
+
+    nodes = renderer.translate([{"x": x, "y": 10 + (x % 2) * 0.2} for x in range(50)] + [{"x": 49, "y": 30.4}])
+
+    assert nodes[0]["attributes"]["d"] == "m0,10l49,0 0,20"
+
+
+class _NumpyStyleScalar:
+    dtype = "float32"
+
+    def __init__(self, value):
+        self._value = value
+
+    def item(self):
+        return self._value
+
+
+def test_point_series_precision_applies_to_numpy_style_scalars():
+    renderer = _renderer({"points": {"items": "data", "as": "p", "x": "p.x", "y": "p.y", "precision": 0}})
+    columns = Columns({"x": [_NumpyStyleScalar(1.4), _NumpyStyleScalar(2.6)], "y": [_NumpyStyleScalar(0.5), 3]})
+
+    assert renderer.translate(columns)[0]["attributes"]["points"] == "1,0 3,3"
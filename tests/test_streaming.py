@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from infogroove import Infogroove
+from infogroove.exceptions import DataValidationError
+from infogroove.streaming import JSONArrayStream
+
+
+def write(tmp_path, text):
+    path = tmp_path / "data.json"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_stream_indexes_elements_and_decodes_on_access(tmp_path):
+    items = [{"label": 'tricky "]}," text', "tags": ["a", {"b": [1]}]}, {"label": "üñí"}, {}]
+    path = write(tmp_path, json.dumps(items, ensure_ascii=False, indent=2))
+
+    with JSONArrayStream(path) as stream:
+        assert len(stream) == 3
+        assert stream[-2] == {"label": "üñí"}
+        assert list(stream) == items
+
+
+def test_stream_finds_the_items_array_inside_an_object(tmp_path):
+    payload = {"meta": {"items": [1, 2]}, "other": [{"x": 1}], "items": [{"value": 4}], "after": True}
+    path = write(tmp_path, json.dumps(payload))
+
+    with JSONArrayStream(path) as stream:
+        assert list(stream) == [{"value": 4}]
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("[1, {}]", "must be an object"),
+        ('[{}, "x"]', "must be an object"),
+        ("[{},]", "must be an object"),
+        ('{"rows": []}', "contain an 'items' array"),
+        ("", "contain an 'items' array"),
+        ('[{"a": 1}', "unterminated array"),
+    ],
+)
+def test_stream_rejects_malformed_inputs(tmp_path, text, message):
+    with pytest.raises(DataValidationError, match=message):
+        JSONArrayStream(write(tmp_path, text))
+
+
+def test_invalid_element_json_is_reported_on_access(tmp_path):
+    stream = JSONArrayStream(write(tmp_path, '[{"a": nope}]'))
+
+    with pytest.raises(DataValidationError, match="item at byte 1"):
+        stream[0]
+    stream.close()
+
+
+def test_renderer_trusts_sequences_that_validated_their_items():
+    class Rows(list):
+        items_validated = True
+
+    renderer = Infogroove(
+        {
+            "properties": {"canvas": {"width": 10, "height": 10}},
+            "template": [{"type": "rect", "repeat": {"items": "data", "as": "row"}}],
+        }
+    )
+
+    with pytest.raises(DataValidationError, match="must be a mapping"):
+        renderer.render([1])
+    assert "<rect" in renderer.render(Rows([{}]))
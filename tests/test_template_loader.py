@@ -5,6 +5,7 @@ import pytest
 
 from infogroove.exceptions import TemplateError
 from infogroove.loader import _parse_template, load, load_path, loads
+from infogroove.models import DownsampleSpec, SimplifySpec, SortKey
 from infogroove.renderer import InfogrooveRenderer
 
 
@@ -157,8 +158,73 @@ def test_parse_template_requires_canvas_dimensions(tmp_path):
             lambda payload: payload["template"][1]["repeat"].update({"let": []}),
             "Repeat 'let' bindings must be declared as a mapping",
         ),
+        (
+            lambda payload: payload["template"][1]["repeat"].update({"limit": -1}),
+            "Repeat 'limit' must be a non-negative integer",
+        ),
+        (
+            lambda payload: payload["template"][1]["repeat"].update({"orderBy": "value upward"}),
+            "must be a path optionally followed by 'asc' or 'desc'",
+        ),
+        (
+            lambda payload: payload["template"][1]["repeat"].update({"where": ""}),
+            "Repeat 'where' must be a non-empty expression string",
+        ),
+        (
+            lambda payload: payload["template"][1]["repeat"].update({"total": 3}),
+            "Repeat 'total' must be a non-empty expression string",
+        ),
+        (
+            lambda payload: payload["template"][1]["repeat"].update({"sortBy": "value"}),
+            "Repeat declarations only accept",
+        ),
+        (
+            lambda payload: payload["template"][0].update({"when": True}),
+            "Element 'when' must be a non-empty expression string",
+        ),
         (lambda payload: payload.update({"styles": {}}), "'styles' is no longer supported"),
         (lambda payload: payload.update({"schema": "oops"}), "'schema' must be declared as a mapping"),
+        (lambda payload: payload.update({"aggregates": []}), "'aggregates' must be declared"),
+        (
+            lambda payload: payload.update({"aggregates": {"top": {"op": "median", "field": "value"}}}),
+            "requires 'op' to be one of",
+        ),
+        (
+            lambda payload: payload.update({"aggregates": {"top": {"op": "max"}}}),
+            "requires a string 'field' path",
+        ),
+        (
+            lambda payload: payload.update({"aggregates": {"p": {"op": "percentile", "field": "value", "q": 120}}}),
+            "'p.q' must be a number",
+        ),
+        (
+            lambda payload: payload.update({"aggregates": {"color": {"op": "count"}}}),
+            "conflicts with a property",
+        ),
+        (
+            lambda payload: payload.update({"aggregates": {"top": {"op": "max", "field": "value", "by": "x"}}}),
+            "only accepts",
+        ),
+        (
+            lambda payload: payload.update({"aggregates": {"maxValue": {"op": "max", "field": "value"}}}),
+            "shadow the built-in context name 'maxValue'",
+        ),
+        (
+            lambda payload: payload.update({"aggregates": {"canvas": {"op": "count"}}}),
+            "shadow the built-in context name 'canvas'",
+        ),
+        (
+            lambda payload: payload.update(
+                {
+                    "aggregates": {
+                        "loop": {"op": "count", "items": "loop"},
+                        "first": {"op": "count", "items": "second.rows"},
+                        "second": {"op": "count", "items": "first"},
+                    }
+                }
+            ),
+            "cycle through 'items' (loop -> loop)",
+        ),
     ],
 )
 def test_parse_template_validation_errors(tmp_path, mutator, message):
@@ -209,3 +275,123 @@ def test_parse_template_rejects_legacy_num_elements_range(tmp_path):
         _parse_template(tmp_path / "def.json", payload)
 
     assert "no longer supported" in str(exc.value)
+
+
+def test_parse_template_reads_aggregates(tmp_path):
+    payload = make_template_payload(
+        aggregates={
+            "peak": {"op": "max", "field": "value"},
+            "quartiles": {"op": "percentile", "field": "value", "q": [25, 75]},
+            "perKind": {"op": "sum", "field": "value", "groupBy": "kind", "items": "data.rows"},
+        }
+    )
+
+    template = _parse_template(tmp_path / "def.json", payload)
+
+    assert template.aggregates["peak"].op == "max"
+    assert template.aggregates["quartiles"].q == (25.0, 75.0)
+    assert template.aggregates["perKind"].group_by == "kind"
+    assert template.aggregates["perKind"].items == "data.rows"
+
+
+def test_parse_template_reads_repeat_selection_clauses(tmp_path):
+    payload = make_template_payload()
+    payload["template"][1]["repeat"].update(
+        {"where": "item.value > 0", "orderBy": ["label", "value DESC"], "limit": 5, "offset": 1, "groupBy": "kind"}
+    )
+
+    repeat = _parse_template(tmp_path / "def.json", payload).template[1].repeat
+
+    assert repeat.where == "item.value > 0"
+    assert repeat.order_by == (SortKey("label"), SortKey("value", descending=True))
+    assert (repeat.limit, repeat.offset, repeat.group_by) == (5, 1, "kind")
+    assert repeat.has_query
+
+
+def test_parse_template_unwraps_placeholder_when_conditions(tmp_path):
+    payload = make_template_payload()
+    payload["template"][0]["when"] = " {color != 'none'} "
+    payload["template"][1]["when"] = "item.value > 0"
+
+    template = _parse_template(tmp_path / "def.json", payload)
+
+    assert template.template[0].when == "color != 'none'"
+    assert template.template[1].when == "item.value > 0"
+
+
+def test_parse_template_reads_point_collection_attributes(tmp_path):
+    payload = make_template_payload()
+    payload["template"].append(
+        {
+            "type": "polyline",
+            "attributes": {"stroke": "#000", "points": {"items": "data", "as": "p", "x": "{p.x}", "y": "p.y * 2"}},
+        }
+    )
+
+    element = _parse_template(tmp_path / "def.json", payload).template[-1]
+
+    assert element.attributes == {"stroke": "#000"}
+    series = element.series["points"]
+    assert (series.items, series.alias, series.x, series.y, series.precision) == ("data", "p", "p.x", "p.y * 2", 2)
+
+
+@pytest.mark.parametrize(
+    ("attribute", "block", "message"),
+    [
+        ("fill", {"items": "data", "as": "p", "x": "p.x", "y": "p.y"}, "only 'points' and 'd'"),
+        ("d", {"items": "data", "as": "p", "x": "p.x"}, "require an expression for 'y'"),
+        ("points", {"items": "data", "as": "p", "x": "p.x", "y": "p.y", "step": 2}, "only accept"),
+        ("points", {"items": "data", "as": "p", "x": "p.x", "y": "p.y", "precision": -1}, "precision"),
+    ],
+)
+def test_parse_template_rejects_invalid_point_collections(tmp_path, attribute, block, message):
+    payload = make_template_payload()
+    payload["template"].append({"type": "path", "attributes": {attribute: block}})
+
+    with pytest.raises(TemplateError) as exc:
+        _parse_template(tmp_path / "def.json", payload)
+
+    assert message in str(exc.value)
+
+
+def test_parse_template_reads_downsample_declarations(tmp_path):
+    payload = make_template_payload()
+    payload["template"][1]["repeat"]["downsample"] = {"method": "minmax", "target": 300, "y": "value"}
+    payload["template"].append(
+        {
+            "type": "polyline",
+            "attributes": {"points": {"items": "data", "as": "p", "x": "p.x", "y": "p.y", "downsample": "lttb"}},
+        }
+    )
+
+    template = _parse_template(tmp_path / "def.json", payload)
+
+    assert template.template[1].repeat.downsample == DownsampleSpec(method="minmax", target=300, y="value")
+    assert template.template[-1].series["points"].downsample == DownsampleSpec(method="lttb")
+
+    payload["template"][1]["repeat"]["downsample"] = {"method": "every-other"}
+    with pytest.raises(TemplateError) as exc:
+        _parse_template(tmp_path / "def.json", payload)
+    assert "method must be one of" in str(exc.value)
+
+
+def test_parse_template_reads_simplify_declarations(tmp_path):
+    payload = make_template_payload()
+    payload["template"].append(
+        {
+            "type": "path",
+            "attributes": {"d": {"items": "data", "as": "p", "x": "p.x", "y": "p.y", "simplify": 1.5}},
+        }
+    )
+
+    series = _parse_template(tmp_path / "def.json", payload).template[-1].series["d"]
+
+    assert series.simplify == SimplifySpec(tolerance=1.5)
+
+    payload["template"][-1] = {
+        "type": "polyline",
+        "attributes": {"points": {"items": "data", "as": "p", "x": "p.x", "y": "p.y", "simplify": {"relative": True}}},
+    }
+    with pytest.raises(TemplateError) as exc:
+        _parse_template(tmp_path / "def.json", payload)
+    assert "relative commands only apply" in str(exc.value)
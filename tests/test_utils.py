@@ -7,6 +7,7 @@ import pytest
 from infogroove.exceptions import FormulaEvaluationError
 from infogroove.utils import (
     MappingAdapter,
+    NumberFormat,
     PLACEHOLDER_PATTERN,
     SequenceAdapter,
     default_eval_locals,
@@ -167,3 +168,31 @@ def test_random_seed_provides_deterministic_sequence():
     rng = random.Random(7)
     assert first == rng.random()
     assert second == rng.random()
+
+
+@pytest.mark.parametrize(
+    "policy, value, expected",
+    [
+        (NumberFormat(decimals=2), 888.5390606993443, "888.54"),
+        (NumberFormat(decimals=2), 12.5, "12.5"),
+        (NumberFormat(decimals=2), 3.0, "3"),
+        (NumberFormat(decimals=2), -0.001, "0"),
+        (NumberFormat(decimals=2, trim=False), 3.0, "3.00"),
+        (NumberFormat(significant=4), 0.000123456, "0.0001235"),
+        (NumberFormat(significant=4), 888.5390606993443, "888.5"),
+        (NumberFormat(decimals=1), 7, "7"),
+        (NumberFormat(decimals=1), True, "True"),
+        (NumberFormat(decimals=1), math.inf, "inf"),
+        (NumberFormat(), 0.1 + 0.2, "0.30000000000000004"),
+    ],
+)
+def test_number_format_policies(policy, value, expected):
+    assert policy.formatter()(value) == expected
+
+
+def test_fill_placeholders_applies_the_number_formatter():
+    format_value = NumberFormat(decimals=1).formatter()
+
+    result = fill_placeholders("{a / 3},{b}", {"a": 1, "b": 2}, format_value=format_value)
+
+    assert result == "0.3,2"